@@ -0,0 +1,90 @@
+# app_core.py
+# -------------------------------------------------------------
+# 단일 앱 코어 – 페이지 라우팅 + 프로세스 전역 자원
+# -------------------------------------------------------------
+# 진입점(app.py / app_main.py)은 run() 만 호출합니다. 두 흐름은 views/ 의 페이지입니다.
+#   views/years.py       사주 → MBTI 후보 → 연도별 경험 수집
+#   views/mbti_v3.py     MBTI × 오행 궁합 (단계형 v3)
+#   views/admin_stats.py 관리자 통계 (사전 집계) + 재실행 구간 계측
+# 페이지 스크립트는 Streamlit 이 프로세스당 한 번 컴파일해 재사용하고,
+# 아래 자원(엔진 캐시 예열·이벤트 로그·제출 큐·통계 집계)은 모든 페이지·세션이 한 인스턴스를 공유합니다.
+# 재실행 계측(telemetry.timed)은 secrets 의 [metrics] enabled = true 또는 SAJU_METRICS=1 일 때만 켜지고,
+# [metrics] port 를 주면 그 포트에서 Prometheus 텍스트(GET /metrics)를 냅니다.
+# 샘플링 프로파일러(telemetry.PROFILER)는 관리자 페이지에서 걸면 다음 N번의 재실행만 캡처합니다 (재시작 불필요).
+# -------------------------------------------------------------
+
+import os
+from pathlib import Path
+from typing import Any, Dict
+
+import streamlit as st
+
+from saju_engine import warm_hypotheses_cache
+from storage import AnalyticsStore, Journal, RollupStore, SubmissionQueue, backend_from_config
+from telemetry import PROFILER, enable as enable_metrics, serve_prometheus, timed
+
+VIEWS = Path(__file__).resolve().parent / "views"
+
+
+def secrets_section(name: str) -> Dict[str, Any]:
+    """secrets.toml 의 [name] 섹션 (파일이 없으면 빈 dict)"""
+    try:
+        return dict(st.secrets.get(name, {}))
+    except FileNotFoundError:
+        return {}
+
+
+@st.cache_resource
+def warm_engine() -> int:
+    # 서버 프로세스당 1회: 흔한 출생연도 × 오행 × 연도 가설 캐시 예열 (모든 세션이 공유)
+    return warm_hypotheses_cache()
+
+
+@st.cache_resource
+def get_journal() -> Journal:
+    # 응답 이벤트 로그(append-only JSONL): 서버 시작 시, 그리고 이후 주기적으로(기본 60초, 세그먼트 봉인 시 즉시)
+    # 세그먼트를 사용자별 스냅샷으로 압축하면서 분석용 Parquet(var/analytics)에도 증분 적재
+    # – pyarrow import·쓰기가 첫 화면을 막지 않도록 백그라운드 스레드에서
+    journal = Journal()
+    interval = float(secrets_section("journal").get("compact_interval", 60))
+    journal.start_compactor(interval, on_segment=AnalyticsStore().ingest)
+    return journal
+
+
+@st.cache_resource
+def get_rollups() -> RollupStore:
+    return RollupStore()
+
+
+@st.cache_resource
+def get_submission_queue() -> SubmissionQueue:
+    # 제출 큐 (백그라운드 워커가 배치 기록, secrets 의 [storage] 가 없으면 로컬 SQLite)
+    # 기록된 배치마다 관리자 통계 집계를 증분 갱신
+    return SubmissionQueue(backend_from_config(secrets_section("storage")), on_written=get_rollups().add_batch)
+
+
+@st.cache_resource
+def get_metrics() -> Dict[str, Any]:
+    # 프로세스당 1회: 구간 계측을 켤지 정하고, 포트가 있으면 /metrics HTTP 스레드 시작
+    cfg = secrets_section("metrics")
+    on = bool(cfg.get("enabled")) or os.environ.get("SAJU_METRICS") == "1"
+    enable_metrics(on)
+    if on and cfg.get("port"):
+        serve_prometheus(int(cfg["port"]), cfg.get("host", "127.0.0.1"))
+    return {**cfg, "enabled": on}
+
+
+def run() -> None:
+    # icon=/page_icon= 은 쓰지 않음: 이모지 검증이 streamlit.emojis(콜드 스타트 ~80ms)를 import 함
+    st.set_page_config(page_title="사주 × MBTI", layout="wide")
+    pages = [
+        st.Page(VIEWS / "years.py", title="🗂️ 연도별 경험 수집", default=True),
+        st.Page(VIEWS / "mbti_v3.py", title="🌏 MBTI × 오행 궁합", url_path="mbti"),
+        st.Page(VIEWS / "admin_stats.py", title="📊 관리자 통계", url_path="admin"),
+    ]
+    get_metrics()
+    page = st.navigation(pages)
+    name = page.url_path or "years"  # 기본 페이지의 url_path 는 ""
+    # 관리자가 프로파일러를 걸어 두었으면 이 재실행의 스택을 샘플링 (아니면 둘 다 no-op 에 가까움)
+    with timed(f"page.{name}"), PROFILER.rerun(name):
+        page.run()
@@ -0,0 +1,41 @@
+# bench/apptest_compat.py
+# -------------------------------------------------------------
+# AppTest 로 st.navigation 앱을 돌리는 벤치마크 스크립트 공용 보정 (suite / load_sessions / importtime)
+# -------------------------------------------------------------
+# Streamlit 1.38 의 AppTest 는 PagesManager 에 스크립트 캐시를 주지 않아 st.Page 파일을
+# 빈 코드로 실행합니다 → 캐시가 없을 때만 서버처럼 파일을 컴파일해 돌려주도록 감쌉니다.
+# 비공개 API 라 확인된 버전(1.38.x)에서만, 그리고 import 가 아니라 호출할 때만 적용합니다.
+# -------------------------------------------------------------
+
+import logging
+from typing import Any
+
+PATCHED_VERSIONS = ((1, 38),)
+
+
+def patch_apptest_pages() -> bool:
+    """필요한 버전이면 PagesManager 를 보정하고 True (여러 번 불러도 한 번만 감쌈)"""
+    import streamlit
+    from streamlit.runtime.pages_manager import PagesManager
+
+    if tuple(int(x) for x in streamlit.__version__.split(".")[:2]) not in PATCHED_VERSIONS:
+        return False
+    original = PagesManager.get_page_script_byte_code
+    if getattr(original, "_compiles_without_cache", False):
+        return True
+
+    def get_page_script_byte_code(self: Any, script_path: str) -> Any:
+        if self._script_cache is None:  # AppTest – 서버는 캐시가 있어 원래 경로
+            with open(script_path, encoding="utf-8") as f:
+                return compile(f.read(), script_path, "exec")
+        return original(self, script_path)
+
+    get_page_script_byte_code._compiles_without_cache = True  # type: ignore[attr-defined]
+    PagesManager.get_page_script_byte_code = get_page_script_byte_code
+    return True
+
+
+def quiet_missing_script_run_context() -> None:
+    """AppTest 는 세션 스레드 밖에서 돌아 재실행마다 'missing ScriptRunContext' 경고가 찍힘 → 끔
+    (streamlit 이 설정을 읽을 때 로그 레벨을 다시 맞추므로 레벨 대신 필터로)"""
+    logging.getLogger("streamlit.runtime.scriptrunner_utils.script_run_context").addFilter(lambda r: False)
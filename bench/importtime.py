@@ -0,0 +1,125 @@
+# bench/importtime.py
+# -------------------------------------------------------------
+# 콜드 스타트 벤치마크 – 새 파이썬 프로세스에서 앱 첫 화면(첫 스크립트 실행)까지의 시간과
+# 그동안 새로 import 된 모듈을 `-X importtime` 으로 측정하고 예산(importtime_budget.json)과 비교
+#
+#   python bench/importtime.py            # 예산 초과·금지 모듈 import 시 종료 코드 1
+#   python bench/importtime.py --top 15   # import 시간 상위 모듈 더 보기
+#   python bench/importtime.py --json     # 결과를 JSON 으로
+#
+# Streamlit 서버는 스크립트 실행 전에 이미 streamlit 을 import 해 두므로, 자식 프로세스도
+# AppTest(=streamlit) 를 먼저 import 한 뒤 표시(marker)를 찍고 그 이후만 집계합니다.
+# 각 앱은 --repeat 번 실행해 최솟값을 씁니다 (디스크 캐시가 데워진 '잠에서 깬' 서버에 가까움).
+# 예산 항목: {"app": 진입점, "page": st.navigation url_path(생략 시 기본 페이지), 예산들}
+# -------------------------------------------------------------
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+BUDGET_FILE = Path(__file__).with_name("importtime_budget.json")
+MARKER = "@@first-paint"
+
+_CHILD = f"""
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+from streamlit.util import calc_md5
+from bench.apptest_compat import patch_apptest_pages
+patch_apptest_pages()
+before = set(sys.modules)
+sys.stderr.write("{MARKER}\\n"); sys.stderr.flush()
+t0 = time.perf_counter()
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+if sys.argv[2]:
+    at._page_hash = calc_md5(sys.argv[2])  # st.navigation 페이지 해시 = md5(url_path)
+at.run()
+elapsed = time.perf_counter() - t0
+print(json.dumps({{"first_paint_ms": elapsed * 1000, "modules": sorted(set(sys.modules) - before),
+                  "exceptions": [e.value for e in at.exception]}}))
+"""
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """marker 이후의 최상위 import → [(모듈, 누적 µs)]"""
+    tops = []
+    seen = False
+    for line in stderr.splitlines():
+        if line == MARKER:
+            seen = True
+            continue
+        if not seen or not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cum, name = line[len("import time:"):].split("|", 2)
+        name = name[1:]  # 구분자 뒤 공백 한 칸, 그 뒤 들여쓰기 = 중첩 깊이
+        if not name.startswith(" "):  # 최상위 import 만 (하위 import 는 누적값에 이미 포함)
+            tops.append((name.strip(), int(cum)))
+    return tops
+
+
+def measure(app: str, page: str = "") -> Dict[str, Any]:
+    env = dict(os.environ, PYTHONPATH=str(ROOT) + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    with tempfile.TemporaryDirectory() as cwd:  # var/ 등 실행 부산물은 임시 디렉터리에
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", _CHILD, str(ROOT / app), page or ""],
+                              cwd=cwd, env=env, capture_output=True, text=True, timeout=300)
+    if proc.returncode:
+        raise RuntimeError(f"{app}: child failed\n{proc.stderr[-2000:]}")
+    out = json.loads(proc.stdout.strip().splitlines()[-1])
+    tops = _parse_importtime(proc.stderr)
+    out["import_ms"] = sum(us for _, us in tops) / 1000
+    out["top_imports"] = sorted(tops, key=lambda t: -t[1])
+    return out
+
+
+def check(app: str, result: Dict[str, Any], budget: Dict[str, Any]) -> List[str]:
+    problems = []
+    for key in ("first_paint_ms", "import_ms"):
+        if key in budget and result[key] > budget[key]:
+            problems.append(f"{app}: {key} {result[key]:.0f} > budget {budget[key]}")
+    roots = {m.split(".")[0] for m in result["modules"]}
+    for mod in budget.get("forbidden", []):
+        if mod in roots:
+            problems.append(f"{app}: '{mod}' imported before first paint")
+    if result["exceptions"]:
+        problems.append(f"{app}: first run raised {result['exceptions']}")
+    return problems
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="앱 콜드 스타트(import 시간·첫 화면) 벤치마크")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--top", type=int, default=8)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    budgets = json.loads(BUDGET_FILE.read_text(encoding="utf-8"))
+    results, problems = {}, []
+    for app, budget in budgets.items():
+        runs = [measure(budget["app"], budget.get("page")) for _ in range(args.repeat)]
+        best = min(runs, key=lambda r: r["first_paint_ms"])
+        best["import_ms"] = min(r["import_ms"] for r in runs)
+        results[app] = best
+        problems += check(app, best, budget)
+
+    if args.json:
+        print(json.dumps({app: {k: r[k] for k in ("first_paint_ms", "import_ms", "top_imports")}
+                          for app, r in results.items()}, ensure_ascii=False, indent=2))
+    else:
+        for app, r in results.items():
+            b = budgets[app]
+            print(f"{app}\n  first paint {r['first_paint_ms']:7.0f} ms (budget {b.get('first_paint_ms')})"
+                  f"   imports {r['import_ms']:6.0f} ms (budget {b.get('import_ms')})")
+            for name, us in r["top_imports"][:args.top]:
+                print(f"    {us / 1000:8.1f} ms  {name}")
+    if problems:
+        print("\n".join(["", "OVER BUDGET:"] + problems), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+# bench/load_sessions.py
+# -------------------------------------------------------------
+# 동시 세션 부하 시험 – 한 프로세스(= Streamlit 서버 하나)에 AppTest 세션 N 개를 동시에 띄워
+# 사람처럼 단계·연도 라디오를 눌러 가며 재실행 지연·처리량·세션당 메모리를 잼
+#
+#   python bench/load_sessions.py -n 20 --flow mix --duration 30
+#   python bench/load_sessions.py -n 50 --flow years --rate 2 --immediate --json
+#
+# --flow years : app.py 기본 페이지 – 프로필 입력 → 적용 → 연도 라디오 응답(구간 제출) · 구간 전환
+#        v3    : app.py /mbti – MBTI 선택 → 생년월일 → 사건 입력·수정 → 완료 → 최종 제출,
+#                끝나면 같은 자리에 새 방문자 세션 (AppTest 는 리셋 버튼의 상태 전체 삭제 + st.rerun 을
+#                따라가지 못해 '처음부터 다시' 대신 새 세션으로 반복)
+#        mix   : 세션을 번갈아 두 흐름에 배정
+# --rate R     : 세션당 초당 동작 수 (동작 사이 간격은 평균 1/R 초의 지수 분포, 0 이면 쉬지 않음)
+# --immediate  : 연도 흐름에서 구간 일괄 제출을 끄고 라디오 하나마다 재실행
+#
+# 세션은 --ramp 초에 걸쳐 나눠 시작하고 끝까지 살려 둡니다 (세션 상태가 메모리에 남은 채로 측정).
+# 세션마다 스레드 하나가 사람 역할을 하지만, AppTest.run() 은 프로세스 전역(Runtime 인스턴스·설정)을
+# 바꿔 끼우므로 동시에 둘을 돌릴 수 없어 잠금 하나로 줄을 세웁니다. 그래서 지연 = 대기 + 실행이고
+# (wait_ms / run_ms 로 따로도 보고), 한 코어·한 GIL 에서 도는 서버가 재실행을 처리할 수 있는 상한을
+# 넘기면 대기 시간이 늘어나는 모습으로 드러납니다. RSS 는 예열 세션 이후를 기준으로 잽니다.
+# 이벤트 로그·제출 큐의 부산물(var/)은 임시 디렉터리에 씁니다.
+# -------------------------------------------------------------
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+from streamlit.util import calc_md5  # noqa: E402
+
+from bench.apptest_compat import patch_apptest_pages, quiet_missing_script_run_context  # noqa: E402
+from saju_engine import MBTI_LIST  # noqa: E402
+
+APP = ROOT / "app.py"
+PAGES = {"years": "", "v3": "mbti"}  # 흐름 → st.navigation url_path
+ANSWERS = ("맞다", "틀리다", "모름/패스")
+
+
+def rss_kib() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS"):
+                return int(line.split()[1])
+    return 0
+
+
+def _button(at: AppTest, label: str):
+    return next(b for b in at.button if label in b.label)
+
+
+def _set_number(at: AppTest, label: str, value: int) -> None:
+    next(w for w in at.sidebar.number_input if w.label == label).set_value(value)
+
+
+# ---- 시나리오: 재실행을 일으킬 조작을 해 두고 동작 이름을 yield → 드라이버가 at.run() 을 잼 ----
+def years_steps(at: AppTest, rng: random.Random, args: argparse.Namespace) -> Iterator[str]:
+    yield "open"
+    by = rng.randint(1960, 2005)
+    start = by + rng.randint(10, 20)
+    # 시작/종료 연도 입력의 min_value 가 앞 입력에 묶여 있어(위젯 id 가 바뀜) 하나씩 적용
+    for label, value in (("출생 연도", by), ("경험 수집 시작 연도", start),
+                         ("경험 수집 종료 연도", min(start + args.span - 1, 2100))):
+        _set_number(at, label, value)
+        yield "input"
+    _button(at, "프로필").click()
+    yield "apply"
+    if args.immediate:
+        at.toggle(key="batch_mode").set_value(False)
+        yield "mode"
+    while True:
+        pages = [r for r in at.radio if r.key == "year_page"]
+        if pages and rng.random() < args.page_switch:
+            pages[0].set_value(rng.randrange(len(pages[0].options)))
+            yield "page"
+            continue
+        cells = [r for r in at.radio if r.key and r.key[:4].isdigit()]
+        if args.immediate:
+            rng.choice(cells).set_value(rng.choice(ANSWERS))
+            yield "answer"
+        else:
+            for r in rng.sample(cells, min(args.answers_per_submit, len(cells))):
+                r.set_value(rng.choice(ANSWERS))
+            _button(at, "이 구간 제출").click()
+            yield "submit"
+
+
+def v3_steps(at: AppTest, rng: random.Random, args: argparse.Namespace) -> Iterator[str]:
+    yield "open"
+    at.button(key=f"mbti_{rng.choice(MBTI_LIST)}").click()
+    yield "mbti"
+    for label, action in (("생년월일 추가", "birth"), ("확인", "confirm"), ("이벤트 추가", "events")):
+        _button(at, label).click()
+        yield action
+    for i in range(rng.randint(1, 3)):
+        box = at.selectbox(key=f"event_{i}")
+        box.select_index(rng.randrange(len(box.options)))
+        yield "event"
+    _button(at, "완료 및 제출").click()
+    yield "report"
+    _button(at, "최종 제출").click()
+    yield "submit"
+
+
+SCENARIOS = {"years": years_steps, "v3": v3_steps}
+
+
+# ---- 실행 ----
+RUN_LOCK = threading.Lock()  # AppTest.run() 은 한 번에 하나만 (위 설명)
+
+
+class Recorder:
+    def __init__(self) -> None:
+        # (흐름, 동작, 요청 시각, 대기 ms, 실행 ms)
+        self.samples: List[Tuple[str, str, float, float, float]] = []
+        self.errors: List[str] = []
+        self.completed = 0  # 끝까지 마친 시나리오 수 (v3 = 제출 완료)
+        self._lock = threading.Lock()
+
+    def add(self, flow: str, action: str, t0: float, wait_ms: float, run_ms: float) -> None:
+        with self._lock:
+            self.samples.append((flow, action, t0, wait_ms, run_ms))
+
+    def error(self, msg: str) -> None:
+        with self._lock:
+            self.errors.append(msg)
+
+
+def new_session(flow: str, timeout: float) -> AppTest:
+    at = AppTest.from_file(str(APP), default_timeout=timeout)
+    if PAGES[flow]:
+        at._page_hash = calc_md5(PAGES[flow])  # st.navigation 페이지 해시 = md5(url_path)
+    return at
+
+
+def drive(flow: str, slot: List[AppTest], i: int, rng: random.Random, args: argparse.Namespace,
+          deadline: float, rec: Optional[Recorder], max_steps: Optional[int] = None) -> None:
+    """slot[i] 세션으로 시나리오를 deadline(또는 max_steps)까지 진행. 지연은 rec 에 기록.
+    시나리오가 끝나면 다음 방문자 세션으로 바꿔 계속 (살아 있는 세션 수는 그대로)"""
+    visit = 0
+    while _drive_one(flow, slot[i], rng, args, deadline, rec, visit, max_steps):
+        visit += 1
+        if rec is not None:
+            rec.completed += 1
+        slot[i] = new_session(flow, args.timeout)
+
+
+def _drive_one(flow: str, at: AppTest, rng: random.Random, args: argparse.Namespace, deadline: float,
+               rec: Optional[Recorder], visit: int, max_steps: Optional[int]) -> bool:
+    """시나리오 하나를 끝까지 돌렸으면 True (시간·단계 제한이나 오류로 멈췄으면 False)"""
+    for n, action in enumerate(SCENARIOS[flow](at, rng, args)):
+        if max_steps is not None and n >= max_steps:
+            return False
+        if (n or visit) and args.rate > 0:
+            time.sleep(rng.expovariate(args.rate))
+        if time.perf_counter() >= deadline:
+            return False
+        t0 = time.perf_counter()
+        try:
+            with RUN_LOCK:
+                t1 = time.perf_counter()
+                at.run()
+                t2 = time.perf_counter()
+        except Exception as e:  # 타임아웃 등 – 이 세션만 멈춤
+            if rec is not None:
+                rec.error(f"{flow}/{action}: {type(e).__name__}: {e}")
+            return False
+        if at.exception:
+            if rec is not None:
+                rec.error(f"{flow}/{action}: {at.exception[0].value}")
+            return False
+        if rec is not None:
+            rec.add(flow, action, t0, (t1 - t0) * 1000, (t2 - t1) * 1000)
+    return True
+
+
+def _pct(sorted_vals: List[float], q: float) -> float:
+    return sorted_vals[min(len(sorted_vals) - 1, int(q * len(sorted_vals)))] if sorted_vals else 0.0
+
+
+def latency_summary(values: List[float]) -> Dict[str, Any]:
+    v = sorted(values)
+    return {"n": len(v), "p50": round(_pct(v, 0.50), 1), "p95": round(_pct(v, 0.95), 1),
+            "p99": round(_pct(v, 0.99), 1), "max": round(v[-1], 1) if v else 0.0,
+            "mean": round(statistics.fmean(v), 1) if v else 0.0}
+
+
+def run_load(args: argparse.Namespace) -> Dict[str, Any]:
+    flows = ["years", "v3"] if args.flow == "mix" else [args.flow]
+    # 예열: 흐름마다 한 세션을 몇 단계 돌려 import·프로세스 캐시를 채운 뒤 RSS 기준을 잼
+    for flow in flows:
+        drive(flow, [new_session(flow, args.timeout)], 0, random.Random(-1), args, float("inf"), None, max_steps=8)
+    rss0 = rss_kib()
+
+    rec = Recorder()
+    sessions: List[AppTest] = []
+    rss_peak = rss0
+    stop = threading.Event()
+
+    def sample_rss() -> None:
+        nonlocal rss_peak
+        while not stop.wait(0.2):
+            rss_peak = max(rss_peak, rss_kib())
+
+    threading.Thread(target=sample_rss, daemon=True).start()
+    t_start = time.perf_counter()
+    deadline = t_start + args.ramp + args.duration
+    threads = []
+    for i in range(args.n):
+        flow = flows[i % len(flows)]
+        sessions.append(new_session(flow, args.timeout))
+        rng = random.Random(args.seed * 100_003 + i)
+        t = threading.Thread(target=drive, args=(flow, sessions, i, rng, args, deadline, rec), name=f"session-{i}")
+        t.start()
+        threads.append(t)
+        if args.ramp > 0:
+            time.sleep(args.ramp / args.n)
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t_start
+    stop.set()
+    rss_end = rss_kib()
+    rss_peak = max(rss_peak, rss_end)
+
+    # 처리량은 모든 세션이 뜬 뒤(램프 이후) 구간만
+    steady = [s for s in rec.samples if s[2] >= t_start + args.ramp]
+    steady_s = max(1e-9, elapsed - args.ramp)
+    by_flow: Dict[str, List[float]] = defaultdict(list)
+    by_action: Dict[str, List[float]] = defaultdict(list)
+    for flow, action, _, wait, run in rec.samples:
+        by_flow[flow].append(wait + run)
+        by_action[f"{flow}/{action}"].append(wait + run)
+    return {
+        "config": {k: getattr(args, k) for k in ("flow", "n", "duration", "ramp", "rate", "span", "immediate",
+                                                 "answers_per_submit", "page_switch", "seed")},
+        "elapsed_s": round(elapsed, 2),
+        "reruns": len(rec.samples),
+        "completed": rec.completed,
+        "throughput_rps": round(len(steady) / steady_s, 2),
+        "latency_ms": latency_summary([s[3] + s[4] for s in rec.samples]),
+        "wait_ms": latency_summary([s[3] for s in rec.samples]),
+        "run_ms": latency_summary([s[4] for s in rec.samples]),
+        "busy": round(sum(s[4] for s in steady) / 1000 / steady_s, 3),  # 재실행이 차지한 시간 비율 (1 = 포화)
+        "by_flow": {f: latency_summary(v) for f, v in sorted(by_flow.items())},
+        "by_action": {a: latency_summary(v) for a, v in sorted(by_action.items())},
+        "rss_kib": {"base": rss0, "end": rss_end, "peak": rss_peak,
+                    "per_session": round((rss_end - rss0) / max(1, args.n), 1)},
+        "errors": rec.errors[:20], "n_errors": len(rec.errors),
+        "alive_sessions": len(sessions),
+    }
+
+
+def _print(result: Dict[str, Any]) -> None:
+    c, lat, rss = result["config"], result["latency_ms"], result["rss_kib"]
+    print(f"{c['n']} sessions ({c['flow']}, rate {c['rate']}/s, {c['duration']}s + ramp {c['ramp']}s)"
+          f"  {result['reruns']} reruns, {result['throughput_rps']} reruns/s, {result['completed']} completed")
+    print(f"  rerun ms  p50 {lat['p50']}  p95 {lat['p95']}  p99 {lat['p99']}  max {lat['max']}"
+          f"   (queue wait p50 {result['wait_ms']['p50']} / p99 {result['wait_ms']['p99']},"
+          f" run p50 {result['run_ms']['p50']}, busy {result['busy']:.0%})")
+    for name, s in result["by_action"].items():
+        print(f"    {name:18s} n={s['n']:<5d} p50 {s['p50']:7.1f}  p95 {s['p95']:7.1f}  p99 {s['p99']:7.1f}")
+    print(f"  RSS KiB  base {rss['base']}  end {rss['end']}  peak {rss['peak']}  per session {rss['per_session']}")
+    if result["n_errors"]:
+        print(f"  {result['n_errors']} session errors, e.g. {result['errors'][0]}", file=sys.stderr)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="동시 세션 부하 시험 (AppTest)")
+    ap.add_argument("-n", type=int, default=10, help="동시 세션 수")
+    ap.add_argument("--flow", choices=[*SCENARIOS, "mix"], default="mix")
+    ap.add_argument("--duration", type=float, default=30.0, help="모든 세션이 뜬 뒤 측정 시간 (초)")
+    ap.add_argument("--ramp", type=float, default=2.0, help="세션을 나눠 시작하는 시간 (초)")
+    ap.add_argument("--rate", type=float, default=1.0, help="세션당 초당 동작 수 (0 = 쉬지 않음)")
+    ap.add_argument("--span", type=int, default=20, help="연도 흐름: 경험 수집 연도 수")
+    ap.add_argument("--immediate", action="store_true", help="연도 흐름: 라디오 하나마다 재실행 (일괄 제출 끔)")
+    ap.add_argument("--answers-per-submit", type=int, default=5, help="연도 흐름: 구간 제출 한 번에 고를 응답 수")
+    ap.add_argument("--page-switch", type=float, default=0.2, help="연도 흐름: 동작이 구간 전환일 확률")
+    ap.add_argument("--timeout", type=float, default=120.0, help="재실행 한 번의 제한 시간 (초)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--json", action="store_true", help="결과를 JSON 으로")
+    args = ap.parse_args()
+
+    patch_apptest_pages()
+    quiet_missing_script_run_context()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            result = run_load(args)
+        finally:
+            os.chdir(cwd)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        _print(result)
+    if result["n_errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
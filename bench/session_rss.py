@@ -0,0 +1,62 @@
+# bench/session_rss.py
+# -------------------------------------------------------------
+# 세션당 메모리 측정 – 한 프로세스에서 v3 흐름 세션을 N 개 띄워 두고 RSS/tracemalloc 증가분을 나눔
+#   python bench/session_rss.py [APP] [-n 20]
+# 첫 세션은 예열(import·프로세스 캐시)로 빼고 잽니다. 세션 객체는 끝까지 살려 둬 세션 상태가 포함되게 합니다.
+# -------------------------------------------------------------
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+DEFAULT_APP = ROOT / "views" / "mbti_v3.py"
+
+
+def rss_kib() -> int:
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS"):
+                return int(line.split()[1])
+    return 0
+
+
+def v3_session(path: str) -> AppTest:
+    # MBTI 선택 → 생년월일 → 사건 입력 화면까지 (스토리·테이블 조회가 모두 일어나는 구간)
+    at = AppTest.from_file(path, default_timeout=60)
+    at.run()
+    at.button(key="mbti_INTP").click().run()
+    for label in ("생년월일 추가", "확인", "이벤트 추가"):
+        next(b for b in at.button if label in b.label).click().run()
+    return at
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="세션당 RSS / 파이썬 할당 측정")
+    ap.add_argument("app", nargs="?", default=str(DEFAULT_APP))
+    ap.add_argument("-n", type=int, default=20, help="측정할 세션 수")
+    args = ap.parse_args()
+
+    sessions = [v3_session(args.app)]  # 예열
+    gc.collect()
+    rss0 = rss_kib()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    for _ in range(args.n):
+        sessions.append(v3_session(args.app))
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    traced = tracemalloc.get_traced_memory()[0]
+    print(f"sessions={args.n} rss/session={(rss_kib() - rss0) / args.n:.1f}KiB "
+          f"traced/session={traced / args.n / 1024:.1f}KiB time/session={elapsed / args.n * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+# bench/suite.py
+# -------------------------------------------------------------
+# 성능 벤치마크 모음 – 엔진 함수별 호출 시간·메모리 할당 + AppTest 로 재실행(rerun) 지연
+# -------------------------------------------------------------
+#   python bench/suite.py                       # 전부 실행 → bench/results.json
+#   python bench/suite.py --only engine         # 엔진·내보내기만 (streamlit 불필요)
+#   python bench/suite.py --compare             # bench/baseline.json 과 비교, 회귀 시 종료 코드 1
+#   python bench/suite.py --save-baseline       # 이번 결과를 기준선으로 저장
+#
+# engine.* / export.* : 호출 1회당 시간(ns, repeat 회 중 최솟값·중앙값)과
+#                       tracemalloc 기준 할당 (호출 1회 최대 사용 바이트 peak_b, 남는 바이트 retained_b)
+# app.rerun.<N>y     : app.py(기본 페이지 = 연도별 경험 수집)를 AppTest 로 돌려 N년 구간(10/50/200)에서
+#                       프로필 적용·단순 재실행·연도 구간 전환의 지연(ms). 응답 밀도(--density)만큼
+#                       가설 칸에 맞다/틀리다를 미리 채워 응답 요약표(6-4)까지 실제 크기로 그림
+# 비교(엔진 min, 앱 median): 기준선보다 --threshold(기본 25%) 이상 느리고 절대 차이도 최소폭 이상이면 회귀
+# 기계마다 절대 시간이 달라 비교는 보정 루프(calibrate: 고정된 순수 파이썬 작업) 대비 비율(rel)로 합니다.
+# 그래서 기준선은 다른 호스트·CI 에서도 쓸 수 있지만, 파이썬 버전이 다르면 비율도 달라지므로 경고합니다.
+# -------------------------------------------------------------
+
+import argparse
+import gc
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from saju_engine import (  # noqa: E402
+    ELEM_LIST, HYPOTHESES_CACHE, deterministic_topics, elem_weights_for_year, ganzhi_of_year,
+    infer_mbti_from_elements, saju_year_summary, year_hypotheses,
+)
+from saju_engine.core import _apply_event_update, _type_prob_from_axis, _type_prob_from_vec  # noqa: E402
+from bench.apptest_compat import patch_apptest_pages, quiet_missing_script_run_context  # noqa: E402
+from storage import iter_csv  # noqa: E402
+
+RESULTS_FILE = Path(__file__).with_name("results.json")
+BASELINE_FILE = Path(__file__).with_name("baseline.json")
+RANGES = (10, 50, 200)
+BIRTH_YEAR = 1900  # 200년 구간(1900–2099)이 입력 범위(≤2100) 안에 들어가도록
+ANSWERS = ("맞다", "틀리다")
+# 회귀로 보지 않는 최소 절대 차이 (타이머·스케줄링 잡음)
+MIN_DELTA = {"ns": 200, "ms": 2.0}
+# 비교 지표: 엔진은 반복 중 최솟값(잡음에 가장 덜 흔들림), 앱 재실행은 중앙값
+COMPARE_KEY = {"ns": "min", "ms": "median"}
+UNIT_NS = {"ns": 1, "ms": 1_000_000}
+
+
+# ---- 입력 데이터 (결정적) ----
+def experience_db(birth_year: int, elem: str, start: int, end: int, density: float) -> Dict[int, Dict[str, Dict[str, str]]]:
+    """start~end 의 가설 칸 중 density 비율만큼 맞다/틀리다를 채운 experience_db"""
+    db: Dict[int, Dict[str, Dict[str, str]]] = {}
+    step = max(1, round(1 / density)) if density > 0 else 0
+    i = 0
+    for y in range(start, end + 1):
+        for cat, _ in year_hypotheses(birth_year, elem, y):
+            if step and i % step == 0:
+                db.setdefault(y, {})[cat] = {"ans": ANSWERS[(i // step) % 2], "memo": ""}
+            i += 1
+    return db
+
+
+def export_rows(db: Dict[int, Dict[str, Dict[str, str]]], name: str, birth_year: int, elem: str,
+                prior: str, top: str, top_p: float) -> List[Dict[str, Any]]:
+    # views/years.py 6-4 의 응답 요약표와 같은 구성
+    rows = []
+    for y, cats in sorted(db.items()):
+        for cat, v in cats.items():
+            rows.append({
+                "이름": name, "출생연도": birth_year, "연도": y, "테마": cat,
+                "응답": v.get("ans"), "메모": v.get("memo", ""), "우세오행": elem,
+                "MBTI_사전": prior, "MBTI_사후1": top, "사후1_확률(%)": round(top_p * 100, 1),
+            })
+    return rows
+
+
+# ---- 측정 ----
+def _time_per_call(fn: Callable[[], Any], calls: int, repeat: int) -> List[float]:
+    out = []
+    for _ in range(repeat):
+        gc.disable()
+        t0 = time.perf_counter_ns()
+        for _ in range(calls):
+            fn()
+        out.append((time.perf_counter_ns() - t0) / calls)
+        gc.enable()
+    return out
+
+
+def calibrate(repeat: int = 7) -> float:
+    """기계 속도 기준: 고정된 순수 파이썬 작업(dict 조회·float 연산·리스트 추가) 1회당 ns (최솟값)"""
+    table = {i: i * 0.5 for i in range(256)}
+
+    def work() -> List[float]:
+        acc, out = 0.0, []
+        for i in range(256):
+            acc += table[i] * 1.0001
+            out.append(acc)
+        return out
+
+    work()
+    return min(_time_per_call(work, 500, repeat))
+
+
+def with_rel(results: Dict[str, Dict[str, Any]], cal_ns: float) -> Dict[str, Dict[str, Any]]:
+    """각 항목에 비교 지표 ÷ 보정 루프 시간 (rel) 추가"""
+    for r in results.values():
+        value = r.get(COMPARE_KEY[r["unit"]])
+        if value:
+            r["rel"] = round(value * UNIT_NS[r["unit"]] / cal_ns, 5)
+    return results
+
+
+def _alloc_per_call(fn: Callable[[], Any], calls: int) -> Dict[str, float]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fn()
+        peak = tracemalloc.get_traced_memory()[1] - base
+        keep = [fn() for _ in range(calls)]  # 결과를 붙잡아 호출당 남는 크기를 잼
+        retained = (tracemalloc.get_traced_memory()[0] - base) / calls
+        del keep
+    finally:
+        tracemalloc.stop()
+    return {"peak_b": peak, "retained_b": round(retained, 1)}
+
+
+def bench(fn: Callable[[], Any], calls: int, repeat: int, setup: Optional[Callable[[], Any]] = None) -> Dict[str, Any]:
+    if setup is not None:
+        times = []
+        for _ in range(repeat):  # 매 반복 전 상태 초기화 (예: 캐시 비우기)
+            setup()
+            times += _time_per_call(fn, calls, 1)
+        setup()
+    else:
+        fn()  # 예열
+        times = _time_per_call(fn, calls, repeat)
+    return {"unit": "ns", "calls": calls, "min": round(min(times), 1),
+            "median": round(statistics.median(times), 1), **_alloc_per_call(fn, min(calls, 1000))}
+
+
+def engine_benchmarks(repeat: int, scale: float) -> Dict[str, Dict[str, Any]]:
+    n = lambda k: max(1, int(k * scale))  # noqa: E731
+    years = list(range(1900, 2101))
+    # 호출마다 다음 입력 (인자 준비 비용은 모든 기준선에 똑같이 포함)
+    cycling = lambda seq: itertools.cycle(seq).__next__  # noqa: E731
+
+    by = 1990
+    yr = saju_year_summary(by)
+    weights = elem_weights_for_year(yr, {e: 0.0 for e in ELEM_LIST})
+    elem = max(weights, key=weights.get)
+    cands = infer_mbti_from_elements(weights, yr.yin_yang)
+    axis = dict(zip("EINSTFJP", (0.62, 0.38, 0.55, 0.45, 0.4, 0.6, 0.7, 0.3)))
+    summaries = [saju_year_summary(y) for y in years]
+    weight_sets = [(elem_weights_for_year(s), s.yin_yang) for s in summaries]
+    db50 = experience_db(by, elem, 2000, 2049, 0.5)
+    db200 = experience_db(by, elem, 1900, 2099, 0.5)
+    post = _type_prob_from_axis(axis)
+    rows200 = export_rows(db200, "bench", by, elem, cands[0].code, post[0][0], post[0][1])
+
+    next_year = cycling(years)
+    results = {
+        "engine.ganzhi_of_year": bench(lambda: ganzhi_of_year(next_year()), n(20_000), repeat),
+        "engine.saju_year_summary": bench(lambda: saju_year_summary(next_year()), n(20_000), repeat),
+    }
+    next_w = cycling(weight_sets)
+    results["engine.infer_mbti_from_elements"] = bench(lambda: infer_mbti_from_elements(*next_w()), n(5_000), repeat)
+    next_year = cycling(years)
+    results["engine.deterministic_topics"] = bench(lambda: deterministic_topics("1990-목", next_year()), n(10_000), repeat)
+    # 가설: 캐시 적중(평시) / 캐시 비운 직후 (첫 방문)
+    next_year = cycling(years)
+    results["engine.year_hypotheses.hit"] = bench(lambda: year_hypotheses(by, elem, next_year()), n(20_000), repeat)
+    next_key = cycling([(b, y) for b in range(1980, 1990) for y in years])
+    results["engine.year_hypotheses.miss"] = bench(lambda: year_hypotheses(*next_key(), elem), 10 * len(years),
+                                                   repeat, setup=HYPOTHESES_CACHE.clear)
+    results["engine._apply_event_update.50y"] = bench(lambda: _apply_event_update(axis, db50), n(2_000), repeat)
+    results["engine._apply_event_update.200y"] = bench(lambda: _apply_event_update(axis, db200), n(500), repeat)
+    results["engine._type_prob_from_axis"] = bench(lambda: _type_prob_from_axis(axis), n(5_000), repeat)
+    # 재실행마다 도는 사후 상위 5개 (_posterior_result) – 16유형 직접 열거 경로
+    axis_vec = list(axis.values())
+    results["engine._type_prob_from_vec.top5"] = bench(lambda: _type_prob_from_vec(axis_vec, 5), n(5_000), repeat)
+    # 6-4 응답 요약표 (200년 × 가설 3개, 밀도 0.5)
+    results["export.rows.200y"] = bench(
+        lambda: export_rows(db200, "bench", by, elem, cands[0].code, post[0][0], post[0][1]), n(200), repeat)
+    results["export.csv.200y"] = bench(lambda: b"".join(iter_csv(rows200)), n(100), repeat)
+    try:
+        import pandas as pd
+    except ImportError:
+        pass  # pandas 없는 환경: DataFrame 항목만 생략
+    else:
+        results["export.dataframe.200y"] = bench(lambda: pd.DataFrame(rows200), n(100), repeat)
+    return results
+
+
+# ---- AppTest 재실행 ----
+def _set_number(at, label: str, value: int) -> None:
+    next(w for w in at.sidebar.number_input if w.label == label).set_value(value)
+
+
+def _run_ms(at) -> float:
+    t0 = time.perf_counter()
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"app raised: {[e.value for e in at.exception]}")
+    return (time.perf_counter() - t0) * 1000
+
+
+def app_rerun(span: int, density: float, reruns: int) -> Dict[str, Any]:
+    from streamlit.testing.v1 import AppTest
+
+    from saju_engine import PosteriorAccumulator
+
+    start, end = BIRTH_YEAR, BIRTH_YEAR + span - 1
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=300)
+    first = _run_ms(at)
+    yr = saju_year_summary(BIRTH_YEAR)
+    weights = elem_weights_for_year(yr, {e: 0.0 for e in ELEM_LIST})
+    db = experience_db(BIRTH_YEAR, max(weights, key=weights.get), start, end, density)
+    n_answers = sum(len(c) for c in db.values())
+    at.session_state["experience_db"] = db
+    at.session_state["posterior_acc"] = PosteriorAccumulator.from_db(db)
+    # 시작/종료 연도 입력의 min_value 가 앞 입력에 묶여 있어(위젯 id 가 바뀜) 하나씩 적용
+    for label, value in (("출생 연도", BIRTH_YEAR), ("경험 수집 시작 연도", start), ("경험 수집 종료 연도", end)):
+        _set_number(at, label, value)
+        _run_ms(at)
+    next(b for b in at.sidebar.button if "프로필" in b.label).click()
+    apply = _run_ms(at)
+    times = [_run_ms(at) for _ in range(reruns)]
+    switch = []
+    pages = next((r for r in at.radio if r.key == "year_page"), None)
+    if pages is not None:
+        for i in range(reruns):
+            at.radio(key="year_page").set_value((i + 1) % len(pages.options))
+            switch.append(_run_ms(at))
+    times.sort()
+    return {
+        "unit": "ms", "years": span, "answers": n_answers,
+        "first_run": round(first, 1), "apply_profile": round(apply, 1),
+        "median": round(statistics.median(times), 1), "p95": round(times[min(len(times) - 1, int(0.95 * len(times)))], 1),
+        "page_switch": round(statistics.median(switch), 1) if switch else None,
+    }
+
+
+def app_benchmarks(density: float, reruns: int) -> Dict[str, Dict[str, Any]]:
+    patch_apptest_pages()
+    quiet_missing_script_run_context()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:  # var/ (이벤트 로그 등) 부산물은 임시 디렉터리에
+        os.chdir(tmp)
+        try:
+            app_rerun(RANGES[0], density, 1)  # 예열: 첫 차트·표가 부르는 import 는 측정에서 제외
+            return {f"app.rerun.{span}y": app_rerun(span, density, reruns) for span in RANGES}
+        finally:
+            os.chdir(cwd)
+
+
+# ---- 비교 ----
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """기준선 대비 회귀 목록 – 보정 루프 대비 비율(rel)로 비교 (기준선에 없는 항목은 비교 안 함).
+    최소폭은 기준선 비율을 이번 기계의 시간으로 환산해 적용"""
+    out = []
+    cal_ns = current["meta"]["calibration_ns"]
+    for name, cur in current["benchmarks"].items():
+        base = baseline.get("benchmarks", {}).get(name)
+        unit = cur.get("unit")
+        if not base or not base.get("rel") or not cur.get("rel") or unit != base.get("unit"):
+            continue
+        delta = (cur["rel"] - base["rel"]) * cal_ns / UNIT_NS[unit]
+        if cur["rel"] > base["rel"] * (1 + threshold) and delta > MIN_DELTA[unit]:
+            out.append(f"{name}: {COMPARE_KEY[unit]} ×{base['rel']} → ×{cur['rel']} calibration "
+                       f"(+{(cur['rel'] / base['rel'] - 1) * 100:.0f}%, ≈ +{delta:.1f} {unit} here)")
+    return out
+
+
+def _report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    base = (baseline or {}).get("benchmarks", {})
+    print(f"calibration loop {results['meta']['calibration_ns'] / 1000:.2f} µs")
+    for name, r in results["benchmarks"].items():
+        b = base.get(name, {}).get("rel")
+        vs = f"  ({(r['rel'] / b - 1) * 100:+.0f}% vs baseline)" if b and r.get("rel") else ""
+        if r["unit"] == "ns":
+            print(f"{name:38s} {r['median'] / 1000:10.2f} µs  peak {r['peak_b']:>8} B  "
+                  f"retained {r['retained_b']:>9} B{vs}")
+        else:
+            print(f"{name:38s} {r['median']:10.1f} ms  p95 {r['p95']} ms  apply {r['apply_profile']} ms  "
+                  f"switch {r['page_switch']} ms  answers {r['answers']}{vs}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="엔진·앱 재실행 벤치마크")
+    ap.add_argument("--only", choices=["engine", "app"], help="한 묶음만 실행")
+    ap.add_argument("--repeat", type=int, default=5, help="엔진 측정 반복 횟수 (중앙값·최솟값)")
+    ap.add_argument("--scale", type=float, default=1.0, help="엔진 측정 호출 수 배율 (CI 에선 0.2 등)")
+    ap.add_argument("--density", type=float, default=0.3, help="앱 재실행: 미리 채울 응답 비율 (0~1)")
+    ap.add_argument("--reruns", type=int, default=10, help="앱 재실행: 구간마다 반복할 재실행 수")
+    ap.add_argument("-o", "--output", type=Path, default=RESULTS_FILE)
+    ap.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    ap.add_argument("--compare", action="store_true", help="기준선과 비교해 회귀가 있으면 종료 코드 1")
+    ap.add_argument("--threshold", type=float, default=0.25, help="회귀로 볼 상대 증가율")
+    ap.add_argument("--save-baseline", action="store_true", help="결과를 기준선 파일에도 저장")
+    args = ap.parse_args()
+
+    cal_ns = calibrate()
+    benchmarks: Dict[str, Any] = {}
+    if args.only in (None, "engine"):
+        benchmarks.update(engine_benchmarks(args.repeat, args.scale))
+    if args.only in (None, "app"):
+        benchmarks.update(app_benchmarks(args.density, args.reruns))
+    cal_ns = min(cal_ns, calibrate())  # 첫 측정은 CPU 가 덜 깨어 있어 느리게 나올 수 있음
+    results = {
+        "meta": {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+                 "platform": platform.platform(), "machine": platform.machine(), "calibration_ns": cal_ns,
+                 "repeat": args.repeat, "scale": args.scale, "density": args.density, "reruns": args.reruns},
+        "benchmarks": with_rel(benchmarks, cal_ns),
+    }
+    args.output.write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    baseline = None
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    _report(results, baseline)
+    print(f"→ {args.output}")
+    if args.compare:
+        if baseline is None:
+            sys.exit(f"no baseline at {args.baseline} (run with --save-baseline first)")
+        if "calibration_ns" not in baseline.get("meta", {}):
+            sys.exit(f"{args.baseline} has no calibration ratios (regenerate with --save-baseline)")
+        base_py = baseline["meta"].get("python", "")
+        if base_py.rsplit(".", 1)[0] != platform.python_version().rsplit(".", 1)[0]:
+            print(f"warning: baseline from Python {base_py}, running {platform.python_version()} – "
+                  "ratios may shift between interpreter versions", file=sys.stderr)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\n".join(["", f"REGRESSIONS (>{args.threshold:.0%} slower than baseline):"] + regressions),
+                  file=sys.stderr)
+            sys.exit(1)
+        print(f"no regressions vs {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
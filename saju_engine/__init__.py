@@ -0,0 +1,46 @@
+"""saju_engine – 사주(간지·오행 단순화) → MBTI 근사 엔진.
+
+Streamlit/pandas 없이 import 되는 순수 파이썬 패키지입니다.
+app.py 는 이 패키지 위의 얇은 뷰이고, 배치 작업·벤치마크·API 도 여기서 가져다 씁니다.
+정확한 사주 엔진으로 교체할 때는 이 패키지의 함수 시그니처만 유지하면 됩니다.
+
+numpy 가 필요한 배치 API 는 하위 모듈에서 직접 import 합니다:
+    from saju_engine.batch import infer_mbti_batch
+
+(MBTI, 오행) 스토리는 컴파일된 인덱스에서 읽습니다 (빌드: python -m saju_engine.stories):
+    from saju_engine.stories import story_for
+"""
+
+from .tables import (
+    STEMS, BRANCHES, STEM_TO_YIN_YANG, STEM_TO_ELEM, BRANCH_TO_ELEM,
+    ELEM_LIST, ELEM_COLORS, EVENT_CATS, EVENT_TO_AXIS_WEIGHTS,
+    MBTI_LIST, MBTI_ELEMENTS, ELEMENT_KR, ELEMENT_COLOR, MONTH_ELEMENT, EVENT_PRESETS,
+)
+from .codes import (
+    Stem, Branch, Elem, Axis, Answer, TYPE_CODES, TYPE_INDEX,
+    elem_vector, elem_dict, axis_vector, axis_dict,
+)
+from .core import (
+    SajuYearResult, SAJU_CYCLE, ganzhi_of_year, saju_year_summary,
+    SajuYears, saju_years, elem_vector_for_year, elem_weights_for_year,
+    MBTICandidate, infer_mbti_from_elements,
+    deterministic_topics, topics_for_years, year_hypotheses, year_hypotheses_range,
+    HYPOTHESES_CACHE, warm_hypotheses_cache,
+    MBTIPosterior, answer_counts, compute_posterior, PosteriorAccumulator,
+)
+from .topk import top_k_product, top_k_codes
+
+__all__ = [
+    "STEMS", "BRANCHES", "STEM_TO_YIN_YANG", "STEM_TO_ELEM", "BRANCH_TO_ELEM",
+    "ELEM_LIST", "ELEM_COLORS", "EVENT_CATS", "EVENT_TO_AXIS_WEIGHTS",
+    "MBTI_LIST", "MBTI_ELEMENTS", "ELEMENT_KR", "ELEMENT_COLOR", "MONTH_ELEMENT", "EVENT_PRESETS",
+    "SajuYearResult", "SAJU_CYCLE", "ganzhi_of_year", "saju_year_summary",
+    "Stem", "Branch", "Elem", "Axis", "Answer", "TYPE_CODES", "TYPE_INDEX",
+    "elem_vector", "elem_dict", "axis_vector", "axis_dict",
+    "SajuYears", "saju_years", "elem_vector_for_year", "elem_weights_for_year",
+    "MBTICandidate", "infer_mbti_from_elements",
+    "deterministic_topics", "topics_for_years", "year_hypotheses", "year_hypotheses_range",
+    "HYPOTHESES_CACHE", "warm_hypotheses_cache",
+    "MBTIPosterior", "answer_counts", "compute_posterior", "PosteriorAccumulator",
+    "top_k_product", "top_k_codes",
+]
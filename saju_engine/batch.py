@@ -0,0 +1,208 @@
+# saju_engine/batch.py
+# -------------------------------------------------------------
+# infer_mbti_from_elements 의 배열(벡터화) 버전 – 대량 프로필 오프라인 스코어링용
+# -------------------------------------------------------------
+# 입력: N×5 오행 가중치 행렬(열 순서 = ELEM_LIST) + 길이 N 양/음 플래그
+# 출력: 축 점수(E-I, N-S, T-F, J-P), 1순위 코드, 경계 근처 대체 후보, 점수 – 모두 배열
+# 스칼라 함수와 같은 연산 순서를 따라 float64 결과가 비트 단위로 일치합니다.
+# numpy 가 필요하므로 saju_engine/__init__ 에서는 import 하지 않습니다.
+# -------------------------------------------------------------
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .codes import AXIS_BITS, ELEM_LABELS, EVENT_AXIS_VECTORS, TYPE_CODES, elem_vector
+from .core import MBTICandidate, _candidates_from_axis, answer_counts, saju_years
+
+_TYPE_CODES_ARR = np.array(TYPE_CODES)
+_AXIS_BITS = np.array(AXIS_BITS, dtype=np.uint8)
+
+# 카테고리×축 가중치 행렬 (C, 8) – 사후 갱신 = counts @ EVENT_AXIS_MATRIX
+EVENT_AXIS_MATRIX = np.array(EVENT_AXIS_VECTORS, dtype=np.float64)
+
+NEAR_THRESHOLD = 0.15
+
+
+@dataclass
+class MBTIBatch:
+    axis: np.ndarray       # (N, 4) float64 – notes 의 E-I, N-S, T-F, J-P
+    code: np.ndarray       # (N,) uint8 – 1순위 코드 인덱스 (codes.TYPE_CODES)
+    near: np.ndarray       # (N, 4) bool – 축별 경계(|x| < 0.15) 여부 = 대체 후보 존재
+    score: np.ndarray      # (N,) float64 – 1순위 점수 (round 3)
+    alt_score: np.ndarray  # (N,) float64 – 대체 후보 점수 (round 3)
+
+    def __len__(self) -> int:
+        return len(self.code)
+
+    def codes(self) -> np.ndarray:
+        """1순위 코드 문자열 배열"""
+        return _TYPE_CODES_ARR[self.code]
+
+    def alt_codes(self) -> np.ndarray:
+        """(N, 4) 대체 후보 코드 인덱스 – 해당 축만 뒤집은 코드. near 가 False 인 칸은 의미 없음"""
+        return self.code[:, None] ^ _AXIS_BITS[None, :]
+
+    def candidates(self, i: int) -> List[MBTICandidate]:
+        """i번째 프로필을 스칼라 함수와 같은 List[MBTICandidate] 로 복원"""
+        return _candidates_from_axis(self.axis[i].tolist())
+
+
+def _round3(x: np.ndarray) -> np.ndarray:
+    """round(x, 3) 과 같은 결과. np.round 는 x*1000 의 반올림이라 .xxx5 근처에서 달라지므로
+    그 근처 값만 파이썬 round 로 다시 계산합니다 (대부분 원소는 벡터 연산 그대로)."""
+    out = np.round(x, 3)
+    scaled = x * 1000.0
+    tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if tie.any():
+        out[tie] = [round(v, 3) for v in x[tie].tolist()]
+    return out
+
+
+def elem_matrix(elem_weights: Iterable[Dict[str, float]]) -> np.ndarray:
+    """오행 가중치 dict 목록 → N×5 float64 행렬 (열 순서 = Elem)"""
+    return np.array([elem_vector(w) for w in elem_weights], dtype=np.float64)
+
+
+def year_range_inputs(start: int, end: int, tweak: Optional[Dict[str, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """출생연도 start~end (양끝 포함) → infer_mbti_batch 입력 (N×5 가중치, 양 플래그).
+
+    elem_weights_for_year 와 같은 규칙(연간·연지 0.5씩 + 튜닝 → 음수 방지 → 정규화)을
+    60갑자 열 테이블 gather 로 계산합니다.
+    """
+    ys = saju_years(start, end)
+    n = len(ys)
+    rows = np.arange(n)
+    w = np.zeros((n, len(ELEM_LABELS)), dtype=np.float64)
+    w[rows, np.frombuffer(ys.stem_elem, dtype=np.uint8)] += 0.5
+    w[rows, np.frombuffer(ys.branch_elem, dtype=np.uint8)] += 0.5
+    if tweak:
+        w += np.array(elem_vector(tweak), dtype=np.float64)
+
+    minv = w.min(axis=1)
+    neg = minv < 0
+    w[neg] -= minv[neg, None]
+    total = w[:, 0] + w[:, 1] + w[:, 2] + w[:, 3] + w[:, 4]
+    total[total == 0] = 1.0
+    w /= total[:, None]
+    return w, np.frombuffer(ys.yang, dtype=np.uint8).astype(bool)
+
+
+def infer_mbti_batch(elem_weights, yang) -> MBTIBatch:
+    """infer_mbti_from_elements 의 배치 버전.
+
+    elem_weights: (N, 5) 배열 (ELEM_LIST 순서: 목·화·토·금·수)
+    yang: 길이 N bool/int 배열 (참 = 연간 '양', 거짓 = '음')
+    """
+    w = np.asarray(elem_weights, dtype=np.float64)
+    if w.ndim != 2 or w.shape[1] != len(ELEM_LABELS):
+        raise ValueError(f"elem_weights must be (N, {len(ELEM_LABELS)}), got {w.shape}")
+    yang = np.asarray(yang, dtype=bool)
+    if yang.shape != (w.shape[0],):
+        raise ValueError(f"yang must be ({w.shape[0]},), got {yang.shape}")
+
+    # sum() 과 같은 왼쪽→오른쪽 덧셈 순서 유지
+    total = w[:, 0] + w[:, 1] + w[:, 2] + w[:, 3] + w[:, 4]
+    total[total == 0] = 1.0
+    p = w / total[:, None]
+    wood, fire, earth, metal, water = p.T
+
+    axis = np.empty((w.shape[0], 4), dtype=np.float64)
+    # E/I
+    axis[:, 0] = (wood + fire) * 0.9 - (metal + water) * 0.9 + np.where(yang, 0.2, -0.2)
+    # N/S
+    axis[:, 1] = (wood + water) * 0.8 - (metal + earth) * 0.8 + fire * 0.2
+    # T/F
+    axis[:, 2] = (metal + water) * 0.9 - (wood + fire) * 0.9
+    # J/P
+    axis[:, 3] = (metal + earth) * 0.9 - (wood + fire + water) * 0.9
+
+    # 축 값이 0 이하이면 I/S/F/P → 해당 비트 on
+    code = ((axis <= 0) * _AXIS_BITS).sum(axis=1, dtype=np.uint8)
+    absx = np.abs(axis)
+    near = absx < NEAR_THRESHOLD
+    base = 0.25 * (absx[:, 0] + absx[:, 1] + absx[:, 2] + absx[:, 3])
+    return MBTIBatch(
+        axis=axis,
+        code=code,
+        near=near,
+        score=_round3(0.5*1.0 + base),
+        alt_score=_round3(0.5*0.7 + base),
+    )
+
+
+# =========================
+# 사건 응답 기반 사후 갱신 (배치)
+# =========================
+
+def counts_matrix(exp_dbs: Iterable[Dict[int, Dict[str, Dict[str, str]]]]) -> np.ndarray:
+    """응답자별 experience_db 목록 → (N, C) int 행렬 (맞다 +1 / 틀리다 −1 카테고리별 합)"""
+    rows = [answer_counts(db) for db in exp_dbs]
+    return np.array(rows, dtype=np.int32).reshape(len(rows), len(EVENT_AXIS_VECTORS))
+
+
+def prior_axis_batch(axis_scores: np.ndarray, t: float = 1.2) -> np.ndarray:
+    """(N, 4) 축 점수(MBTIBatch.axis) → (N, 8) 사전 축 확률 (E,I,N,S,T,F,J,P)"""
+    p = 1.0/(1.0 + np.exp(-np.asarray(axis_scores, dtype=np.float64)/t))
+    out = np.empty(p.shape[:-1] + (8,), dtype=np.float64)
+    out[..., 0::2] = p
+    out[..., 1::2] = 1 - p
+    return out
+
+
+def posterior_batch(prior: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """_apply_event_update 의 배치 버전: sigmoid(logit(prior) + counts @ W).
+
+    prior: (N, 8) 또는 모든 응답자 공통 (8,) 축 확률
+    counts: (N, C) counts_matrix 결과
+    """
+    p = np.clip(np.asarray(prior, dtype=np.float64), 1e-6, 1-1e-6)
+    z = np.log(p/(1-p)) + np.asarray(counts, dtype=np.float64) @ EVENT_AXIS_MATRIX
+    return 1.0/(1.0 + np.exp(-z))
+
+
+# =========================
+# 독립 축 곱 분포 상위 k (배치)
+# =========================
+
+def top_k_product_batch(probs: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """topk.top_k_product 의 배치 버전 – 축을 하나씩 붙이며 상위 k 빔만 유지 (전체 곱 미생성).
+
+    probs: (N, A, m) 응답자별·축별 선택지 확률
+    반환: (idx (N, k, A) 축별 선택지 인덱스, p (N, k) 정규화 확률) – 확률 내림차순
+    상위 k 조합의 접두사는 항상 접두사 상위 k 안에 있으므로 빔 탐색이 정확합니다.
+    """
+    probs = np.asarray(probs, dtype=np.float64)
+    n, n_axes, m = probs.shape
+    k = min(k, m ** n_axes)
+    part = np.ones((n, 1), dtype=np.float64)
+    idx = np.zeros((n, 1, 0), dtype=np.intp)
+    rows = np.arange(n)[:, None]
+    for a in range(n_axes):
+        cand = (part[:, :, None] * probs[:, None, a, :]).reshape(n, -1)
+        keep = np.argsort(-cand, axis=1, kind="stable")[:, :min(k, cand.shape[1])]
+        beam, opt = np.divmod(keep, m)
+        idx = np.concatenate([idx[rows, beam], opt[:, :, None]], axis=2)
+        part = cand[rows, keep]
+    norm = probs.sum(axis=2).prod(axis=1)
+    norm[norm == 0] = 1.0
+    return idx, part / norm[:, None]
+
+
+def top_k_types_batch(axis: np.ndarray, k: int = 5) -> Tuple[np.ndarray, np.ndarray]:
+    """(N, 8) 축 확률 → 상위 k MBTI (코드 인덱스 (N, k) uint8, 확률 (N, k)).
+
+    core._type_prob_from_vec 와 같이 16유형 곱을 TYPE_CODES 순서로 모두 만든 뒤 안정 정렬
+    → 동률은 코드 인덱스 순, 곱·정규화 연산 순서도 같아 스칼라 결과와 일치합니다.
+    """
+    a = np.asarray(axis, dtype=np.float64)
+    e, n, t, j = (a[:, 2*i:2*i+2] for i in range(4))
+    probs = (e[:, :, None, None, None] * n[:, None, :, None, None]
+             * t[:, None, None, :, None] * j[:, None, None, None, :]).reshape(len(a), len(TYPE_CODES))
+    norm = np.zeros(len(a), dtype=np.float64)
+    for c in range(len(TYPE_CODES)):  # sum() 과 같은 왼쪽→오른쪽 덧셈
+        norm += probs[:, c]
+    norm[norm == 0] = 1.0
+    order = np.argsort(-probs, axis=1, kind="stable")[:, :k]
+    return order.astype(np.uint8), np.take_along_axis(probs, order, axis=1) / norm[:, None]
@@ -0,0 +1,98 @@
+# saju_engine/codes.py
+# -------------------------------------------------------------
+# 내부 표현용 정수 코드 (IntEnum) + 고정 길이 벡터 변환
+# -------------------------------------------------------------
+# 엔진 내부는 천간·지지·오행·MBTI 축을 작은 정수로 다루고, 한글/영문 라벨은
+# 표시 경계(앱 화면, 내보내기)에서만 *_LABELS 로 만듭니다.
+# - 오행 벡터: 길이 5 (Elem 순서 = ELEM_LIST)
+# - 축 벡터:   길이 8 (Axis 순서 = E,I,N,S,T,F,J,P)
+# -------------------------------------------------------------
+
+from enum import IntEnum
+from typing import Dict, List, Sequence, Tuple
+
+from .tables import (
+    STEMS, BRANCHES, STEM_TO_YIN_YANG, STEM_TO_ELEM, BRANCH_TO_ELEM,
+    ELEM_LIST, EVENT_CATS, EVENT_TO_AXIS_WEIGHTS,
+)
+
+
+class Stem(IntEnum):
+    GAP = 0; EUL = 1; BYEONG = 2; JEONG = 3; MU = 4
+    GI = 5; GYEONG = 6; SIN = 7; IM = 8; GYE = 9
+
+
+class Branch(IntEnum):
+    JA = 0; CHUK = 1; IN = 2; MYO = 3; JIN = 4; SA = 5
+    O = 6; MI = 7; SIN = 8; YU = 9; SUL = 10; HAE = 11
+
+
+class Elem(IntEnum):
+    WOOD = 0; FIRE = 1; EARTH = 2; METAL = 3; WATER = 4
+
+
+class Axis(IntEnum):
+    E = 0; I = 1; N = 2; S = 3; T = 4; F = 5; J = 6; P = 7
+
+
+class Answer(IntEnum):
+    """연도별 응답 – 값이 곧 로지트 갱신 부호"""
+    NO = -1; SKIP = 0; YES = 1
+
+
+# 라벨 (표시 경계 전용)
+STEM_LABELS: Tuple[str, ...] = tuple(STEMS)
+BRANCH_LABELS: Tuple[str, ...] = tuple(BRANCHES)
+ELEM_LABELS: Tuple[str, ...] = tuple(ELEM_LIST)
+AXIS_LABELS: Tuple[str, ...] = tuple(a.name for a in Axis)
+CAT_LABELS: Tuple[str, ...] = tuple(cat for cat, _ in EVENT_CATS)
+ANSWER_LABELS = {Answer.YES: "맞다", Answer.NO: "틀리다", Answer.SKIP: "모름/패스"}
+
+# 라벨 → 코드
+ELEM_INDEX: Dict[str, Elem] = {label: Elem(i) for i, label in enumerate(ELEM_LABELS)}
+CAT_INDEX: Dict[str, int] = {label: i for i, label in enumerate(CAT_LABELS)}
+ANSWER_CODE: Dict[str, Answer] = {label: code for code, label in ANSWER_LABELS.items()}
+
+# 천간·지지 → 오행/음양 (인덱스 = Stem / Branch)
+STEM_ELEM: Tuple[Elem, ...] = tuple(ELEM_INDEX[STEM_TO_ELEM[s]] for s in STEMS)
+BRANCH_ELEM: Tuple[Elem, ...] = tuple(ELEM_INDEX[BRANCH_TO_ELEM[b]] for b in BRANCHES)
+STEM_YANG: Tuple[bool, ...] = tuple(STEM_TO_YIN_YANG[s] == "양" for s in STEMS)
+
+# MBTI 4축: (양수 쪽, 음수 쪽) 축 벡터 인덱스
+AXIS_PAIRS: Tuple[Tuple[Axis, Axis], ...] = ((Axis.E, Axis.I), (Axis.N, Axis.S), (Axis.T, Axis.F), (Axis.J, Axis.P))
+AXIS_NAMES: Tuple[str, ...] = tuple(f"{a.name}-{b.name}" for a, b in AXIS_PAIRS)  # notes 키
+
+# 16유형 코드 인덱스 = I·S·F·P 여부를 상위 비트부터 채운 4비트 정수 (0 = ENTJ, 15 = ISFP)
+# → E/I → N/S → T/F → J/P 중첩 열거 순서와 같습니다. 축 k 를 뒤집으려면 ^ AXIS_BITS[k].
+TYPE_CODES: Tuple[str, ...] = tuple(
+    f"{e}{n}{t}{j}"
+    for e in ("E", "I") for n in ("N", "S") for t in ("T", "F") for j in ("J", "P")
+)
+TYPE_INDEX: Dict[str, int] = {code: i for i, code in enumerate(TYPE_CODES)}
+AXIS_BITS: Tuple[int, ...] = (8, 4, 2, 1)
+
+# 카테고리별 길이 8 축 가중치 벡터 (인덱스 = CAT_INDEX)
+EVENT_AXIS_VECTORS: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(EVENT_TO_AXIS_WEIGHTS.get(cat, {}).get(a.name, 0.0) for a in Axis)
+    for cat in CAT_LABELS
+)
+
+
+def elem_vector(weights: Dict[str, float]) -> List[float]:
+    """{'목': w, ...} → 길이 5 리스트 (없는 키는 0.0)"""
+    return [weights.get(label, 0.0) for label in ELEM_LABELS]
+
+
+def elem_dict(vec: Sequence[float]) -> Dict[str, float]:
+    """길이 5 벡터 → {'목': w, ...} (표시용)"""
+    return dict(zip(ELEM_LABELS, vec))
+
+
+def axis_vector(axis: Dict[str, float]) -> List[float]:
+    """{'E': p, 'I': q, ...} → 길이 8 리스트"""
+    return [axis[label] for label in AXIS_LABELS]
+
+
+def axis_dict(vec: Sequence[float]) -> Dict[str, float]:
+    """길이 8 벡터 → {'E': p, 'I': q, ...} (표시용)"""
+    return dict(zip(AXIS_LABELS, vec))
@@ -0,0 +1,495 @@
+# saju_engine/core.py
+# -------------------------------------------------------------
+# 근사 사주 엔진 + 오행 → MBTI 스코어 + 사건 기반 사후 갱신
+# -------------------------------------------------------------
+# Streamlit/pandas 를 import 하지 않습니다. 앱(app.py)은 이 모듈을 감싸는 뷰이며,
+# 배치 작업·벤치마크·API 도 같은 함수를 그대로 가져다 씁니다.
+# -------------------------------------------------------------
+
+import math
+import struct
+import hashlib
+import functools
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .tables import EVENT_CATS
+from .codes import (
+    Axis, ANSWER_CODE, AXIS_BITS, AXIS_NAMES, AXIS_PAIRS, BRANCH_ELEM, BRANCH_LABELS,
+    CAT_INDEX, ELEM_LABELS, EVENT_AXIS_VECTORS, STEM_ELEM, STEM_LABELS, STEM_YANG,
+    TYPE_CODES, axis_dict, axis_vector, elem_dict, elem_vector,
+)
+from .cache import LRUCache
+
+# =========================
+# 1) 근사 사주 엔진 (연간/연지만)
+# =========================
+@dataclass(frozen=True)
+class SajuYearResult:
+    year: int
+    stem: str
+    branch: str
+    stem_elem: str
+    branch_elem: str
+    yin_yang: str
+
+
+# 간지 기준 연도: 1984 = 갑자 (0 offset)
+CYCLE_BASE_YEAR = 1984
+CYCLE_LEN = 60  # 육십갑자 = lcm(10, 12)
+
+
+def _build_cycle() -> List[SajuYearResult]:
+    out = []
+    for i in range(CYCLE_LEN):
+        s, b = i % 10, i % 12
+        out.append(SajuYearResult(
+            year=CYCLE_BASE_YEAR + i,
+            stem=STEM_LABELS[s],
+            branch=BRANCH_LABELS[b],
+            stem_elem=ELEM_LABELS[STEM_ELEM[s]],
+            branch_elem=ELEM_LABELS[BRANCH_ELEM[b]],
+            yin_yang="양" if STEM_YANG[s] else "음"
+        ))
+    return out
+
+
+# 육십갑자 테이블: SAJU_CYCLE[(year - 1984) % 60] 가 해당 연도의 간지·오행·음양 (1984~2043 기준 레코드)
+SAJU_CYCLE: List[SajuYearResult] = _build_cycle()
+
+
+def ganzhi_of_year(year: int) -> Tuple[str, str]:
+    """간지 계산(연간·연지): 1984년을 '갑자' 기준으로 단순 계산.
+    실제로는 입춘 이전은 이전 해 간지를 쓰는 등 세부 규칙이 있으나 여기선 근사.
+    """
+    r = SAJU_CYCLE[(year - CYCLE_BASE_YEAR) % CYCLE_LEN]
+    return r.stem, r.branch
+
+
+def saju_year_summary(year: int) -> SajuYearResult:
+    r = SAJU_CYCLE[(year - CYCLE_BASE_YEAR) % CYCLE_LEN]
+    if r.year == year:
+        return r
+    return SajuYearResult(
+        year=year,
+        stem=r.stem,
+        branch=r.branch,
+        stem_elem=r.stem_elem,
+        branch_elem=r.branch_elem,
+        yin_yang=r.yin_yang
+    )
+
+
+# 열 단위(정수 코드) 60갑자 테이블 – 값은 Stem / Branch / Elem 코드, 양=1·음=0
+_CYCLE_COLS = {
+    "stem": bytes(i % 10 for i in range(CYCLE_LEN)),
+    "branch": bytes(i % 12 for i in range(CYCLE_LEN)),
+    "stem_elem": bytes(STEM_ELEM[i % 10] for i in range(CYCLE_LEN)),
+    "branch_elem": bytes(BRANCH_ELEM[i % 12] for i in range(CYCLE_LEN)),
+    "yang": bytes(STEM_YANG[i % 10] for i in range(CYCLE_LEN)),
+}
+
+
+@dataclass(frozen=True)
+class SajuYears:
+    """saju_years() 결과 – 연도별 객체 없이 열마다 uint8 bytes 하나 (값 = Stem/Branch/Elem 코드).
+    i번째 원소가 start + i 년. numpy 에서는 np.frombuffer(col, np.uint8) 로 복사 없이 씁니다.
+    """
+    start: int
+    stem: bytes
+    branch: bytes
+    stem_elem: bytes
+    branch_elem: bytes
+    yang: bytes
+
+    def __len__(self) -> int:
+        return len(self.stem)
+
+    @property
+    def end(self) -> int:
+        return self.start + len(self.stem) - 1
+
+    def row(self, i: int) -> SajuYearResult:
+        """표시용: i번째 연도를 SajuYearResult 로 복원"""
+        return saju_year_summary(self.start + i)
+
+
+def saju_years(start: int, end: int) -> SajuYears:
+    """start~end (양끝 포함) 연도의 간지·오행·음양을 정수 코드 열로 반환 – 60갑자 테이블 gather"""
+    n = max(end - start + 1, 0)
+    off = (start - CYCLE_BASE_YEAR) % CYCLE_LEN
+    reps = (off + n) // CYCLE_LEN + 1
+    cols = {k: (v * reps)[off:off + n] for k, v in _CYCLE_COLS.items()}
+    return SajuYears(start=start, **cols)
+
+
+def elem_vector_for_year(year: int, tweak: Optional[Sequence[float]] = None) -> List[float]:
+    """연간·연지에 동일 비중(0.5, 0.5) 부여 + 사용자 튜닝 → 음수 방지 후 정규화 (길이 5, Elem 순서)"""
+    i = (year - CYCLE_BASE_YEAR) % CYCLE_LEN
+    base = [0.0] * len(ELEM_LABELS)
+    base[STEM_ELEM[i % 10]] += 0.5
+    base[BRANCH_ELEM[i % 12]] += 0.5
+    if tweak is not None:
+        base = [v + t for v, t in zip(base, tweak)]
+
+    minv = min(base)
+    if minv < 0:
+        base = [v - minv for v in base]
+    S = sum(base) or 1.0
+    return [v/S for v in base]
+
+
+def elem_weights_for_year(yr: SajuYearResult, tweak: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """elem_vector_for_year 의 표시용 래퍼 – {'목': w, ...}"""
+    return elem_dict(elem_vector_for_year(yr.year, elem_vector(tweak) if tweak else None))
+
+
+# =========================
+# 2) 오행 → MBTI 후보 스코어 규칙(간단화)
+# =========================
+@dataclass
+class MBTICandidate:
+    code: str
+    score: float
+    notes: Dict[str, float]
+
+
+# 각 지표별 가중치 규칙 (교육용·주관적 근사)
+# - E/I: 양(목·화) vs 음(금·수) 비중 + 화/수 비율
+# - N/S: 목·수 비중 높으면 N, 금·토 비중 높으면 S
+# - T/F: 금/수 → T, 목/화 → F (토는 중화)
+# - J/P: 금/토 → J, 목/화/수 → P
+
+
+def _axis_scores(w: Sequence[float], yang: bool) -> Tuple[float, float, float, float]:
+    """길이 5 오행 벡터 → (E-I, N-S, T-F, J-P) 축 점수"""
+    total = sum(w) or 1.0
+    wood, fire, earth, metal, water = [x/total for x in w]
+
+    # E/I
+    ei = 0.0
+    ei += (wood + fire) * 0.9
+    ei -= (metal + water) * 0.9
+    ei += (1 if yang else -1) * 0.2
+
+    # N/S
+    ns = 0.0
+    ns += (wood + water) * 0.8
+    ns -= (metal + earth) * 0.8
+    ns += fire * 0.2
+
+    # T/F
+    tf = 0.0
+    tf += (metal + water) * 0.9
+    tf -= (wood + fire) * 0.9
+    # 토는 균형 -> 0.0 반영
+
+    # J/P
+    jp = 0.0
+    jp += (metal + earth) * 0.9
+    jp -= (wood + fire + water) * 0.9
+    return ei, ns, tf, jp
+
+
+def _candidates_from_axis(axis: Sequence[float]) -> List[MBTICandidate]:
+    notes = dict(zip(AXIS_NAMES, axis))
+    # 축 값이 0 이하이면 I/S/F/P → 해당 비트 on
+    code = 0
+    for k, x in enumerate(axis):
+        if x <= 0:
+            code |= AXIS_BITS[k]
+
+    # 주변 후보도 함께 제시 (경계값 근처는 해당 축만 뒤집은 대체 후보 추가)
+    cands = [(code, 1.0)]
+    for k, x in enumerate(axis):
+        if abs(x) < 0.15:
+            cands.append((code ^ AXIS_BITS[k], 0.7))
+
+    out = []
+    # 후보 점수는 각 축 거리 기반으로 재가중
+    base = 0.25 * (abs(axis[0]) + abs(axis[1]) + abs(axis[2]) + abs(axis[3]))
+    for c, v in cands:
+        out.append(MBTICandidate(code=TYPE_CODES[c], score=round(0.5*v + base, 3), notes=notes))
+
+    out.sort(key=lambda x: x.score, reverse=True)
+    return out[:5]
+
+
+def infer_mbti_from_elements(elem_weights: Dict[str, float], yin_yang: str) -> List[MBTICandidate]:
+    return _candidates_from_axis(_axis_scores(elem_vector(elem_weights), yin_yang == "양"))
+
+
+# =========================
+# 3) 연도별 가설 생성 (결정적 해싱)
+# =========================
+
+# 선택 모드: "md5" = 기존 시드 호환(기본값), "blake2b" = 8바이트 blake2b 한 번으로 뽑는 빠른 모드
+TOPIC_MODES = ("md5", "blake2b")
+_MD5_WORDS = struct.Struct(">4I")  # 128비트 다이제스트 → 4바이트 정수 4개 (기존 hex 8자리 조각과 동일)
+
+
+@functools.lru_cache(maxsize=None)
+def _pick_table(n: int, k: int) -> Tuple[Tuple[int, ...], ...]:
+    """range(n) 에서 순서 있게 k개 뽑는 모든 경우 – pool.pop 방식의 혼합 진법(n, n-1, ...) 순서"""
+    if k == 0:
+        return ((),)
+    out = []
+    for i in range(n):
+        for rest in _pick_table(n - 1, k - 1):
+            out.append((i,) + tuple(r + (r >= i) for r in rest))
+    return tuple(out)
+
+
+def _md5_rank(digest: bytes, n: int, k: int) -> int:
+    # 기존 방식: i번째 정수 % (n - i) 로 pool 에서 pop → 혼합 진법 순위로 환산
+    rank = 0
+    for i, x in enumerate(_MD5_WORDS.unpack(digest)[:k]):
+        rank = rank * (n - i) + x % (n - i)
+    return rank
+
+
+def deterministic_topics(seed_text: str, year: int, k: int = 3, mode: str = "md5") -> List[int]:
+    """seed_text(year) → EVENT_CATS의 인덱스 k개를 결정적으로 선택
+
+    mode="md5" 는 기존 결과와 같은 선택(k ≤ 4), "blake2b" 는 더 싼 해시로 다른 (그러나 결정적인) 선택.
+    """
+    n = len(EVENT_CATS)
+    k = min(k, n)
+    table = _pick_table(n, k)
+    data = f"{seed_text}-{year}".encode()
+    if mode == "md5":
+        if k > 4:
+            raise ValueError("md5 mode picks at most 4 topics")
+        return list(table[_md5_rank(hashlib.md5(data).digest(), n, k)])
+    if mode == "blake2b":
+        h = int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "big")
+        return list(table[h % len(table)])
+    raise ValueError(f"unknown topic mode: {mode!r}")
+
+
+def topics_for_years(seed_text: str, start: int, end: int, k: int = 3, mode: str = "md5") -> List[Tuple[int, ...]]:
+    """deterministic_topics 의 연도 범위(양끝 포함) 버전 – 시드 접두사 해시 상태를 한 번만 만들고 복사"""
+    n = len(EVENT_CATS)
+    k = min(k, n)
+    table = _pick_table(n, k)
+    prefix = f"{seed_text}-".encode()
+    if mode == "md5":
+        if k > 4:
+            raise ValueError("md5 mode picks at most 4 topics")
+        base = hashlib.md5(prefix)
+        out = []
+        for year in range(start, end + 1):
+            h = base.copy()
+            h.update(str(year).encode())
+            out.append(table[_md5_rank(h.digest(), n, k)])
+        return out
+    if mode == "blake2b":
+        base = hashlib.blake2b(prefix, digest_size=8)
+        size = len(table)
+        out = []
+        for year in range(start, end + 1):
+            h = base.copy()
+            h.update(str(year).encode())
+            out.append(table[int.from_bytes(h.digest(), "big") % size])
+        return out
+    raise ValueError(f"unknown topic mode: {mode!r}")
+
+
+# (birth_year, dominant_elem, year) → 가설 튜플. 프로세스 전역이라 모든 세션이 공유
+HYPOTHESES_CACHE = LRUCache(maxsize=50_000)
+
+
+def year_hypotheses(birth_year: int, dominant_elem: str, year: int) -> List[Tuple[str, str]]:
+    key = (birth_year, dominant_elem, year)
+    hyps = HYPOTHESES_CACHE.get(key)
+    if hyps is None:
+        seed = f"{birth_year}-{dominant_elem}"
+        hyps = tuple(EVENT_CATS[i] for i in deterministic_topics(seed, year, k=3))
+        HYPOTHESES_CACHE.put(key, hyps)
+    return list(hyps)
+
+
+def year_hypotheses_range(birth_year: int, dominant_elem: str, start: int, end: int) -> Dict[int, List[Tuple[str, str]]]:
+    """year_hypotheses 를 start~end (양끝 포함) 전체에 대해 한 번에 – 캐시에 없는 해만 계산"""
+    return {y: year_hypotheses(birth_year, dominant_elem, y) for y in range(start, end + 1)}
+
+
+def warm_hypotheses_cache(birth_years: Sequence[int] = range(1950, 2011),
+                          years: Sequence[int] = range(1990, 2036),
+                          elems: Sequence[str] = ELEM_LABELS) -> int:
+    """서버 시작 시 자주 쓰는 (출생연도 × 우세오행 × 연도) 가설을 미리 채움. 채운 항목 수 반환.
+
+    years 는 연속 범위로 간주해 시드마다 topics_for_years 한 번으로 계산합니다.
+    """
+    if not years:
+        return 0
+    start, end = min(years), max(years)
+    n = 0
+    for by in birth_years:
+        for elem in elems:
+            picks = topics_for_years(f"{by}-{elem}", start, end, k=3)
+            for i, idxs in enumerate(picks):
+                HYPOTHESES_CACHE.put((by, elem, start + i), tuple(EVENT_CATS[j] for j in idxs))
+                n += 1
+    return n
+
+
+# =========================
+# 4) 사건 기반 사후 갱신 (사주 기반 사전 → 연도 응답 기반 사후)
+# =========================
+
+def _sigmoid(x: float, t: float = 1.0):
+    return 1.0/(1.0+math.exp(-x/t))
+
+@dataclass
+class MBTIPosterior:
+    axis: Dict[str, float]  # E,I,N,S,T,F,J,P 확률
+    top_codes: List[Tuple[str, float]]  # [(type, prob)]
+
+
+def _axis_vec_from_notes(notes: Dict[str, float]) -> List[float]:
+    # notes: {"E-I": x, "N-S": y, ...}  → 길이 8 축 확률 벡터
+    out = []
+    for name in AXIS_NAMES:
+        p = _sigmoid(notes.get(name, 0.0), t=1.2)
+        out += (p, 1-p)
+    return out
+
+
+def _axis_prob_from_notes(notes: Dict[str, float]) -> Dict[str, float]:
+    return axis_dict(_axis_vec_from_notes(notes))
+
+
+def _to_logit(p: float) -> float:
+    p = min(max(p, 1e-6), 1-1e-6)
+    return math.log(p/(1-p))
+
+
+def _to_prob(z: float) -> float:
+    return 1.0/(1.0+math.exp(-z))
+
+
+def answer_counts(exp_db: Dict[int, Dict[str, Dict[str, str]]]) -> List[int]:
+    """experience_db → 카테고리별 (맞다 수 − 틀리다 수) 정수 벡터 (인덱스 = CAT_INDEX)"""
+    counts = [0] * len(EVENT_AXIS_VECTORS)
+    cat_index, sign_of = CAT_INDEX.get, ANSWER_CODE.get
+    for cats in exp_db.values():
+        for cat, v in cats.items():
+            ci = cat_index(cat)
+            if ci is not None:
+                counts[ci] += sign_of(v.get("ans"), 0)  # 모름/패스·미선택: 0
+    return counts
+
+
+def _posterior_from_counts(axis: Sequence[float], counts: Sequence[int]) -> List[float]:
+    # 로지트 공간에서 z = logit(axis) + counts · W  (W = 카테고리×축 가중치 행렬)
+    z = [_to_logit(v) for v in axis]
+    for c, w in zip(counts, EVENT_AXIS_VECTORS):
+        if c:
+            z = [zk + c*wk for zk, wk in zip(z, w)]
+    return [_to_prob(zv) for zv in z]
+
+
+def _apply_event_update_vec(axis: Sequence[float], exp_db: Dict[int, Dict[str, Dict[str, str]]]) -> List[float]:
+    # axis: 길이 8 초기 확률(0~1). 응답을 카테고리별 ±1 개수로 모은 뒤 한 번에 갱신
+    return _posterior_from_counts(axis, answer_counts(exp_db))
+
+
+def _apply_event_update(axis: Dict[str, float], exp_db: Dict[int, Dict[str, Dict[str, str]]]) -> Dict[str, float]:
+    return axis_dict(_apply_event_update_vec(axis_vector(axis), exp_db))
+
+
+def _type_prob_from_vec(axis: Sequence[float], k: Optional[int] = None) -> List[Tuple[str, float]]:
+    # 4축 곱 분포 (k=None → 16유형 전체). 16칸뿐이라 전부 곱해 정렬하는 편이 top_k_product 힙보다 빠름
+    # (top_k_product 는 축이 늘어 조합이 큰 세분 유형용). 인덱스 비트 = TYPE_CODES 순서, 동률은 인덱스 순
+    e, i, n, s, t, f, j, p = axis
+    probs = [a*b*c*d for a in (e, i) for b in (n, s) for c in (t, f) for d in (j, p)]
+    norm = sum(probs) or 1.0
+    order = sorted(range(len(TYPE_CODES)), key=probs.__getitem__, reverse=True)
+    if k is not None:
+        order = order[:k]
+    return [(TYPE_CODES[ti], probs[ti]/norm) for ti in order]
+
+
+def _type_prob_from_axis(axis: Dict[str, float]) -> List[Tuple[str, float]]:
+    return _type_prob_from_vec(axis_vector(axis))
+
+
+def _prior_axis_vec(mbti_cands: List[MBTICandidate]) -> List[float]:
+    if not mbti_cands:
+        # 균등 사전
+        return [0.5] * len(Axis)
+    return _axis_vec_from_notes(mbti_cands[0].notes)
+
+
+def _posterior_result(axis1: Sequence[float]) -> MBTIPosterior:
+    top_codes = _type_prob_from_vec(axis1, k=5)
+    return MBTIPosterior(axis=axis_dict(axis1), top_codes=top_codes)
+
+
+def compute_posterior(mbti_cands: List[MBTICandidate], exp_db: Dict[int, Dict[str, Dict[str, str]]]) -> MBTIPosterior:
+    axis1 = _apply_event_update_vec(_prior_axis_vec(mbti_cands), exp_db)
+    return _posterior_result(axis1)
+
+
+class PosteriorAccumulator:
+    """축별 로지트 오프셋을 누적해 두는 사후 갱신기.
+
+    (year, category) 응답 하나가 바뀌면 이전 응답과의 부호 차이만큼 가중치 벡터를
+    더하므로 갱신이 O(1) 입니다 (전체 연도×카테고리 재계산 없음).
+    정수 counts 는 정확히 유지되고, float 오프셋은 reconcile() 로 전체 재계산과 대조합니다.
+    """
+
+    def __init__(self) -> None:
+        self.answers: Dict[Tuple[int, int], int] = {}  # (year, CAT_INDEX) → +1/−1/0
+        self.counts: List[int] = [0] * len(EVENT_AXIS_VECTORS)
+        self.offset: List[float] = [0.0] * len(Axis)
+
+    @classmethod
+    def from_db(cls, exp_db: Dict[int, Dict[str, Dict[str, str]]]) -> "PosteriorAccumulator":
+        acc = cls()
+        for year, cats in exp_db.items():
+            for cat, v in cats.items():
+                acc.set_answer(year, cat, v.get("ans"))
+        return acc
+
+    def set_answer(self, year: int, cat: str, ans: Optional[str]) -> bool:
+        """응답 하나 반영. 값이 실제로 바뀌었으면 True"""
+        ci = CAT_INDEX.get(cat)
+        if ci is None:
+            return False
+        new = ANSWER_CODE.get(ans, 0)
+        old = self.answers.get((year, ci), 0)
+        if new == old:
+            return False
+        self.answers[(year, ci)] = new
+        delta = new - old
+        self.counts[ci] += delta
+        self.offset = [o + delta*w for o, w in zip(self.offset, EVENT_AXIS_VECTORS[ci])]
+        return True
+
+    def posterior_vec(self, axis: Sequence[float]) -> List[float]:
+        return [_to_prob(_to_logit(v) + o) for v, o in zip(axis, self.offset)]
+
+    def compute(self, mbti_cands: List[MBTICandidate]) -> MBTIPosterior:
+        """compute_posterior(mbti_cands, exp_db) 와 같은 결과를 누적 오프셋으로 계산"""
+        return _posterior_result(self.posterior_vec(_prior_axis_vec(mbti_cands)))
+
+    def reconcile(self, exp_db: Optional[Dict[int, Dict[str, Dict[str, str]]]] = None) -> float:
+        """전체 재계산과 대조 후 오프셋을 재계산값으로 맞추고, 최대 오차를 반환.
+
+        exp_db 를 주면 그 응답 기준으로 counts 까지 다시 세며, counts 가 어긋났으면 inf 를 반환합니다.
+        """
+        counts = answer_counts(exp_db) if exp_db is not None else self.counts
+        drift = 0.0 if counts == self.counts else math.inf
+        if exp_db is not None:
+            fresh = PosteriorAccumulator.from_db(exp_db)
+            self.answers, self.counts = fresh.answers, fresh.counts
+
+        offset = [0.0] * len(Axis)
+        for c, w in zip(self.counts, EVENT_AXIS_VECTORS):
+            if c:
+                offset = [o + c*wk for o, wk in zip(offset, w)]
+        drift = max([drift] + [abs(a - b) for a, b in zip(self.offset, offset)])
+        self.offset = offset
+        return drift
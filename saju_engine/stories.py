@@ -0,0 +1,186 @@
+# saju_engine/stories.py
+# -------------------------------------------------------------
+# MBTI × 오행 스토리 인덱스 – YAML 원본을 미리 검증·색인한 marshal 파일로 컴파일
+# -------------------------------------------------------------
+# 원본   : data/element_stories.yaml  (MBTI → 오행(wood/fire/earth/metal/water) → 스토리)
+# 산출물 : data/element_stories.idx   ({(mbti, elem): story} + 원본 mtime/크기, 파이썬 버전)
+#
+# 런타임은 산출물만 읽고 story_for(mbti, elem) 는 dict 조회 한 번.
+# 인덱스는 프로세스당 하나, 읽기 전용(MappingProxyType/tuple)이라 세션 간 복사 없이 공유합니다.
+# 원본이 바뀌었거나(mtime_ns/크기) 다른 파이썬 버전이 만든 산출물이면 자동으로 다시 빌드합니다
+# (PyYAML 은 이때만 import). 경로는 패키지 위치 기준이라 CWD 와 무관합니다.
+#
+# 빌드/검증: python -m saju_engine.stories [--strict]
+#   스키마 오류(필드 누락·타입 오류·알 수 없는 MBTI/오행)는 항상 실패,
+#   비어 있는 (MBTI, 오행) 조합은 경고 – --strict 면 실패.
+# 런타임(story_for)은 화면을 깨지 않도록 관대하게: 오류는 로그로 남기고 문제 있는 조합만
+# 빈 스토리로 대신합니다 (이때는 산출물을 쓰지 않아 프로세스마다 다시 보고).
+# -------------------------------------------------------------
+
+import logging
+import marshal
+import os
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from .codes import Elem, TYPE_CODES
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+STORY_SOURCE = DATA_DIR / "element_stories.yaml"
+STORY_INDEX = DATA_DIR / "element_stories.idx"
+
+STORY_ELEMS: Tuple[str, ...] = tuple(e.name.lower() for e in Elem)
+# 필드 → 허용 타입 (list 는 문자열 목록)
+STORY_FIELDS: Dict[str, type] = {
+    "title": str, "emoji": str, "keywords": list, "personality": str, "career": list, "relationships": str,
+}
+_FORMAT = 1
+
+log = logging.getLogger(__name__)
+
+StoryKey = Tuple[str, str]
+
+
+class StorySchemaError(ValueError):
+    pass
+
+
+def _source_stamp(path: Path) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def validate_stories(raw: Any, on_error: Optional[Callable[[str], Any]] = None
+                     ) -> Tuple[Dict[StoryKey, Dict[str, Any]], List[StoryKey]]:
+    """YAML 원본 → ({(mbti, elem): story}, 빠진 조합). 스키마 오류는 StorySchemaError 로 한꺼번에 보고.
+
+    on_error 를 주면 예외 대신 오류마다 호출하고, 문제 있는 스토리는 빼고(= 빠진 조합) 계속합니다.
+    """
+    errors: List[str] = []
+    index: Dict[StoryKey, Dict[str, Any]] = {}
+    if not isinstance(raw, dict):
+        raise StorySchemaError("top level must be a mapping of MBTI → element → story")
+    for mbti, by_elem in raw.items():
+        if mbti not in TYPE_CODES:
+            errors.append(f"{mbti}: unknown MBTI type")
+            continue
+        if not isinstance(by_elem, dict):
+            errors.append(f"{mbti}: must map element → story")
+            continue
+        for elem, story in by_elem.items():
+            where = f"{mbti}.{elem}"
+            n_errors = len(errors)
+            if elem not in STORY_ELEMS:
+                errors.append(f"{where}: unknown element (expected one of {', '.join(STORY_ELEMS)})")
+                continue
+            if not isinstance(story, dict):
+                errors.append(f"{where}: story must be a mapping")
+                continue
+            for field, typ in STORY_FIELDS.items():
+                v = story.get(field)
+                if not isinstance(v, typ):
+                    errors.append(f"{where}.{field}: expected {typ.__name__}, got {type(v).__name__}")
+                elif typ is list and not all(isinstance(x, str) for x in v):
+                    errors.append(f"{where}.{field}: expected a list of strings")
+            extra = set(story) - set(STORY_FIELDS)
+            if extra:
+                errors.append(f"{where}: unknown fields {sorted(extra)}")
+            if len(errors) == n_errors or on_error is None:
+                index[mbti, elem] = {k: story[k] for k in STORY_FIELDS if k in story}
+    if errors and on_error is None:
+        raise StorySchemaError("invalid story file:\n  " + "\n  ".join(errors))
+    for err in errors:
+        on_error(err)
+    missing = [(m, e) for m in TYPE_CODES for e in STORY_ELEMS if (m, e) not in index]
+    return index, missing
+
+
+def build_story_index(source: Path = STORY_SOURCE, target: Optional[Path] = STORY_INDEX,
+                      strict: bool = False, on_error: Optional[Callable[[str], Any]] = None
+                      ) -> Tuple[Dict[StoryKey, Dict[str, Any]], List[StoryKey]]:
+    """YAML 을 파싱·검증해 인덱스를 만들고 target 에 기록 (쓰기 실패는 무시 – 메모리 인덱스는 그대로 사용).
+    on_error 는 validate_stories 와 같음 – 오류가 있었으면 target 에 기록하지 않음"""
+    import yaml
+
+    stamp = _source_stamp(source)
+    errors: List[str] = []
+    with open(source, encoding="utf-8") as f:
+        index, missing = validate_stories(yaml.safe_load(f) or {}, None if on_error is None else errors.append)
+    for err in errors:
+        on_error(err)
+    if errors:
+        target = None
+    if strict and missing:
+        raise StorySchemaError(f"{len(missing)} MBTI × element combos have no story: "
+                               + ", ".join(f"{m}.{e}" for m, e in missing))
+    if target is not None:
+        payload = {"format": _FORMAT, "python": sys.version_info[:2], "source": stamp, "index": index}
+        tmp = target.with_suffix(".tmp")
+        try:
+            tmp.write_bytes(marshal.dumps(payload))
+            os.replace(tmp, target)
+        except OSError:
+            pass  # 읽기 전용 배포 – 다음 프로세스에서 다시 빌드
+    return index, missing
+
+
+def _freeze(story: Dict[str, Any]) -> Mapping[str, Any]:
+    return MappingProxyType({k: tuple(v) if isinstance(v, list) else v for k, v in story.items()})
+
+
+def load_story_index(source: Path = STORY_SOURCE,
+                     target: Path = STORY_INDEX) -> Mapping[StoryKey, Mapping[str, Any]]:
+    """컴파일된 인덱스 (원본보다 오래됐으면 다시 빌드). 원본이 없으면 빈 인덱스"""
+    if not source.exists():
+        return MappingProxyType({})
+    try:
+        payload = marshal.loads(target.read_bytes())
+        fresh = (payload.get("format") == _FORMAT and tuple(payload.get("python", ())) == sys.version_info[:2]
+                 and tuple(payload.get("source", ())) == _source_stamp(source))
+    except (OSError, EOFError, ValueError, TypeError, AttributeError):
+        fresh = False
+    if fresh:
+        index = payload["index"]
+    else:
+        try:
+            index = build_story_index(source, target, on_error=lambda e: log.error("story file: %s", e))[0]
+        except Exception as e:  # YAML 문법 오류·PyYAML 없음 등 – 스토리 없이 계속
+            log.error("story file %s unusable, showing no stories: %s", source, e)
+            index = {}
+    return MappingProxyType({key: _freeze(story) for key, story in index.items()})
+
+
+_INDEX: Optional[Mapping[StoryKey, Mapping[str, Any]]] = None
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def story_for(mbti: str, elem: str) -> Mapping[str, Any]:
+    """(MBTI, 오행) 스토리 – 없으면 빈 dict. 인덱스는 프로세스당 한 번 로드"""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = load_story_index()
+    return _INDEX.get((mbti, elem), _EMPTY)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    import argparse
+
+    ap = argparse.ArgumentParser(prog="python -m saju_engine.stories", description="스토리 YAML → 인덱스 컴파일")
+    ap.add_argument("--source", type=Path, default=STORY_SOURCE)
+    ap.add_argument("--target", type=Path, default=STORY_INDEX)
+    ap.add_argument("--strict", action="store_true", help="빠진 MBTI × 오행 조합이 있으면 실패")
+    args = ap.parse_args(argv)
+    try:
+        index, missing = build_story_index(args.source, args.target, strict=args.strict)
+    except StorySchemaError as e:
+        sys.exit(str(e))
+    print(f"{len(index)} stories → {args.target}")
+    if missing:
+        print(f"warning: {len(missing)}/{len(TYPE_CODES) * len(STORY_ELEMS)} combos missing: "
+              + ", ".join(f"{m}.{e}" for m, e in missing), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# saju_engine/tables.py
+# -------------------------------------------------------------
+# 간지·오행·사건 카테고리 기본 테이블 (순수 데이터, 외부 의존 없음)
+# 궁합(v3) 테이블은 프로세스 전역 읽기 전용 매핑(MappingProxyType) – 모든 세션이 같은 객체를 복사 없이 공유
+# -------------------------------------------------------------
+
+from types import MappingProxyType
+
+STEMS = ["갑","을","병","정","무","기","경","신","임","계"]  # 10간
+BRANCHES = ["자","축","인","묘","진","사","오","미","신","유","술","해"]  # 12지
+STEM_TO_YIN_YANG = {"갑":"양","을":"음","병":"양","정":"음","무":"양","기":"음","경":"양","신":"음","임":"양","계":"음"}
+# 매우 단순화된 오행 매핑 (연간/연지 기준)
+STEM_TO_ELEM = {"갑":"목","을":"목","병":"화","정":"화","무":"토","기":"토","경":"금","신":"금","임":"수","계":"수"}
+BRANCH_TO_ELEM = {"자":"수","축":"토","인":"목","묘":"목","진":"토","사":"화","오":"화","미":"토","신":"금","유":"금","술":"토","해":"수"}
+ELEM_LIST = ["목","화","토","금","수"]
+ELEM_COLORS = {"목":"#22c55e","화":"#ef4444","토":"#eab308","금":"#6b7280","수":"#3b82f6"}
+
+# 카테고리 후보 (연도별 가설 생성에 사용)
+EVENT_CATS = [
+    ("이동·이사", "주거지 이동/원거리 이동/팀 이동"),
+    ("직장·커리어", "입사·이직·승진·프로젝트 피크/슬럼프"),
+    ("연애·관계", "연애 시작/종결, 동료/가족 관계 변화"),
+    ("건강·컨디션", "수면·질병·부상·체력 변화"),
+    ("금전·투자", "수입 변동·빚·투자 수익/손실"),
+    ("학습·자격", "공부 몰입/자격증/연구 성과"),
+    ("창업·사이드", "부업/창업/콘텐츠·앱 론칭")
+]
+
+# 연도별 응답을 통해 MBTI 축(E/I, N/S, T/F, J/P)을 갱신하는 가중치 (교육용 근사)
+EVENT_TO_AXIS_WEIGHTS = {
+    "이동·이사": {"E": +0.40, "P": +0.30, "I": -0.20, "J": -0.20},
+    "직장·커리어": {"J": +0.40, "T": +0.30, "P": -0.20},
+    "연애·관계": {"F": +0.40, "E": +0.20, "T": -0.20},
+    "건강·컨디션": {"I": +0.30, "J": +0.20},
+    "금전·투자": {"T": +0.40, "J": +0.20, "F": -0.20},
+    "학습·자격": {"N": +0.30, "J": +0.30, "S": -0.10, "P": -0.10},
+    "창업·사이드": {"E": +0.30, "N": +0.30, "P": +0.30, "J": -0.20},
+}
+
+
+# ---- MBTI × 오행 궁합(v3) ----
+MBTI_LIST = ("INTP","INTJ","ENTP","ENTJ","INFJ","INFP","ENFJ","ENFP",
+             "ISTJ","ISFJ","ESTJ","ESFJ","ISTP","ISFP","ESTP","ESFP")
+
+# MBTI 별 오행 가중치 (키: wood/fire/earth/metal/water)
+MBTI_ELEMENTS = MappingProxyType({mbti: MappingProxyType(w) for mbti, w in {
+    "INTP": {"wood":3,"fire":1,"earth":2,"metal":5,"water":2},
+    "INTJ": {"wood":2,"fire":1,"earth":2,"metal":4,"water":4},
+    "ENTP": {"wood":5,"fire":2,"earth":1,"metal":3,"water":1},
+    "ENTJ": {"wood":3,"fire":5,"earth":2,"metal":4,"water":1},
+    "ENFP": {"wood":5,"fire":4,"earth":1,"metal":1,"water":2},
+    "INFJ": {"wood":2,"fire":3,"earth":1,"metal":2,"water":5},
+    "INFP": {"wood":3,"fire":4,"earth":1,"metal":1,"water":4},
+    "ISTJ": {"wood":1,"fire":1,"earth":5,"metal":4,"water":1},
+    "ISFJ": {"wood":2,"fire":3,"earth":5,"metal":1,"water":2},
+    "ISFP": {"wood":3,"fire":3,"earth":2,"metal":1,"water":4},
+    "ESTJ": {"wood":1,"fire":2,"earth":5,"metal":4,"water":1},
+    "ESFJ": {"wood":2,"fire":5,"earth":4,"metal":1,"water":1},
+    "ISTP": {"wood":2,"fire":1,"earth":3,"metal":5,"water":1},
+    "ESTP": {"wood":4,"fire":2,"earth":3,"metal":3,"water":1},
+    "ESFP": {"wood":5,"fire":4,"earth":2,"metal":1,"water":1},
+    "ENFJ": {"wood":3,"fire":4,"earth":2,"metal":1,"water":3},
+}.items()})
+
+ELEMENT_KR = MappingProxyType({"wood":"목","fire":"화","earth":"토","metal":"금","water":"수"})
+ELEMENT_COLOR = MappingProxyType({"wood":"#2ecc71","fire":"#e74c3c","earth":"#f39c12","metal":"#95a5a6","water":"#3498db"})
+# 출생 월 → 월령 오행 (사주 가중 +2)
+MONTH_ELEMENT = MappingProxyType({1:"water",2:"wood",3:"wood",4:"wood",5:"fire",6:"fire",
+                                  7:"earth",8:"metal",9:"metal",10:"metal",11:"water",12:"water"})
+
+# 인생 사건 프리셋
+EVENT_PRESETS = MappingProxyType({name: MappingProxyType(p) for name, p in {
+    "전직/이직": {"element":"wood", "emotion_avg":0, "duration":"3-6m"},
+    "승진/역할변화": {"element":"fire", "emotion_avg":1, "duration":"1-3m"},
+    "연애시작": {"element":"fire", "emotion_avg":2, "duration":"weeks"},
+    "이별/이혼": {"element":"water", "emotion_avg":-2, "duration":"6-12m"},
+    "이사/해외이주": {"element":"earth", "emotion_avg":0, "duration":"3-6m"},
+    "가족사건": {"element":"earth", "emotion_avg":-1, "duration":"12m+"},
+    "건강이슈": {"element":"metal", "emotion_avg":-1, "duration":"6-12m"},
+    "경제적상승": {"element":"metal", "emotion_avg":1, "duration":"3-6m"},
+    "경제적하락": {"element":"water", "emotion_avg":-1, "duration":"6-12m"},
+    "창작/출시": {"element":"wood", "emotion_avg":1, "duration":"1-3m"},
+}.items()})
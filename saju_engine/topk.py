@@ -0,0 +1,61 @@
+# saju_engine/topk.py
+# -------------------------------------------------------------
+# 독립 축 곱 분포의 상위 k개 – 전체 조합(∏ 선택지 수)을 만들지 않는 best-first 탐색
+# -------------------------------------------------------------
+# MBTI 16유형(2×2×2×2)뿐 아니라 A/T(터뷸런트/어서티브), 인지기능 스택처럼
+# 축이 늘어나 조합이 폭발하는 세분 유형에도 그대로 씁니다.
+# 정규화 상수는 축별 합의 곱(독립 가정)이라 전체 합을 열거할 필요가 없습니다.
+# -------------------------------------------------------------
+
+import heapq
+from typing import List, Optional, Sequence, Tuple
+
+
+def top_k_product(axes: Sequence[Sequence[float]], k: Optional[int] = None) -> List[Tuple[Tuple[int, ...], float]]:
+    """축별 선택지 확률 목록 → 곱 확률 상위 k개 [(축별 선택지 인덱스, 정규화 확률)].
+
+    k=None 이면 전체 조합. 동률은 선택지 인덱스 사전순(= 중첩 for 문 열거 순서)으로
+    정렬해 기존 전체 열거 + 안정 정렬과 같은 순서를 냅니다.
+    탐색량은 O(k · 축 수 · log) 입니다.
+    """
+    # 축마다 (확률 내림차순, 원래 인덱스 오름차순) 으로 정렬한 선택지
+    order = [sorted(range(len(ps)), key=lambda i, ps=ps: (-ps[i], i)) for ps in axes]
+    norm = 1.0
+    for ps in axes:
+        norm *= sum(ps)
+    norm = norm or 1.0
+    total = 1
+    for ps in axes:
+        total *= len(ps)
+    k = total if k is None else min(k, total)
+    if k <= 0:
+        return []
+
+    def node(pos: Tuple[int, ...]):
+        idx = tuple(o[j] for o, j in zip(order, pos))
+        p = 1.0
+        for ps, i in zip(axes, idx):
+            p *= ps[i]
+        return (-p, idx, pos)
+
+    # 각 조합의 부모 = 마지막(가장 뒤) 0이 아닌 축 위치를 하나 줄인 조합 → 자식은 그 축 이후만 증가.
+    # 부모 키 ≤ 자식 키 이므로 힙에서 꺼내는 순서가 곧 전역 순위 (중복 없이 각 조합 한 번씩).
+    out = []
+    heap = [node((0,) * len(axes))]
+    while heap and len(out) < k:
+        negp, idx, pos = heapq.heappop(heap)
+        out.append((idx, -negp/norm))
+        last = max((a for a, j in enumerate(pos) if j), default=0)
+        for a in range(last, len(axes)):
+            if pos[a] + 1 < len(order[a]):
+                heapq.heappush(heap, node(pos[:a] + (pos[a] + 1,) + pos[a+1:]))
+    return out
+
+
+def top_k_codes(axes: Sequence[Sequence[Tuple[str, float]]], k: Optional[int] = None) -> List[Tuple[str, float]]:
+    """라벨 붙은 축 → 상위 k개 (라벨 이어붙인 코드, 확률).
+
+    예: [[("E", .7), ("I", .3)], ..., [("-A", .6), ("-T", .4)]] → [("ENTJ-A", ...), ...]
+    """
+    probs = [[p for _, p in ax] for ax in axes]
+    return [("".join(axes[a][i][0] for a, i in enumerate(idx)), p) for idx, p in top_k_product(probs, k)]
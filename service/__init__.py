@@ -0,0 +1,16 @@
+"""service – Streamlit 없이 쓰는 사주 → MBTI 스코어링 HTTP/JSON API.
+
+표준 라이브러리 asyncio 만으로 동작하며, 엔진 캐시는 프로세스 하나가 모든 연결에 공유합니다.
+
+    python -m service [--host 127.0.0.1] [--port 8765]
+    python -m service.loadgen --spawn --endpoint mix --duration 10
+
+핸들러는 HTTP 와 무관한 함수라 직접 호출할 수도 있습니다:
+    from service import score, handle
+    handle(score, [{"birth_year": 1990}, {"birth_year": 1991}])
+"""
+
+from .api import ApiError, handle, hypotheses, posterior, score
+from .server import dispatch, handle_connection, serve
+
+__all__ = ["ApiError", "handle", "hypotheses", "posterior", "score", "dispatch", "handle_connection", "serve"]
@@ -0,0 +1,35 @@
+# service/__main__.py
+# -------------------------------------------------------------
+# 스코어링 API 서버 실행
+#   python -m service [--host 127.0.0.1] [--port 8765] [--no-warm]
+# -------------------------------------------------------------
+
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+
+from saju_engine import warm_hypotheses_cache
+
+from .server import serve
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(prog="python -m service", description="사주 → MBTI 스코어링 HTTP/JSON API")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--no-warm", action="store_true", help="시작 시 가설 캐시 예열 생략")
+    args = ap.parse_args(argv)
+
+    if not args.no_warm:
+        t0 = time.perf_counter()
+        n = warm_hypotheses_cache()
+        print(f"warmed {n} hypotheses in {(time.perf_counter() - t0) * 1000:.0f} ms", flush=True)
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+# service/api.py
+# -------------------------------------------------------------
+# 스코어링 API 핸들러 – JSON 값(dict) → JSON 값. HTTP 와 무관해 배치 작업·테스트에서도 그대로 호출
+# -------------------------------------------------------------
+# score(req)      {"birth_year": 1990, "tweak": {"목": 0.1, ...}}
+#                 → 간지 요약 + 오행 가중치 + infer_mbti_from_elements 후보
+# posterior(req)  {"birth_year": 1990, "tweak": {...}, "answers": {"2020": {"직장·커리어": "맞다", ...}}}
+#                 → compute_posterior 의 축 확률 + 상위 유형
+#                 응답 값은 라벨("맞다"/"틀리다"/"모름/패스"), 정수(1/-1/0), {"ans": 라벨} 모두 허용
+# hypotheses(req) {"birth_year": 1990, "elem": "목", "from": 2015, "to": 2025}
+#                 → {연도: [[카테고리, 설명], ...]} (HYPOTHESES_CACHE 공유)
+#                 from 기본값은 출생연도, to 기본값은 from + 10 (YEAR_MAX 를 넘지 않게)
+# 오행은 한글(목화토금수)·영문(wood/fire/earth/metal/water) 모두 허용합니다.
+#
+# 배치: handle(fn, body) 에 배열을 주면 항목마다 결과를 같은 순서로 반환하고,
+# 잘못된 항목은 {"error": ...} 로 대신합니다 (배치 전체를 실패시키지 않음).
+# -------------------------------------------------------------
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from saju_engine import (
+    ELEM_LIST, Elem, compute_posterior, elem_weights_for_year, infer_mbti_from_elements,
+    saju_year_summary, year_hypotheses_range,
+)
+from saju_engine.cache import LRUCache
+from saju_engine.codes import ANSWER_LABELS, CAT_INDEX
+
+YEAR_MIN, YEAR_MAX = 1900, 2100
+MAX_RANGE = 200  # /hypotheses 한 요청의 최대 연도 수
+MAX_BATCH = 1000  # 배열 요청 한 번의 최대 항목 수
+
+_ELEM_ALIASES: Dict[str, str] = {**{e: e for e in ELEM_LIST},
+                                 **{e.name.lower(): ELEM_LIST[e] for e in Elem}}
+
+Handler = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class ApiError(ValueError):
+    """요청 오류 – status 는 HTTP 상태 코드"""
+
+    def __init__(self, message: str, status: int = 400) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+# ---- 입력 검증 ----
+def _obj(req: Any) -> Dict[str, Any]:
+    if not isinstance(req, dict):
+        raise ApiError("request must be a JSON object (or an array of objects)")
+    return req
+
+
+def _year(req: Dict[str, Any], field: str, default: Optional[int] = None) -> int:
+    v = req.get(field, default)
+    if v is None:
+        raise ApiError(f"missing field: {field}")
+    try:
+        y = int(v)
+    except (TypeError, ValueError):
+        raise ApiError(f"{field}: expected an integer year, got {v!r}") from None
+    if not YEAR_MIN <= y <= YEAR_MAX:
+        raise ApiError(f"{field}: {y} out of range {YEAR_MIN}..{YEAR_MAX}")
+    return y
+
+
+def _elem(v: Any, field: str = "elem") -> str:
+    elem = _ELEM_ALIASES.get(v.lower() if isinstance(v, str) else v)
+    if elem is None:
+        raise ApiError(f"{field}: unknown element {v!r} (expected one of {', '.join(_ELEM_ALIASES)})")
+    return elem
+
+
+def _tweak(req: Dict[str, Any]) -> Tuple[Tuple[str, float], ...]:
+    raw = req.get("tweak") or {}
+    if not isinstance(raw, dict):
+        raise ApiError("tweak: expected an object {element: weight}")
+    out: Dict[str, float] = {}
+    for k, v in raw.items():
+        try:
+            out[_elem(k, "tweak")] = float(v)
+        except (TypeError, ValueError):
+            raise ApiError(f"tweak.{k}: expected a number, got {v!r}") from None
+    return tuple(sorted((k, v) for k, v in out.items() if v))
+
+
+def _answer(v: Any) -> Optional[str]:
+    if isinstance(v, dict):
+        v = v.get("ans")
+    if isinstance(v, bool):
+        v = int(v)
+    if isinstance(v, int):
+        return ANSWER_LABELS.get(max(-1, min(1, v)))  # Answer 는 IntEnum (-1/0/1)
+    return v if v in ANSWER_LABELS.values() else None
+
+
+def _exp_db(req: Dict[str, Any]) -> Dict[int, Dict[str, Dict[str, str]]]:
+    raw = req.get("answers") or {}
+    if not isinstance(raw, dict):
+        raise ApiError("answers: expected an object {year: {category: answer}}")
+    db: Dict[int, Dict[str, Dict[str, str]]] = {}
+    for year, cats in raw.items():
+        if not isinstance(cats, dict):
+            raise ApiError(f"answers.{year}: expected an object {{category: answer}}")
+        try:
+            y = int(year)
+        except (TypeError, ValueError):
+            raise ApiError(f"answers: {year!r} is not a year") from None
+        for cat, v in cats.items():
+            if cat not in CAT_INDEX:
+                raise ApiError(f"answers.{year}: unknown category {cat!r}")
+            ans = _answer(v)
+            if ans is None:
+                raise ApiError(f"answers.{year}.{cat}: unknown answer {v!r}")
+            db.setdefault(y, {})[cat] = {"ans": ans}
+    return db
+
+
+# ---- 엔진 호출 (출생연도 × 보정값이 같으면 사전 결과 재사용) ----
+SCORE_CACHE = LRUCache(maxsize=20_000)
+
+
+def _prior(birth_year: int, tweak: Tuple[Tuple[str, float], ...]) -> Tuple[Any, Dict[str, float], List[Any]]:
+    key = (birth_year, tweak)
+    hit = SCORE_CACHE.get(key)
+    if hit is None:
+        yr = saju_year_summary(birth_year)
+        weights = elem_weights_for_year(yr, dict(tweak) if tweak else None)
+        hit = (yr, weights, infer_mbti_from_elements(weights, yr.yin_yang))
+        SCORE_CACHE.put(key, hit)
+    return hit
+
+
+def score(req: Dict[str, Any]) -> Dict[str, Any]:
+    req = _obj(req)
+    birth_year = _year(req, "birth_year")
+    yr, weights, cands = _prior(birth_year, _tweak(req))
+    return {
+        "birth_year": birth_year,
+        "ganzhi": yr.stem + yr.branch, "yin_yang": yr.yin_yang,
+        "stem_elem": yr.stem_elem, "branch_elem": yr.branch_elem,
+        "weights": weights,
+        "dominant_elem": max(weights, key=weights.get),
+        "candidates": [{"code": c.code, "score": c.score, "notes": c.notes} for c in cands],
+    }
+
+
+def posterior(req: Dict[str, Any]) -> Dict[str, Any]:
+    req = _obj(req)
+    birth_year = _year(req, "birth_year")
+    _, _, cands = _prior(birth_year, _tweak(req))
+    post = compute_posterior(cands, _exp_db(req))
+    return {
+        "birth_year": birth_year,
+        "prior": cands[0].code if cands else None,
+        "axis": post.axis,
+        "top_codes": [{"code": code, "prob": p} for code, p in post.top_codes],
+    }
+
+
+def hypotheses(req: Dict[str, Any]) -> Dict[str, Any]:
+    req = _obj(req)
+    birth_year = _year(req, "birth_year")
+    if req.get("elem") is None:
+        raise ApiError("missing field: elem")
+    elem = _elem(req["elem"])
+    start = _year(req, "from", birth_year)
+    end = _year(req, "to", min(start + 10, YEAR_MAX))
+    if end < start:
+        raise ApiError(f"to ({end}) must not be before from ({start})")
+    if end - start + 1 > MAX_RANGE:
+        raise ApiError(f"range too large: {end - start + 1} years (max {MAX_RANGE})")
+    hyps = year_hypotheses_range(birth_year, elem, start, end)
+    return {"birth_year": birth_year, "elem": elem,
+            "years": {str(y): [list(h) for h in hs] for y, hs in hyps.items()}}
+
+
+def handle(fn: Handler, body: Any) -> Any:
+    """단건(객체) → 결과 객체 (오류는 ApiError), 배치(배열) → 항목별 결과/오류 배열"""
+    if not isinstance(body, list):
+        return fn(body)
+    if len(body) > MAX_BATCH:
+        raise ApiError(f"batch too large: {len(body)} items (max {MAX_BATCH})", 413)
+    out = []
+    for item in body:
+        try:
+            out.append(fn(item))
+        except ApiError as e:
+            out.append({"error": str(e)})
+    return out
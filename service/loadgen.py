@@ -0,0 +1,162 @@
+# service/loadgen.py
+# -------------------------------------------------------------
+# 로컬 부하 생성기 – keep-alive 연결 N 개로 요청을 쉬지 않고 보내 처리량·지연을 측정
+# -------------------------------------------------------------
+#   python -m service.loadgen --spawn [--cpu 0] --endpoint mix --concurrency 64 --duration 10
+#   python -m service.loadgen --port 8765 --endpoint posterior --batch 50
+#
+# --spawn  : 서버(python -m service)를 자식 프로세스로 띄우고 끝나면 종료. --cpu 를 주면 서버를 그 코어 하나에 고정
+# endpoint : score | posterior | hypotheses (GET) | mix (셋을 번갈아)
+# --batch N: 배열 본문으로 N 건씩 (hypotheses 는 POST)
+# 요청 본문은 미리 만들어 두고(출생연도 1950~2010 순환) 생성기 쪽 비용을 최소화합니다.
+# 결과: 요청/초, 항목/초, 지연 p50/p95/p99/max (ms), 상태 코드별 개수. --json 이면 JSON 한 줄
+# -------------------------------------------------------------
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from saju_engine.codes import CAT_LABELS
+
+ENDPOINTS = ("score", "posterior", "hypotheses")
+
+
+def _payload(endpoint: str, birth_year: int) -> Dict[str, Any]:
+    if endpoint == "score":
+        return {"birth_year": birth_year, "tweak": {"목": 0.1} if birth_year % 3 == 0 else {}}
+    if endpoint == "posterior":
+        answers = {str(birth_year + 20 + i): {CAT_LABELS[i % len(CAT_LABELS)]: (1, -1, 0)[(birth_year + i) % 3]}
+                   for i in range(10)}
+        return {"birth_year": birth_year, "answers": answers}
+    return {"birth_year": birth_year, "elem": "목화토금수"[birth_year % 5],
+            "from": birth_year + 20, "to": birth_year + 40}
+
+
+def _request(host: str, endpoint: str, birth_year: int, batch: int) -> bytes:
+    if endpoint == "hypotheses" and batch <= 1:
+        return (f"GET /hypotheses?{urlencode(_payload(endpoint, birth_year))} HTTP/1.1\r\n"
+                f"Host: {host}\r\n\r\n").encode("utf-8")
+    body: Any = _payload(endpoint, birth_year)
+    if batch > 1:
+        body = [_payload(endpoint, 1950 + (birth_year + i) % 61) for i in range(batch)]
+    data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+    return (f"POST /{endpoint} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n\r\n").encode("latin-1") + data
+
+
+def build_requests(host: str, endpoint: str, batch: int = 1) -> List[bytes]:
+    names = ENDPOINTS if endpoint == "mix" else (endpoint,)
+    return [_request(host, name, by, batch) for by in range(1950, 2011) for name in names]
+
+
+async def _worker(host: str, port: int, requests: List[bytes], offset: int, deadline: float,
+                  latencies: List[float], statuses: Counter) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    clock = time.perf_counter
+    try:
+        for req in itertools.islice(itertools.cycle(requests), offset, None):
+            if clock() >= deadline:
+                break
+            t0 = clock()
+            writer.write(req)
+            head = await reader.readuntil(b"\r\n\r\n")
+            status = int(head[9:12])
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line[:15].lower() == b"content-length:":
+                    length = int(line[15:])
+            await reader.readexactly(length)
+            latencies.append(clock() - t0)
+            statuses[status] += 1
+    finally:
+        writer.close()
+
+
+async def run_load(host: str, port: int, requests: List[bytes], concurrency: int,
+                   duration: float) -> Tuple[List[float], Counter, float]:
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    t0 = time.perf_counter()
+    deadline = t0 + duration
+    await asyncio.gather(*(_worker(host, port, requests, i * 7, deadline, latencies, statuses)
+                           for i in range(concurrency)))
+    return latencies, statuses, time.perf_counter() - t0
+
+
+def _pct(sorted_vals: List[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    return sorted_vals[min(len(sorted_vals) - 1, int(q * len(sorted_vals)))]
+
+
+def summarize(latencies: List[float], statuses: Counter, elapsed: float, batch: int) -> Dict[str, Any]:
+    lat = sorted(latencies)
+    n = len(lat)
+    return {
+        "requests": n, "elapsed_s": round(elapsed, 3),
+        "rps": round(n / elapsed, 1) if elapsed else 0.0,
+        "items_per_s": round(n * max(batch, 1) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {k: round(_pct(lat, q) * 1000, 3) for k, q in
+                       (("p50", 0.50), ("p95", 0.95), ("p99", 0.99), ("max", 1.0))},
+        "status": {str(k): v for k, v in sorted(statuses.items())},
+    }
+
+
+def _spawn(port: int, cpu: Optional[int]) -> subprocess.Popen:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.Popen([sys.executable, "-m", "service", "--port", str(port)], cwd=root,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(proc.pid, {cpu})
+    for line in proc.stdout:  # 예열이 끝나고 리슨을 시작할 때까지 대기
+        if line.startswith("saju scoring service on"):
+            return proc
+    raise RuntimeError(f"service exited with {proc.wait()} before listening")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(prog="python -m service.loadgen", description="스코어링 API 부하 생성기")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--endpoint", choices=[*ENDPOINTS, "mix"], default="mix")
+    ap.add_argument("--concurrency", type=int, default=64, help="동시 keep-alive 연결 수")
+    ap.add_argument("--duration", type=float, default=10.0, help="측정 시간 (초)")
+    ap.add_argument("--warmup", type=float, default=1.0, help="측정 전 예열 시간 (초)")
+    ap.add_argument("--batch", type=int, default=1, help="요청 하나에 담을 항목 수 (배열 본문)")
+    ap.add_argument("--spawn", action="store_true", help="서버를 자식 프로세스로 띄워서 측정")
+    ap.add_argument("--cpu", type=int, help="--spawn 서버를 고정할 CPU 코어")
+    ap.add_argument("--json", action="store_true", help="결과를 JSON 한 줄로 출력")
+    args = ap.parse_args(argv)
+
+    proc = _spawn(args.port, args.cpu) if args.spawn else None
+    try:
+        requests = build_requests(args.host, args.endpoint, args.batch)
+        if args.warmup > 0:
+            asyncio.run(run_load(args.host, args.port, requests, args.concurrency, args.warmup))
+        result = summarize(*asyncio.run(run_load(args.host, args.port, requests, args.concurrency,
+                                                 args.duration)), batch=args.batch)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+    result.update(endpoint=args.endpoint, concurrency=args.concurrency, batch=args.batch)
+    if args.json:
+        print(json.dumps(result))
+        return
+    lat = result["latency_ms"]
+    print(f"{args.endpoint} ×{args.batch}  c={args.concurrency}  {result['requests']} req in {result['elapsed_s']}s")
+    print(f"  {result['rps']:.0f} req/s  ({result['items_per_s']:.0f} items/s)")
+    print(f"  latency ms  p50 {lat['p50']}  p95 {lat['p95']}  p99 {lat['p99']}  max {lat['max']}")
+    print(f"  status {result['status']}")
+
+
+if __name__ == "__main__":
+    main()
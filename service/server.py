@@ -0,0 +1,136 @@
+# service/server.py
+# -------------------------------------------------------------
+# 최소 asyncio HTTP/1.1 서버 – 외부 의존성 없음 (keep-alive, Content-Length 본문, JSON 응답)
+# -------------------------------------------------------------
+# 라우트
+#   POST /score        본문: 객체 또는 배열
+#   POST /posterior    본문: 객체 또는 배열
+#   GET  /hypotheses?birth_year=1990&elem=목&from=2015&to=2025
+#   POST /hypotheses   본문: 객체 또는 배열 (쿼리와 같은 필드)
+#   GET  /healthz      캐시 통계
+# 핸들러(service/api.py)는 마이크로초 단위의 순수 계산이라 이벤트 루프에서 바로 실행합니다.
+# 엔진 캐시(HYPOTHESES_CACHE, SCORE_CACHE)는 프로세스 하나가 모든 연결에 공유합니다.
+# chunked 요청 본문은 지원하지 않습니다 (411).
+# -------------------------------------------------------------
+
+import asyncio
+import json
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from saju_engine import HYPOTHESES_CACHE
+
+from .api import SCORE_CACHE, ApiError, handle, hypotheses, posterior, score
+
+MAX_BODY = 1 << 20
+MAX_HEADERS = 100
+
+ROUTES = {"/score": score, "/posterior": posterior, "/hypotheses": hypotheses}
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _health() -> Dict[str, Any]:
+    return {"status": "ok",
+            "caches": {name: vars(c.info()) for name, c in
+                       (("hypotheses", HYPOTHESES_CACHE), ("score", SCORE_CACHE))}}
+
+
+def dispatch(method: str, target: str, body: bytes) -> Tuple[int, Any]:
+    """(메서드, 요청 대상, 본문) → (상태 코드, JSON 값)"""
+    url = urlsplit(target)
+    if url.path == "/healthz" and method == "GET":
+        return 200, _health()
+    fn = ROUTES.get(url.path)
+    if fn is None:
+        return 404, {"error": f"no route for {url.path}"}
+    try:
+        if method == "GET" and fn is hypotheses:
+            return 200, fn(dict(parse_qsl(url.query)))
+        if method != "POST":
+            return 405, {"error": f"{method} not allowed on {url.path}"}
+        try:
+            req = json.loads(body) if body else {}
+        except ValueError as e:
+            return 400, {"error": f"invalid JSON: {e}"}
+        return 200, handle(fn, req)
+    except ApiError as e:
+        return e.status, {"error": str(e)}
+
+
+def _response(status: int, payload: bytes, keep_alive: bool) -> bytes:
+    close = "" if keep_alive else "Connection: close\r\n"
+    head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(payload)}\r\n{close}\r\n")
+    return head.encode("latin-1") + payload
+
+
+async def _read_head(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, str, Dict[str, str]]]:
+    try:
+        raw = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None  # 요청 사이에 연결 종료
+    lines = raw.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ", 2)
+    except ValueError:
+        raise ApiError("malformed request line") from None
+    headers: Dict[str, str] = {}
+    for line in lines[1:MAX_HEADERS]:
+        if line:
+            k, _, v = line.partition(":")
+            headers[k.strip().lower()] = v.strip()
+    return method, target, version, headers
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            try:
+                head = await _read_head(reader)
+            except (ApiError, asyncio.LimitOverrunError) as e:
+                writer.write(_response(400, _dumps({"error": str(e)}), False))
+                break
+            if head is None:
+                break
+            method, target, version, headers = head
+            keep_alive = (headers.get("connection", "").lower() != "close" if version == "HTTP/1.1"
+                          else headers.get("connection", "").lower() == "keep-alive")
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                writer.write(_response(411, _dumps({"error": "chunked bodies are not supported"}), False))
+                break
+            try:
+                length = int(headers.get("content-length") or 0)
+            except ValueError:
+                length = -1
+            if not 0 <= length <= MAX_BODY:
+                writer.write(_response(413 if length > 0 else 400,
+                                       _dumps({"error": f"bad Content-Length (max {MAX_BODY})"}), False))
+                break
+            body = await reader.readexactly(length) if length else b""
+            try:
+                status, out = dispatch(method, target, body)
+            except Exception as e:  # 핸들러 버그로 연결 전체를 잃지 않도록
+                status, out = 500, {"error": f"{type(e).__name__}: {e}"}
+            writer.write(_response(status, _dumps(out), keep_alive))
+            if writer.transport.get_write_buffer_size() > 1 << 16:
+                await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8765, backlog: int = 1024) -> None:
+    server = await asyncio.start_server(handle_connection, host, port, backlog=backlog)
+    addrs = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"saju scoring service on {addrs}", flush=True)
+    async with server:
+        await server.serve_forever()
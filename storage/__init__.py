@@ -0,0 +1,26 @@
+"""storage – 응답 제출/저장 계층.
+
+앱은 SubmissionQueue.submit(row) 만 호출하고, 실제 기록은 백그라운드 워커가
+백엔드(SQLite / Supabase / Google Sheets)에 배치로 씁니다.
+응답 이벤트는 Journal 에 먼저 기록되고, 압축 시 AnalyticsStore(월별 Parquet)에 증분 적재됩니다.
+"""
+
+from .backends import (
+    RESPONSE_COLUMNS, Backend, SQLiteBackend, SupabaseBackend, SheetsBackend,
+    backend_from_config, to_record,
+)
+from .queue import QueueStats, SubmissionQueue
+from .journal import Journal, apply_event
+from .analytics import TABLES, AnalyticsStore, event_rows, table_schema
+from .rollups import DIMS, RollupStore, diff_snapshots, row_deltas
+from .export import EXPORT_TABLES, FORMATS, iter_csv, iter_export, iter_ndjson, iter_table
+
+__all__ = [
+    "RESPONSE_COLUMNS", "Backend", "SQLiteBackend", "SupabaseBackend", "SheetsBackend",
+    "backend_from_config", "to_record",
+    "QueueStats", "SubmissionQueue",
+    "Journal", "apply_event",
+    "TABLES", "AnalyticsStore", "event_rows", "table_schema",
+    "DIMS", "RollupStore", "diff_snapshots", "row_deltas",
+    "EXPORT_TABLES", "FORMATS", "iter_csv", "iter_export", "iter_ndjson", "iter_table",
+]
@@ -0,0 +1,83 @@
+# storage/__main__.py
+# -------------------------------------------------------------
+# 저장 계층 관리 CLI
+#   python -m storage compact [--journal var/journal] [--analytics var/analytics | --no-analytics]
+#   python -m storage replay USER [--journal var/journal]
+#   python -m storage rollups [--rebuild [--verify]] [--rollups var/rollups.sqlite3]
+#   python -m storage --export {responses,answers,submissions,events} [--format csv|ndjson] [-o FILE]
+# -------------------------------------------------------------
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from .analytics import AnalyticsStore
+from .export import EXPORT_TABLES, FORMATS, iter_export, iter_table
+from .journal import Journal
+from .rollups import RollupStore, diff_snapshots
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(prog="python -m storage", description="응답 저장 계층 도구")
+    ap.add_argument("--journal", default="var/journal", help="이벤트 로그 디렉터리")
+    ap.add_argument("--analytics", default="var/analytics", help="Parquet 분석 저장소")
+    ap.add_argument("--db", default="var/responses.sqlite3", help="SQLite 응답 저장소 (responses 내보내기)")
+    ap.add_argument("--rollups", default="var/rollups.sqlite3", help="관리자 통계 집계 저장소")
+    ap.add_argument("--export", choices=EXPORT_TABLES, help="테이블을 스트리밍으로 내보내기 (하위 명령 없이)")
+    ap.add_argument("--format", choices=list(FORMATS), default="csv", help="내보내기 형식")
+    ap.add_argument("-o", "--output", help="내보낼 파일 (생략 시 stdout)")
+    sub = ap.add_subparsers(dest="cmd")
+    cp = sub.add_parser("compact", help="봉인된 로그 세그먼트를 사용자별 스냅샷으로 압축")
+    cp.add_argument("--no-analytics", action="store_true", help="Parquet 적재 생략")
+    rp = sub.add_parser("replay", help="사용자의 experience_db 복원 (JSON 출력)")
+    rp.add_argument("user")
+    rl = sub.add_parser("rollups", help="관리자 통계 집계 출력 / 처음부터 재계산")
+    rl.add_argument("--rebuild", action="store_true", help="responses 전체로 집계를 다시 계산")
+    rl.add_argument("--verify", action="store_true", help="--rebuild 결과를 현재 집계와 비교만 하고 바꾸지 않음")
+    args = ap.parse_args(argv)
+
+    if args.export:
+        # 배치 하나 + 출력 조각 하나만 메모리에 – 테이블 크기와 무관
+        chunks = iter_export(iter_table(args.export, args.db, args.analytics), args.format)
+        out = open(args.output, "wb") if args.output else sys.stdout.buffer
+        try:
+            for chunk in chunks:
+                out.write(chunk)
+        finally:
+            if args.output:
+                out.close()
+            else:
+                out.flush()
+    elif args.cmd in ("compact", "replay"):
+        j = Journal(args.journal)
+        try:
+            if args.cmd == "compact":
+                on_segment = None if args.no_analytics else AnalyticsStore(args.analytics).ingest
+                print(f"compacted {j.compact(on_segment)} users")
+            else:
+                print(json.dumps(j.replay(args.user), ensure_ascii=False, indent=2))
+        finally:
+            j.close()
+    elif args.cmd == "rollups":
+        store = RollupStore(args.rollups)
+        try:
+            if args.rebuild and args.verify:
+                fresh = RollupStore(":memory:")
+                fresh.rebuild(iter_table("responses", args.db))
+                diffs = diff_snapshots(store.snapshot(), fresh.snapshot())
+                print("\n".join(diffs) if diffs else "rollups match a full rebuild")
+                if diffs:
+                    sys.exit(1)
+            elif args.rebuild:
+                print(f"rebuilt rollups from {store.rebuild(iter_table('responses', args.db))} responses")
+            else:
+                print(json.dumps(store.snapshot(), ensure_ascii=False, indent=2))
+        finally:
+            store.close()
+    else:
+        ap.error("하위 명령(compact/replay/rollups) 또는 --export 가 필요합니다")
+
+
+if __name__ == "__main__":
+    main()
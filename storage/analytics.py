@@ -0,0 +1,163 @@
+# storage/analytics.py
+# -------------------------------------------------------------
+# 분석용 컬럼 저장소 – 월별 파티션 Parquet (hive: <table>/month=YYYY-MM/part-*.parquet)
+# -------------------------------------------------------------
+# - answers     : 연도별 응답 한 건 = 한 행 (app.py 의 answer 이벤트)
+# - submissions : 최종 제출 한 건 = 한 행 (v3 의 submission 이벤트)
+# - events      : 제출에 담긴 인생 사건 한 건 = 한 행 (사건×오행 패턴 분석)
+# MBTI·테마·응답·오행처럼 값 종류가 적은 열은 dictionary 인코딩 (pandas 에선 category).
+#
+# 적재는 증분: Journal.compact(on_segment=store.ingest) 가 봉인된 세그먼트마다
+# part-<세그먼트>.parquet 를 씁니다. 같은 세그먼트를 다시 적재하면 같은 파일을 덮어써 중복이 없습니다.
+#
+# 읽기 (전체를 메모리에 올리지 않고 필요한 열·파티션만):
+#   pd.read_parquet("var/analytics/answers", columns=["mbti", "dominant_elem", "answer"])
+#   pd.read_parquet("var/analytics/events", filters=[("month", "=", "2025-11")])
+#   for batch in AnalyticsStore().scan("answers", columns=["mbti", "theme"]): ...
+# pyarrow 는 적재/조회할 때만 import 합니다.
+# -------------------------------------------------------------
+
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 열 이름 → 타입 이름 ("dict" = dictionary<int8, string>)
+TABLES: Dict[str, List[Tuple[str, str]]] = {
+    "answers": [
+        ("user", "string"), ("ts", "timestamp"), ("birth_year", "int16"), ("year", "int16"),
+        ("theme", "dict"), ("answer", "dict"), ("memo", "string"),
+        ("dominant_elem", "dict"), ("mbti", "dict"),
+    ],
+    "submissions": [
+        ("id", "string"), ("ts", "timestamp"), ("mbti", "dict"), ("birth_date", "string"),
+        ("dominant_elem", "dict"), ("n_events", "int16"),
+    ],
+    "events": [
+        ("id", "string"), ("ts", "timestamp"), ("mbti", "dict"), ("year", "int16"),
+        ("event_type", "dict"), ("element", "dict"), ("emotion", "int8"), ("duration", "dict"),
+    ],
+}
+
+
+def _pa():
+    import pyarrow as pa
+    return pa
+
+
+def _arrow_type(pa, name: str):
+    if name == "dict":
+        return pa.dictionary(pa.int8(), pa.string())
+    if name == "timestamp":
+        return pa.timestamp("ms", tz="UTC")
+    return getattr(pa, name)()
+
+
+def table_schema(table: str):
+    pa = _pa()
+    return pa.schema([(col, _arrow_type(pa, t)) for col, t in TABLES[table]])
+
+
+def _month(ts: float) -> str:
+    return time.strftime("%Y-%m", time.gmtime(ts))
+
+
+def _int(v: Any) -> Optional[int]:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+
+def _dominant(elems: Optional[Dict[str, Any]]) -> Optional[str]:
+    return max(elems, key=elems.get) if elems else None
+
+
+def event_rows(ev: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """로그 이벤트 하나 → (테이블, 행) 들"""
+    ts = float(ev.get("ts") or time.time())
+    if ev.get("type") == "answer":
+        yield "answers", {
+            "user": ev.get("user"), "ts": ts, "birth_year": _int(ev.get("birth_year")),
+            "year": _int(ev.get("year")), "theme": ev.get("cat"), "answer": ev.get("ans"),
+            "memo": ev.get("memo", ""), "dominant_elem": ev.get("elem"), "mbti": ev.get("mbti"),
+        }
+    elif ev.get("type") == "submission":
+        row = ev.get("row") or {}
+        sid = row.get("id") or ev.get("user")
+        events = row.get("events") or []
+        yield "submissions", {
+            "id": sid, "ts": ts, "mbti": row.get("mbti"), "birth_date": row.get("birth_date"),
+            "dominant_elem": _dominant(row.get("saju_elements") or row.get("mbti_elements")),
+            "n_events": len(events),
+        }
+        for e in events:
+            yield "events", {
+                "id": sid, "ts": ts, "mbti": row.get("mbti"), "year": _int(e.get("year")),
+                "event_type": e.get("type"), "element": e.get("element"),
+                "emotion": _int(e.get("emotion")), "duration": e.get("duration"),
+            }
+
+
+class AnalyticsStore:
+    def __init__(self, root: str = "var/analytics", compression: str = "zstd") -> None:
+        self.root = Path(root)
+        self.compression = compression
+
+    def _to_table(self, table: str, rows: List[Dict[str, Any]]):
+        pa = _pa()
+        schema = table_schema(table)
+        cols = {}
+        for field in schema:
+            values = [r.get(field.name) for r in rows]
+            if pa.types.is_timestamp(field.type):
+                values = [None if v is None else int(v * 1000) for v in values]
+                cols[field.name] = pa.array(values, pa.int64()).cast(field.type)
+            elif pa.types.is_dictionary(field.type):
+                cols[field.name] = pa.array(values, pa.string()).dictionary_encode().cast(field.type)
+            else:
+                cols[field.name] = pa.array(values, field.type)
+        return pa.Table.from_pydict(cols, schema=schema)
+
+    def append(self, table: str, rows: List[Dict[str, Any]], tag: str) -> int:
+        """rows 를 월별 파티션에 part-<tag>.parquet 로 기록 (같은 tag 는 덮어씀). 기록한 행 수 반환"""
+        import pyarrow.parquet as pq
+
+        by_month: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for r in rows:
+            by_month[_month(r["ts"])].append(r)
+        dict_cols = [col for col, t in TABLES[table] if t == "dict"]
+        for month, part in by_month.items():
+            out = self.root / table / f"month={month}"
+            out.mkdir(parents=True, exist_ok=True)
+            path = out / f"part-{tag}.parquet"
+            tmp = out / f".{path.name}.tmp"  # '.' 로 시작 → 데이터셋 탐색에서 제외
+            pq.write_table(self._to_table(table, part), tmp, compression=self.compression,
+                           use_dictionary=dict_cols)
+            tmp.replace(path)
+        return len(rows)
+
+    def ingest(self, tag: str, events: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """로그 이벤트 묶음(보통 봉인된 세그먼트 하나)을 테이블별로 나눠 적재"""
+        grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for ev in events:
+            for table, row in event_rows(ev):
+                grouped[table].append(row)
+        return {table: self.append(table, rows, tag) for table, rows in grouped.items()}
+
+    # ---- 조회 ----
+    def dataset(self, table: str):
+        import pyarrow.dataset as ds
+
+        path = self.root / table
+        if not path.exists():
+            return ds.dataset(table_schema(table).empty_table())
+        return ds.dataset(path, format="parquet", partitioning="hive")
+
+    def scan(self, table: str, columns: Optional[List[str]] = None, filter: Any = None,
+             batch_size: int = 65_536) -> Iterator[Any]:
+        """RecordBatch 스트림 – 필요한 열·파티션만 읽음 (filter 는 pyarrow.dataset 식)"""
+        yield from self.dataset(table).to_batches(columns=columns, filter=filter, batch_size=batch_size)
+
+    def read(self, table: str, columns: Optional[List[str]] = None, filter: Any = None):
+        return self.dataset(table).to_table(columns=columns, filter=filter)
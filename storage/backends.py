@@ -0,0 +1,171 @@
+# storage/backends.py
+# -------------------------------------------------------------
+# 제출 데이터 저장 백엔드 – 모두 write_batch(rows) 하나로 여러 건을 한 번에 씀
+# -------------------------------------------------------------
+# - SQLiteBackend: 로컬/테스트용 대체 백엔드 (표준 라이브러리만 사용)
+# - SupabaseBackend: Postgres 테이블에 bulk insert (supabase 패키지)
+# - SheetsBackend: Google Sheets 워크시트에 append_rows (gspread + google-auth), 이미 있는 id 는 건너뜀
+# 외부 패키지는 백엔드를 만들 때만 import 합니다.
+# -------------------------------------------------------------
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+# 시트/테이블 공통 열 (NEXT_STEPS.md D 의 responses 스키마)
+RESPONSE_COLUMNS = ["id", "created_at", "mbti", "birth_date", "events", "mbti_elements", "saju_elements", "referrer"]
+_JSON_COLUMNS = {"events", "mbti_elements", "saju_elements"}
+
+
+def to_record(row: Dict[str, Any]) -> Dict[str, Any]:
+    """앱의 제출 row → responses 스키마 레코드 (timestamp → created_at, 없는 열은 None)"""
+    rec = {c: row.get(c) for c in RESPONSE_COLUMNS}
+    rec["created_at"] = row.get("created_at") or row.get("timestamp")
+    return rec
+
+
+class Backend:
+    """저장 백엔드 인터페이스. 실패 시 예외를 올리면 큐가 재시도합니다 (같은 id 재전송 가능)."""
+
+    name = "base"
+
+    def write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class SQLiteBackend(Backend):
+    name = "sqlite"
+
+    def __init__(self, path: str = "var/responses.sqlite3", table: str = "responses") -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "id TEXT PRIMARY KEY, created_at TEXT, mbti TEXT, birth_date TEXT,"
+            " events TEXT, mbti_elements TEXT, saju_elements TEXT, referrer TEXT)"
+        )
+        self._conn.commit()
+
+    def write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        values = []
+        for row in rows:
+            rec = to_record(row)
+            values.append(tuple(
+                json.dumps(rec[c], ensure_ascii=False) if c in _JSON_COLUMNS and rec[c] is not None else rec[c]
+                for c in RESPONSE_COLUMNS
+            ))
+        cols = ", ".join(RESPONSE_COLUMNS)
+        marks = ", ".join("?" for _ in RESPONSE_COLUMNS)
+        with self._lock, self._conn:
+            # 재시도로 같은 id 가 다시 와도 한 번만 저장
+            self._conn.executemany(f"INSERT OR IGNORE INTO {self.table} ({cols}) VALUES ({marks})", values)
+
+    def iter_rows(self, batch_size: int = 10_000) -> Iterator[Dict[str, Any]]:
+        """저장된 레코드를 created_at 순으로 스트리밍 (별도 읽기 연결 – WAL 이라 쓰기와 동시 가능)"""
+        conn = sqlite3.connect(self.path)
+        try:
+            cur = conn.execute(f"SELECT {', '.join(RESPONSE_COLUMNS)} FROM {self.table} ORDER BY created_at")
+            while True:
+                batch = cur.fetchmany(batch_size)
+                if not batch:
+                    return
+                for values in batch:
+                    rec = dict(zip(RESPONSE_COLUMNS, values))
+                    for c in _JSON_COLUMNS:
+                        if rec[c] is not None:
+                            rec[c] = json.loads(rec[c])
+                    yield rec
+        finally:
+            conn.close()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SupabaseBackend(Backend):
+    name = "supabase"
+
+    def __init__(self, url: str, key: str, table: str = "responses") -> None:
+        from supabase import create_client
+
+        self.client = create_client(url, key)
+        self.table = table
+
+    def write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        # upsert(id) 라 재시도로 중복 전송돼도 한 행
+        self.client.table(self.table).upsert([to_record(r) for r in rows], on_conflict="id").execute()
+
+
+class SheetsBackend(Backend):
+    name = "gsheets"
+
+    def __init__(self, spreadsheet: str, worksheet: str = "responses",
+                 service_account: Optional[Dict[str, Any]] = None) -> None:
+        import gspread
+
+        gc = gspread.service_account_from_dict(service_account) if service_account else gspread.service_account()
+        sh = gc.open_by_key(spreadsheet) if "/" not in spreadsheet else gc.open_by_url(spreadsheet)
+        try:
+            self.ws = sh.worksheet(worksheet)
+        except gspread.WorksheetNotFound:
+            self.ws = sh.add_worksheet(worksheet, rows=1, cols=len(RESPONSE_COLUMNS))
+            self.ws.append_row(RESPONSE_COLUMNS)
+        self._ids: Optional[Set[str]] = None  # 시트에 이미 있는 id (첫 기록·실패 직후에 다시 읽음)
+
+    def write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        # append_rows 는 upsert 가 아니고, 타임아웃 등으로 실패처럼 보여도 실제로는 추가됐을 수 있음
+        # → 시트의 id 열(A)을 읽어 둔 집합으로 이미 있는 행은 건너뜀 (같은 id 재전송 가능)
+        if self._ids is None:
+            self._ids = set(self.ws.col_values(RESPONSE_COLUMNS.index("id") + 1))
+        values, ids = [], []
+        for row in rows:
+            rec = to_record(row)
+            if rec["id"] in self._ids or rec["id"] in ids:
+                continue
+            ids.append(rec["id"])
+            values.append([
+                json.dumps(rec[c], ensure_ascii=False) if c in _JSON_COLUMNS else ("" if rec[c] is None else rec[c])
+                for c in RESPONSE_COLUMNS
+            ])
+        if not values:
+            return
+        # 한 번의 API 호출로 여러 행 추가 (Sheets 분당 쓰기 한도 절약)
+        try:
+            self.ws.append_rows(values, value_input_option="RAW")
+        except Exception:
+            self._ids = None  # 일부만 들어갔을 수 있음 → 다음 시도 전에 시트에서 다시 읽음
+            raise
+        self._ids.update(ids)
+
+
+def backend_from_config(cfg: Optional[Dict[str, Any]] = None) -> Backend:
+    """secrets.toml 의 [storage] 섹션 → 백엔드. 설정이 없으면 로컬 SQLite.
+
+    [storage]
+    backend = "supabase"            # 또는 "gsheets" / "sqlite"
+    url = "https://xxx.supabase.co"
+    key = "..."
+    """
+    cfg = dict(cfg or {})
+    kind = cfg.pop("backend", "sqlite")
+    if kind == "sqlite":
+        return SQLiteBackend(**cfg)
+    if kind == "supabase":
+        return SupabaseBackend(**cfg)
+    if kind == "gsheets":
+        return SheetsBackend(**cfg)
+    raise ValueError(f"unknown storage backend: {kind!r}")
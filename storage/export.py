@@ -0,0 +1,83 @@
+# storage/export.py
+# -------------------------------------------------------------
+# 스트리밍 내보내기 – 표 전체를 메모리에 만들지 않고 조각(bytes) 단위로 생성
+# -------------------------------------------------------------
+# - iter_csv(rows): CSV (첫 조각에 UTF-8 BOM → 엑셀 한글 호환), chunk_rows 행마다 한 조각
+# - iter_ndjson(rows): 한 줄 = JSON 객체 하나
+# - iter_table(name): 응답 저장소에서 행 스트림
+#     "responses"                       → SQLiteBackend (제출 원본)
+#     "answers" / "submissions" / "events" → AnalyticsStore (Parquet, RecordBatch 단위)
+#
+# CLI: python -m storage --export answers --format csv -o answers.csv
+# -------------------------------------------------------------
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .analytics import TABLES, AnalyticsStore
+from .backends import SQLiteBackend
+
+EXPORT_TABLES = ["responses", *TABLES]
+FORMATS = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+
+def _cell(v: Any) -> Any:
+    return json.dumps(v, ensure_ascii=False, default=str) if isinstance(v, (dict, list)) else v
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], columns: Optional[List[str]] = None,
+             bom: bool = True, chunk_rows: int = 1000) -> Iterator[bytes]:
+    """행 dict 스트림 → CSV bytes 조각. columns 가 없으면 첫 행의 키 순서"""
+    buf = io.StringIO()
+    writer = None
+    n = 0
+    for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(buf, fieldnames=columns or list(row), extrasaction="ignore")
+            if bom:
+                buf.write("\ufeff")
+            writer.writeheader()
+        writer.writerow({k: _cell(v) for k, v in row.items()})
+        n += 1
+        if n % chunk_rows == 0:
+            yield buf.getvalue().encode("utf-8")
+            buf.seek(0)
+            buf.truncate()
+    if writer is None and columns:  # 빈 표도 머리행은 내보냄
+        if bom:
+            buf.write("\ufeff")
+        csv.writer(buf).writerow(columns)
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
+def iter_ndjson(rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    for row in rows:
+        yield (json.dumps(row, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+
+def iter_export(rows: Iterable[Dict[str, Any]], fmt: str = "csv",
+                columns: Optional[List[str]] = None) -> Iterator[bytes]:
+    if fmt == "csv":
+        return iter_csv(rows, columns)
+    if fmt == "ndjson":
+        return iter_ndjson(rows)
+    raise ValueError(f"unknown export format: {fmt!r} (choose from {list(FORMATS)})")
+
+
+def iter_table(name: str, sqlite_path: str = "var/responses.sqlite3",
+               analytics_root: str = "var/analytics", batch_size: int = 10_000) -> Iterator[Dict[str, Any]]:
+    """응답 저장소의 한 테이블을 행 dict 로 스트리밍 (배치 하나만 메모리에)"""
+    if name == "responses":
+        backend = SQLiteBackend(sqlite_path)
+        try:
+            yield from backend.iter_rows(batch_size)
+        finally:
+            backend.close()
+    elif name in TABLES:
+        for batch in AnalyticsStore(analytics_root).scan(name, batch_size=batch_size):
+            yield from batch.to_pylist()
+    else:
+        raise ValueError(f"unknown table: {name!r} (choose from {EXPORT_TABLES})")
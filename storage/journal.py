@@ -0,0 +1,239 @@
+# storage/journal.py
+# -------------------------------------------------------------
+# 추가 전용(append-only) 로컬 이벤트 로그 – 응답의 내구성 있는 1차 기록
+# -------------------------------------------------------------
+# - JSONL 세그먼트(seg-00000001.jsonl …)에 한 줄 = 이벤트 하나
+# - 그룹 커밋: 쓰기 스레드가 commit_interval 동안 모인 이벤트를 write 한 번 + fsync 한 번으로 기록
+# - compact(): 봉인된 세그먼트를 사용자별 스냅샷(snapshots/<user>.json)으로 접고 삭제
+# - compact(on_segment=AnalyticsStore().ingest): 같은 세그먼트를 분석용 Parquet 에도 증분 적재
+# - start_compactor(interval, on_segment): 위 압축을 백그라운드에서 interval 초마다, 그리고
+#   세그먼트가 크기 한도로 봉인될 때마다 실행 (재시작 없이 스냅샷·Parquet 이 따라옴)
+# - replay(user): 스냅샷 + 남은 세그먼트 → experience_db 복원 (재방문 사용자)
+#
+# 이벤트:
+#   {"type": "answer", "user", "year", "cat", "ans", "memo", "ts", ["birth_year", "elem", "mbti"]}
+#   {"type": "submission", "user", "row", "ts"}
+#
+# CLI: python -m storage compact / python -m storage replay USER
+# -------------------------------------------------------------
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_SEG_RE = re.compile(r"^seg-(\d{8})\.jsonl$")
+
+
+def _user_file(user: str) -> str:
+    if re.fullmatch(r"[A-Za-z0-9_-]{1,64}", user):
+        return f"{user}.json"
+    return hashlib.sha1(user.encode()).hexdigest() + ".json"
+
+
+def _empty_state(user: str) -> Dict[str, Any]:
+    return {"user": user, "experience_db": {}, "submissions": [], "updated": None}
+
+
+def apply_event(state: Dict[str, Any], ev: Dict[str, Any]) -> None:
+    """스냅샷 상태에 이벤트 하나 반영 (experience_db 의 연도 키는 int)"""
+    if ev.get("type") == "answer":
+        cell = state["experience_db"].setdefault(int(ev["year"]), {})
+        cell[ev["cat"]] = {"ans": ev.get("ans"), "memo": ev.get("memo", "")}
+    elif ev.get("type") == "submission":
+        state["submissions"].append(ev.get("row"))
+    state["updated"] = ev.get("ts", state["updated"])
+
+
+class Journal:
+    def __init__(self, root: str = "var/journal", commit_interval: float = 0.02,
+                 segment_bytes: int = 16 * 1024 * 1024) -> None:
+        self.root = Path(root)
+        self.snap_dir = self.root / "snapshots"
+        self.snap_dir.mkdir(parents=True, exist_ok=True)
+        self.commit_interval = commit_interval
+        self.segment_bytes = segment_bytes
+
+        segs = self._segments()
+        self._seg_no = int(_SEG_RE.match(segs[-1].name).group(1)) if segs else 1
+        self._f = open(self._seg_path(self._seg_no), "a", encoding="utf-8")
+
+        self._io = threading.Lock()  # 세그먼트 파일 쓰기/교체 보호
+        self._fold = threading.Lock()  # compact(스냅샷 갱신·세그먼트 삭제) ↔ replay 상호 배제
+        self._cv = threading.Condition()
+        self._buf: List[str] = []
+        self._seq = 0          # 마지막으로 받은 이벤트 번호
+        self._committed = 0    # fsync 까지 끝난 이벤트 번호
+        self._closed = False
+        self.commits = 0       # fsync 횟수 (그룹 커밋 효과 확인용)
+        self.compactions = 0   # 백그라운드 압축 횟수
+        self.last_compact_error = ""
+        self._sealed = threading.Event()  # 쓰기 스레드가 세그먼트를 봉인하면 set → 압축 스레드가 깨어남
+        self._compactor: Optional[threading.Thread] = None
+        self._writer = threading.Thread(target=self._run, name="journal-writer", daemon=True)
+        self._writer.start()
+
+    # ---- 쓰기 ----
+    def append(self, event: Dict[str, Any], wait: bool = False, timeout: Optional[float] = 5.0) -> int:
+        """이벤트를 버퍼에 넣고 번호 반환. wait=True 면 fsync 될 때까지 대기 (같은 그룹과 fsync 공유)."""
+        event = dict(event)
+        event.setdefault("ts", time.time())
+        line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+        with self._cv:
+            if self._closed:
+                raise RuntimeError("journal is closed")
+            self._buf.append(line)
+            self._seq += 1
+            seq = self._seq
+            self._cv.notify_all()
+        if wait:
+            self.sync(seq, timeout)
+        return seq
+
+    def sync(self, seq: Optional[int] = None, timeout: Optional[float] = 5.0) -> bool:
+        with self._cv:
+            target = self._seq if seq is None else seq
+            return self._cv.wait_for(lambda: self._committed >= target, timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._cv:
+                self._cv.wait_for(lambda: self._buf or self._closed)
+                if not self._buf and self._closed:
+                    return
+            # 잠깐 더 모아서 한 번에 fsync (그룹 커밋)
+            time.sleep(self.commit_interval)
+            with self._cv:
+                lines, self._buf = self._buf, []
+                upto = self._seq
+            with self._io:
+                self._f.write("".join(lines))
+                self._f.flush()
+                os.fsync(self._f.fileno())
+                if self._f.tell() >= self.segment_bytes:
+                    self._roll()
+                    self._sealed.set()
+            with self._cv:
+                self.commits += 1
+                self._committed = upto
+                self._cv.notify_all()
+
+    def _roll(self) -> None:
+        # _io 잠금 안에서 호출 – 쓰기 스레드와 compact 가 동시에 파일을 바꾸지 않도록
+        self._f.close()
+        self._seg_no += 1
+        self._f = open(self._seg_path(self._seg_no), "a", encoding="utf-8")
+
+    def close(self) -> None:
+        self.sync()
+        with self._cv:
+            self._closed = True
+            self._cv.notify_all()
+        self._writer.join()
+        if self._compactor is not None:
+            self._sealed.set()
+            self._compactor.join()
+        self._f.close()
+
+    # ---- 세그먼트 ----
+    def _seg_path(self, n: int) -> Path:
+        return self.root / f"seg-{n:08d}.jsonl"
+
+    def _segments(self) -> List[Path]:
+        return sorted(p for p in self.root.iterdir() if _SEG_RE.match(p.name))
+
+    @staticmethod
+    def _read_segment(path: Path) -> Iterator[Dict[str, Any]]:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 크래시로 잘린 마지막 줄
+
+    # ---- 스냅샷 ----
+    def load_snapshot(self, user: str) -> Dict[str, Any]:
+        path = self.snap_dir / _user_file(user)
+        if not path.exists():
+            return _empty_state(user)
+        state = json.loads(path.read_text(encoding="utf-8"))
+        state["experience_db"] = {int(y): cats for y, cats in state["experience_db"].items()}
+        return state
+
+    def _write_snapshot(self, state: Dict[str, Any]) -> None:
+        path = self.snap_dir / _user_file(state["user"])
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def compact(self, on_segment: Optional[Callable[[str, List[Dict[str, Any]]], Any]] = None) -> int:
+        """현재 세그먼트를 봉인하고, 봉인된 세그먼트를 사용자별 스냅샷에 접은 뒤 삭제. 갱신한 사용자 수 반환
+
+        on_segment(이름, 이벤트들) 은 세그먼트를 지우기 전에 호출 (예: AnalyticsStore.ingest 로 Parquet 증분 적재)
+        """
+        self.sync()
+        with self._fold:
+            with self._io:
+                if self._f.tell():
+                    self._roll()
+                sealed = [p for p in self._segments() if p != self._seg_path(self._seg_no)]
+            states: Dict[str, Dict[str, Any]] = {}
+            for seg in sealed:
+                events = list(self._read_segment(seg))
+                if on_segment is not None:
+                    on_segment(seg.stem, events)
+                for ev in events:
+                    user = ev.get("user")
+                    if user is None:
+                        continue
+                    if user not in states:
+                        states[user] = self.load_snapshot(user)
+                    apply_event(states[user], ev)
+            for state in states.values():
+                self._write_snapshot(state)
+            for seg in sealed:
+                seg.unlink()
+            return len(states)
+
+    def start_compactor(self, interval: float = 60.0,
+                        on_segment: Optional[Callable[[str, List[Dict[str, Any]]], Any]] = None) -> threading.Thread:
+        """백그라운드 압축 스레드 시작: 바로 한 번, 이후 interval 초마다 또는 세그먼트가 봉인될 때마다 compact()
+
+        실패(예: pyarrow 쓰기 오류)는 last_compact_error 에 남기고 다음 주기에 다시 시도 – 세그먼트는
+        on_segment 가 성공해야 지워지므로 유실되지 않음
+        """
+        if self._compactor is not None:
+            return self._compactor
+
+        def loop() -> None:
+            while not self._closed:
+                self._sealed.clear()
+                try:
+                    self.compact(on_segment)
+                    self.last_compact_error = ""
+                except Exception as e:
+                    self.last_compact_error = f"{type(e).__name__}: {e}"
+                self.compactions += 1
+                self._sealed.wait(interval)
+
+        self._compactor = threading.Thread(target=loop, name="journal-compact", daemon=True)
+        self._compactor.start()
+        return self._compactor
+
+    def replay(self, user: str) -> Dict[str, Any]:
+        """스냅샷 + 아직 접히지 않은 이벤트 → {"experience_db", "submissions", ...}"""
+        self.sync()
+        with self._fold:
+            state = self.load_snapshot(user)
+            for seg in self._segments():
+                for ev in self._read_segment(seg):
+                    if ev.get("user") == user:
+                        apply_event(state, ev)
+        return state
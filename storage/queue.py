@@ -0,0 +1,241 @@
+# storage/queue.py
+# -------------------------------------------------------------
+# 비동기·배치 제출 큐 – Streamlit 스크립트 스레드는 디스크 스풀에 쓰고 바로 반환,
+# 백그라운드 워커가 모아서 백엔드에 한 번에 기록 (재시도·지수 백오프)
+# -------------------------------------------------------------
+# 스풀: spool_dir/pending.jsonl (제출 원본) + spool_dir/acked.txt (기록 완료된 id)
+# 재시작 시 pending 중 ack 안 된 행을 다시 큐에 넣으므로 유실이 없습니다.
+# 배치가 max_attempts 번 실패하면 행을 하나씩 다시 써 보고, 그래도 실패한 행은
+# spool_dir/dead.jsonl (데드레터)로 옮겨 큐가 계속 흐르게 합니다 (requeue_dead_letters() 로 재투입).
+# -------------------------------------------------------------
+
+import json
+import os
+import queue
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .backends import Backend
+
+
+@dataclass
+class QueueStats:
+    submitted: int = 0
+    written: int = 0
+    batches: int = 0
+    failures: int = 0
+    recovered: int = 0  # 재시작 시 스풀에서 복구한 건수
+    dead: int = 0  # 데드레터로 옮긴 건수
+    last_error: str = ""
+
+
+class SubmissionQueue:
+    def __init__(self, backend: Backend, spool_dir: str = "var/spool", batch_size: int = 50,
+                 flush_interval: float = 2.0, backoff_base: float = 0.5, backoff_max: float = 60.0,
+                 max_attempts: int = 8, on_written: Optional[Callable[[List[Dict[str, Any]]], Any]] = None) -> None:
+        self.backend = backend
+        self.on_written = on_written  # 기록 성공한 배치마다 호출 (예: RollupStore.add_batch)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_attempts = max_attempts
+        self.stats = QueueStats()
+
+        self._spool = Path(spool_dir)
+        self._spool.mkdir(parents=True, exist_ok=True)
+        self._pending_path = self._spool / "pending.jsonl"
+        self._acked_path = self._spool / "acked.txt"
+        self._dead_path = self._spool / "dead.jsonl"
+        self._spool_lock = threading.Lock()
+        self._q: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._inflight = 0
+        self._idle = threading.Condition()
+        self._stop = threading.Event()
+
+        for row in self._recover():
+            self._q.put(row)
+            self.stats.recovered += 1
+        self._pending_f = open(self._pending_path, "a", encoding="utf-8")
+        self._acked_f = open(self._acked_path, "a", encoding="utf-8")
+
+        self._worker = threading.Thread(target=self._run, name="submission-queue", daemon=True)
+        self._worker.start()
+
+    # ---- 제출 (스크립트 스레드) ----
+    def submit(self, row: Dict[str, Any]) -> str:
+        """row 를 스풀에 fsync 후 큐에 넣고 id 반환. 네트워크 왕복 없음."""
+        row = dict(row)
+        row.setdefault("id", uuid.uuid4().hex)
+        line = json.dumps(row, ensure_ascii=False, default=str)
+        with self._idle:
+            self._inflight += 1  # 스풀 쓰기 전에 올려야 _compact 가 이 행을 지우지 않음
+        with self._spool_lock:
+            self._pending_f.write(line + "\n")
+            self._pending_f.flush()
+            os.fsync(self._pending_f.fileno())
+        self.stats.submitted += 1
+        self._q.put(row)
+        return row["id"]
+
+    def pending(self) -> int:
+        return self._inflight
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """큐가 빌 때까지 대기 (종료/테스트용). 시간 안에 비면 True"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._inflight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        self.flush(timeout)
+        self._stop.set()
+        self._worker.join(timeout)
+        self._pending_f.close()
+        self._acked_f.close()
+        self.backend.close()
+
+    # ---- 워커 ----
+    def _next_batch(self) -> List[Dict[str, Any]]:
+        try:
+            batch = [self._q.get(timeout=0.5)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, rows: List[Dict[str, Any]], attempts: int) -> Optional[bool]:
+        """rows 기록을 최대 attempts 번 시도 (지수 백오프). 성공 True, 포기 False, 종료 중이면 None"""
+        for attempt in range(1, attempts + 1):
+            try:
+                self.backend.write_batch(rows)
+                return True
+            except Exception as e:  # 백엔드별 예외 타입이 달라 모두 재시도 대상
+                self.stats.failures += 1
+                self.stats.last_error = f"{type(e).__name__}: {e}"
+            if attempt == attempts:
+                break
+            delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+            if self._stop.wait(delay * (0.5 + random.random() / 2)):
+                return None  # 종료 중: ack 안 된 행은 스풀에 남아 다음 시작 때 복구
+        return False
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            if not batch:
+                continue
+            ok = self._write(batch, self.max_attempts)
+            if ok is None:
+                return
+            written, dead = batch, []
+            if not ok:
+                # 배치 안의 나쁜 행(스키마·검증 오류 등)을 가려내려고 한 행씩 한 번 더
+                written = []
+                for row in batch:
+                    ok = self._write([row], 1) if len(batch) > 1 else False
+                    if ok is None:
+                        return
+                    (written if ok else dead).append(row)
+            if written and self.on_written is not None:
+                try:
+                    self.on_written(written)
+                except Exception as e:  # 부가 집계 실패로 기록된 행을 다시 보내지 않음
+                    self.stats.last_error = f"on_written {type(e).__name__}: {e}"
+            if dead:
+                self._dead_letter(dead)
+            self.stats.written += len(written)
+            self.stats.batches += bool(written)
+            self._ack(batch)  # 데드레터로 옮긴 행도 pending 에서는 빠짐
+
+    def _dead_letter(self, rows: List[Dict[str, Any]]) -> None:
+        with self._spool_lock, open(self._dead_path, "a", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps({"row": row, "error": self.stats.last_error, "ts": time.time()},
+                                   ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.stats.dead += len(rows)
+
+    def dead_letters(self) -> List[Dict[str, Any]]:
+        """데드레터 목록 [{"row", "error", "ts"}]"""
+        if not self._dead_path.exists():
+            return []
+        with self._spool_lock, open(self._dead_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def requeue_dead_letters(self) -> int:
+        """데드레터를 비우고 모두 다시 제출 (백엔드·데이터를 고친 뒤). 재투입한 건수 반환"""
+        entries = self.dead_letters()
+        with self._spool_lock:
+            self._dead_path.unlink(missing_ok=True)
+        for entry in entries:
+            self.submit(entry["row"])
+        return len(entries)
+
+    def _ack(self, batch: List[Dict[str, Any]]) -> None:
+        with self._spool_lock:
+            self._acked_f.write("".join(f"{row['id']}\n" for row in batch))
+            self._acked_f.flush()
+            os.fsync(self._acked_f.fileno())
+        with self._idle:
+            self._inflight -= len(batch)
+            if not self._inflight:
+                self._compact()
+                self._idle.notify_all()
+
+    def _compact(self) -> None:
+        # 모두 기록됐으면 스풀 파일을 비움 (_idle 잠금 안에서 호출 → submit 과 경합 없음)
+        with self._spool_lock:
+            if self._inflight:
+                return
+            self._pending_f.truncate(0)
+            self._acked_f.truncate(0)
+
+    def _recover(self) -> List[Dict[str, Any]]:
+        if not self._pending_path.exists():
+            return []
+        acked = set()
+        if self._acked_path.exists():
+            acked = set(self._acked_path.read_text(encoding="utf-8").split())
+        rows = []
+        with open(self._pending_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 쓰다 끊긴 마지막 줄
+                if row.get("id") not in acked:
+                    rows.append(row)
+        # 남은 행만으로 스풀 재작성
+        tmp = self._pending_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self._pending_path)
+        self._acked_path.write_text("", encoding="utf-8")
+        self._inflight = len(rows)
+        return rows
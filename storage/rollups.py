@@ -0,0 +1,175 @@
+# storage/rollups.py
+# -------------------------------------------------------------
+# 관리자 통계용 사전 집계(rollup) – 제출마다 증분 갱신, 대시보드는 집계표만 읽음 (N 과 무관)
+# -------------------------------------------------------------
+# rollup_counts(dim, key, n)
+#   dim = "mbti"       key = "INTP"
+#         "mbti_elem"  key = "INTP|metal"  (MBTI × 우세 오행)
+#         "month"      key = "2025-11"     (제출 월)
+#         "event_type" key = "전직/이직"
+# rollup_elem_stats(mbti, elem, n, mean, m2) – 오행 점수의 이동 평균/분산 (Welford)
+# rollup_seen(id) – 이미 반영한 제출 id (큐 재시도·복구로 같은 행이 다시 와도 한 번만 집계)
+#
+# 갱신: SubmissionQueue(on_written=RollupStore().add_batch) – 백엔드 기록이 끝난 배치마다
+# 검증: python -m storage rollups --rebuild [--verify] – 응답 저장소 전체로 처음부터 다시 집계
+# -------------------------------------------------------------
+
+import math
+import sqlite3
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .analytics import _dominant
+
+DIMS = ("mbti", "mbti_elem", "month", "event_type")
+
+
+def _elements(row: Dict[str, Any]) -> Dict[str, float]:
+    return row.get("saju_elements") or row.get("mbti_elements") or {}
+
+
+def row_deltas(row: Dict[str, Any]) -> Tuple[Dict[Tuple[str, str], int], List[Tuple[str, str, float]]]:
+    """제출 row 하나 → (카운트 증분 {(dim, key): n}, 오행 점수 관측 [(mbti, elem, x)])"""
+    mbti = row.get("mbti") or "?"
+    counts: Dict[Tuple[str, str], int] = defaultdict(int)
+    counts["mbti", mbti] += 1
+    elems = _elements(row)
+    dom = _dominant(elems)
+    if dom:
+        counts["mbti_elem", f"{mbti}|{dom}"] += 1
+    created = str(row.get("created_at") or row.get("timestamp") or "")
+    if len(created) >= 7:
+        counts["month", created[:7]] += 1
+    for e in row.get("events") or []:
+        if e.get("type"):
+            counts["event_type", e["type"]] += 1
+    obs = [(mbti, elem, float(x)) for elem, x in elems.items()]
+    return counts, obs
+
+
+def merge_stats(a: Tuple[int, float, float], b: Tuple[int, float, float]) -> Tuple[int, float, float]:
+    """(n, mean, m2) 두 개 병합 (Chan et al.) – MBTI 별 통계에서 전체 통계를 만들 때"""
+    n = a[0] + b[0]
+    if not n:
+        return 0, 0.0, 0.0
+    d = b[1] - a[1]
+    return n, a[1] + d * b[0] / n, a[2] + b[2] + d * d * a[0] * b[0] / n
+
+
+class RollupStore:
+    def __init__(self, path: str = "var/rollups.sqlite3") -> None:
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS rollup_seen (id TEXT PRIMARY KEY);"
+            "CREATE TABLE IF NOT EXISTS rollup_counts (dim TEXT, key TEXT, n INTEGER, PRIMARY KEY (dim, key));"
+            "CREATE TABLE IF NOT EXISTS rollup_elem_stats ("
+            " mbti TEXT, elem TEXT, n INTEGER, mean REAL, m2 REAL, PRIMARY KEY (mbti, elem));"
+        )
+        self._conn.commit()
+
+    # ---- 갱신 ----
+    def add_batch(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """제출 배치를 한 트랜잭션으로 반영. 새로 집계한 건수 반환"""
+        added = 0
+        with self._lock, self._conn:
+            for row in rows:
+                if row.get("id") is not None:
+                    cur = self._conn.execute("INSERT OR IGNORE INTO rollup_seen (id) VALUES (?)", (row["id"],))
+                    if not cur.rowcount:
+                        continue
+                counts, obs = row_deltas(row)
+                self._conn.executemany(
+                    "INSERT INTO rollup_counts (dim, key, n) VALUES (?, ?, ?)"
+                    " ON CONFLICT (dim, key) DO UPDATE SET n = n + excluded.n",
+                    [(dim, key, n) for (dim, key), n in counts.items()],
+                )
+                for mbti, elem, x in obs:
+                    prev = self._conn.execute(
+                        "SELECT n, mean, m2 FROM rollup_elem_stats WHERE mbti = ? AND elem = ?", (mbti, elem)
+                    ).fetchone() or (0, 0.0, 0.0)
+                    n = prev[0] + 1
+                    d = x - prev[1]
+                    mean = prev[1] + d / n
+                    m2 = prev[2] + d * (x - mean)
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO rollup_elem_stats (mbti, elem, n, mean, m2) VALUES (?, ?, ?, ?, ?)",
+                        (mbti, elem, n, mean, m2),
+                    )
+                added += 1
+        return added
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            for table in ("rollup_seen", "rollup_counts", "rollup_elem_stats"):
+                self._conn.execute(f"DELETE FROM {table}")
+
+    def rebuild(self, rows: Iterable[Dict[str, Any]], batch_size: int = 1000) -> int:
+        """집계를 비우고 rows 전체로 다시 계산 (검증/복구용 – 평소엔 add_batch 증분 갱신)"""
+        self.clear()
+        total = 0
+        batch: List[Dict[str, Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                total += self.add_batch(batch)
+                batch = []
+        return total + self.add_batch(batch)
+
+    # ---- 조회 ----
+    def counts(self, dim: str) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute("SELECT key, n FROM rollup_counts WHERE dim = ? ORDER BY key", (dim,)))
+
+    def elem_stats(self) -> Dict[str, Dict[str, Tuple[int, float, float]]]:
+        """{mbti: {elem: (n, mean, m2)}}"""
+        out: Dict[str, Dict[str, Tuple[int, float, float]]] = defaultdict(dict)
+        with self._lock:
+            for mbti, elem, n, mean, m2 in self._conn.execute(
+                    "SELECT mbti, elem, n, mean, m2 FROM rollup_elem_stats ORDER BY mbti, elem"):
+                out[mbti][elem] = (n, mean, m2)
+        return dict(out)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """대시보드가 쓰는 전체 집계 – 크기는 키 개수(16 MBTI × 5 오행, 월, 사건 종류)에만 비례"""
+        snap: Dict[str, Any] = {dim: self.counts(dim) for dim in DIMS}
+        stats = self.elem_stats()
+        snap["elem_mean"] = {m: {e: s[1] for e, s in es.items()} for m, es in stats.items()}
+        overall: Dict[str, Tuple[int, float, float]] = {}
+        for es in stats.values():
+            for e, s in es.items():
+                overall[e] = merge_stats(overall.get(e, (0, 0.0, 0.0)), s)
+        snap["elem_overall"] = {
+            e: {"n": n, "mean": mean, "std": math.sqrt(m2 / (n - 1)) if n > 1 else 0.0}
+            for e, (n, mean, m2) in overall.items()
+        }
+        snap["total"] = sum(snap["mbti"].values())
+        return snap
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def diff_snapshots(a: Dict[str, Any], b: Dict[str, Any], tol: float = 1e-9) -> List[str]:
+    """두 스냅샷의 차이 목록 (증분 vs 재계산 검증용). 같으면 []"""
+    out = []
+
+    def walk(x: Any, y: Any, path: str) -> None:
+        if isinstance(x, dict) and isinstance(y, dict):
+            for k in sorted(set(x) | set(y)):
+                walk(x.get(k), y.get(k), f"{path}/{k}")
+        elif isinstance(x, float) or isinstance(y, float):
+            if x is None or y is None or not math.isclose(x, y, rel_tol=tol, abs_tol=tol):
+                out.append(f"{path}: {x} != {y}")
+        elif x != y:
+            out.append(f"{path}: {x} != {y}")
+
+    walk(a, b, "")
+    return out
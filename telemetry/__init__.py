@@ -0,0 +1,23 @@
+"""telemetry – 운영 중 재실행 성능 계측.
+
+구간 타이머는 꺼져 있으면 비용이 거의 없고, 켜면 프로세스 내 히스토그램에 누적합니다:
+    from telemetry import timed
+    with timed("6-3"):
+        ...
+
+집계는 관리자 페이지(/admin)나 Prometheus 텍스트(GET /metrics, secrets 의 [metrics] port)로 봅니다.
+
+느린 재실행의 함수 단위 내역은 관리자 페이지에서 PROFILER 를 걸어 다음 N번의 재실행을 샘플링하고
+collapsed stack(플레임그래프 입력)으로 내려받습니다.
+"""
+
+from .profiler import PROFILER, SamplingProfiler
+from .timers import (
+    BUCKETS, REGISTRY, Histogram, Registry, enable, enabled, render_prometheus, serve_prometheus, summary, timed,
+)
+
+__all__ = [
+    "PROFILER", "SamplingProfiler",
+    "BUCKETS", "REGISTRY", "Histogram", "Registry", "enable", "enabled", "render_prometheus", "serve_prometheus",
+    "summary", "timed",
+]
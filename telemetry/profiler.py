@@ -0,0 +1,176 @@
+# telemetry/profiler.py
+# -------------------------------------------------------------
+# 주문형 샘플링 프로파일러 – 관리자가 켜면 "다음 N번의 재실행"만 스크립트 스레드 스택을 주기적으로 샘플링
+# -------------------------------------------------------------
+#   PROFILER.arm(reruns=5, interval=0.005, pages={"years"})   # 관리자 페이지의 버튼
+#   with PROFILER.rerun("years"):                             # app_core.run() 이 페이지 실행을 감쌈
+#       page.run()
+#   PROFILER.collapsed()                                      # "rerun:years;run (views/years.py:1);... 37"
+#
+# - 서버 재시작·외부 도구 없이 프로세스 안에서 동작 (sys._current_frames 를 읽는 데몬 스레드 하나)
+# - 캡처가 걸려 있지 않으면 rerun() 은 공유 no-op 을 돌려줄 뿐이고 샘플러 스레드도 없음
+# - 캡처 중에도 샘플링 대상은 캡처에 잡힌 재실행의 스레드뿐, 스택은 app_core.run() 아래만 (Streamlit 실행기 프레임 제외)
+# - 출력은 collapsed stack 형식 (flamegraph.pl, speedscope, inferno 에서 그대로 열림)
+# - 샘플 주기 기본 5ms: 샘플 하나 = 대상 스레드 스택을 한 번 훑는 비용(수십 µs) → 캡처 중 오버헤드 ~1% 안팎
+# -------------------------------------------------------------
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+ROOT = str(Path(__file__).resolve().parents[1]) + os.sep
+MIN_INTERVAL = 0.001
+_NOOP = nullcontext()
+
+
+def _short_path(filename: str) -> str:
+    if filename.startswith(ROOT):
+        return filename[len(ROOT):]
+    head, sep, tail = filename.rpartition("site-packages" + os.sep)
+    return tail if sep else os.path.basename(filename)
+
+
+class SamplingProfiler:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._remaining = 0  # 아직 시작하지 않은, 캡처할 재실행 수
+        self._active: Dict[int, Tuple[FrameType, str]] = {}  # 스레드 id → (기준 프레임, 루트 라벨)
+        self._pages: Optional[FrozenSet[str]] = None
+        self._thread: Optional[threading.Thread] = None
+        self._labels: Dict[CodeType, str] = {}
+        self.interval = 0.005
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.reruns = 0
+        self.rerun_s = 0.0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    # ---- 제어 ----
+    def arm(self, reruns: int, interval: float = 0.005, pages: Optional[Iterable[str]] = None) -> None:
+        """이전 결과를 지우고 다음 reruns 번의 재실행을 캡처 (pages 가 있으면 그 페이지의 재실행만)"""
+        with self._lock:
+            self.stacks = Counter()
+            self.samples = self.reruns = 0
+            self.rerun_s = 0.0
+            self.interval = max(MIN_INTERVAL, interval)
+            self._pages = frozenset(pages) if pages else None
+            self._remaining = max(0, int(reruns))
+            self.started, self.finished = time.time(), None
+            if self._thread is None and self._remaining:
+                self._thread = threading.Thread(target=self._loop, name="rerun-sampler", daemon=True)
+                self._thread.start()
+
+    def stop(self) -> None:
+        """남은 캡처 취소 (진행 중인 재실행은 끝까지 샘플링)"""
+        with self._lock:
+            self._remaining = 0
+
+    def rerun(self, page: str) -> Any:
+        """페이지 재실행 한 번을 감싸는 컨텍스트. 캡처가 걸려 있지 않으면 공유 no-op"""
+        if not self._remaining:
+            return _NOOP
+        return _Capture(self, page, sys._getframe(1))
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"armed": self._remaining, "running": len(self._active), "reruns": self.reruns,
+                    "samples": self.samples, "rerun_s": round(self.rerun_s, 3), "interval_ms": self.interval * 1000,
+                    "pages": sorted(self._pages) if self._pages else None,
+                    "started": self.started, "finished": self.finished}
+
+    # ---- 샘플링 ----
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = (f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+                                          .replace(";", ":"))
+        return label
+
+    def _sample(self, targets: List[Tuple[int, Tuple[FrameType, str]]]) -> List[str]:
+        frames = sys._current_frames()
+        out = []
+        for tid, (root, rlabel) in targets:
+            f = frames.get(tid)
+            stack = []
+            while f is not None and f is not root:
+                stack.append(self._label(f.f_code))
+                f = f.f_back
+            stack.append(rlabel)
+            out.append(";".join(reversed(stack)))
+        return out
+
+    def _loop(self) -> None:
+        while True:
+            with self._lock:
+                if not self._remaining and not self._active:
+                    self._thread = None
+                    self.finished = time.time()
+                    return
+                targets = list(self._active.items())
+            if targets:
+                stacks = self._sample(targets)
+                with self._lock:
+                    self.stacks.update(stacks)
+                    self.samples += len(stacks)
+            time.sleep(self.interval)
+
+    # ---- 결과 ----
+    def collapsed(self) -> str:
+        """collapsed stack 텍스트 – 한 줄 = "루트;호출자;...;피호출자 샘플수" """
+        with self._lock:
+            items = sorted(self.stacks.items())
+        return "".join(f"{stack} {n}\n" for stack, n in items)
+
+    def top_functions(self, k: int = 20) -> List[Dict[str, Any]]:
+        """함수별 self(스택 맨 끝)·total(스택 어딘가) 샘플 비율, total 순"""
+        with self._lock:
+            items = list(self.stacks.items())
+            total = self.samples
+        self_n: Counter = Counter()
+        incl: Counter = Counter()
+        for stack, n in items:
+            frames = stack.split(";")
+            self_n[frames[-1]] += n
+            for fn in set(frames[1:]):  # 루트 라벨(rerun:<page>)은 제외
+                incl[fn] += n
+        return [{"function": fn, "total_%": round(n / total * 100, 1),
+                 "self_%": round(self_n[fn] / total * 100, 1)}
+                for fn, n in incl.most_common(k)] if total else []
+
+
+class _Capture:
+    __slots__ = ("prof", "page", "root", "t0", "tid")
+
+    def __init__(self, prof: SamplingProfiler, page: str, root: FrameType) -> None:
+        self.prof, self.page, self.root = prof, page, root
+        self.tid: Optional[int] = None
+
+    def __enter__(self) -> "_Capture":
+        p = self.prof
+        with p._lock:
+            if p._remaining and (p._pages is None or self.page in p._pages):
+                p._remaining -= 1
+                self.tid = threading.get_ident()
+                p._active[self.tid] = (self.root, f"rerun:{self.page}")
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self.tid is None:
+            return
+        p = self.prof
+        with p._lock:
+            p._active.pop(self.tid, None)
+            p.reruns += 1
+            p.rerun_s += time.perf_counter() - self.t0
+        self.root = None  # 프레임 참조를 오래 붙잡지 않음
+
+
+PROFILER = SamplingProfiler()
@@ -0,0 +1,178 @@
+# telemetry/timers.py
+# -------------------------------------------------------------
+# 구간 타이머 + 프로세스 내 히스토그램 – 재실행이 어느 구간에서 느린지 운영 중에 보기 위한 계측
+# -------------------------------------------------------------
+#   with timed("6-1"):            # 본문 구간 (views/years.py 의 번호)
+#       ...
+#   with timed("engine.compute_posterior"):
+#       ...
+#
+# 꺼져 있으면(기본) timed() 는 미리 만든 no-op 컨텍스트를 돌려줄 뿐이라 비용이 전역 변수 확인 한 번.
+# 켜면 구간 이름별 고정 버킷 히스토그램에 누적 (메모리는 구간 수 × 버킷 수로 고정, 세션 수와 무관).
+# 출력: render_prometheus() → Prometheus 텍스트 형식 (saju_section_seconds{section="..."})
+#       serve_prometheus(port) → GET /metrics 를 답하는 스레드 HTTP 서버 (표준 라이브러리)
+#       summary() → 관리자 페이지용 {구간: count/sum/p50/p95/p99}
+# 켜는 법: enable() – 앱은 secrets 의 [metrics] enabled / 환경변수 SAJU_METRICS=1 로 (app_core.get_metrics)
+# -------------------------------------------------------------
+
+import bisect
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, Sequence, Tuple
+
+# 버킷 상한 (초) – 1ms ~ 10s, 마지막 +Inf 는 count 로 대신
+BUCKETS: Tuple[float, ...] = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRIC = "saju_section_seconds"
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Sequence[float] = BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # 마지막 칸 = 상한 초과
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """버킷 안 선형 보간으로 q 분위수 추정 (Prometheus histogram_quantile 과 같은 방식)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, c in enumerate(self.counts):
+            upper = self.bounds[i] if i < len(self.bounds) else self.max
+            if c and seen + c >= rank:
+                return min(lower + (upper - lower) * (rank - seen) / c, self.max)
+            seen += c
+            lower = upper
+        return self.max
+
+
+class Registry:
+    """구간 이름 → Histogram. observe 는 잠금 하나 (세션 스레드 간 공유)"""
+
+    def __init__(self, bounds: Sequence[float] = BUCKETS) -> None:
+        self.bounds = tuple(bounds)
+        self._hists: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    def observe(self, name: str, seconds: float) -> None:
+        with self._lock:
+            h = self._hists.get(name)
+            if h is None:
+                h = self._hists[name] = Histogram(self.bounds)
+            h.observe(seconds)
+
+    def snapshot(self) -> Dict[str, Histogram]:
+        with self._lock:
+            out = {}
+            for name, h in self._hists.items():
+                c = out[name] = Histogram(self.bounds)
+                c.counts, c.count, c.sum, c.max = list(h.counts), h.count, h.sum, h.max
+            return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hists.clear()
+            self.started = time.time()
+
+
+REGISTRY = Registry()
+_enabled = False
+_NOOP = nullcontext()
+
+
+class _Timer:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> "_Timer":
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        # st.stop()/st.rerun() 같은 제어 흐름 예외로 빠져나가도 그때까지의 시간은 기록
+        REGISTRY.observe(self.name, time.perf_counter() - self.t0)
+
+
+def timed(name: str):
+    """구간 타이머 컨텍스트. 꺼져 있으면 공유 no-op"""
+    return _Timer(name) if _enabled else _NOOP
+
+
+def enable(on: bool = True) -> None:
+    global _enabled
+    _enabled = on
+
+
+def enabled() -> bool:
+    return _enabled
+
+
+# ---- 출력 ----
+def _fmt(v: float) -> str:
+    return repr(float(v)) if v != int(v) else f"{v:.1f}"
+
+
+def render_prometheus(registry: Registry = REGISTRY) -> str:
+    lines = [f"# HELP {METRIC} Streamlit rerun section and engine call durations.",
+             f"# TYPE {METRIC} histogram"]
+    for name, h in sorted(registry.snapshot().items()):
+        label = name.replace("\\", "\\\\").replace('"', '\\"')
+        cum = 0
+        for bound, c in zip(h.bounds, h.counts):
+            cum += c
+            lines.append(f'{METRIC}_bucket{{section="{label}",le="{_fmt(bound)}"}} {cum}')
+        lines.append(f'{METRIC}_bucket{{section="{label}",le="+Inf"}} {h.count}')
+        lines.append(f'{METRIC}_sum{{section="{label}"}} {h.sum!r}')
+        lines.append(f'{METRIC}_count{{section="{label}"}} {h.count}')
+    return "\n".join(lines) + "\n"
+
+
+def summary(registry: Registry = REGISTRY) -> Dict[str, Dict[str, float]]:
+    """{구간: {count, total_s, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}} – 분위수는 버킷 보간 추정"""
+    return {
+        name: {"count": h.count, "total_s": round(h.sum, 3),
+               "mean_ms": round(h.sum / h.count * 1000, 2) if h.count else 0.0,
+               **{f"p{int(q * 100)}_ms": round(h.quantile(q) * 1000, 2) for q in (0.5, 0.95, 0.99)},
+               "max_ms": round(h.max * 1000, 2)}
+        for name, h in sorted(registry.snapshot().items())
+    }
+
+
+def serve_prometheus(port: int, host: str = "127.0.0.1", registry: Registry = REGISTRY) -> Any:
+    """GET /metrics 를 답하는 HTTP 서버를 데몬 스레드로 시작하고 서버 객체를 반환"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus(registry).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            pass  # 스크레이프마다 stderr 로그를 남기지 않음
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
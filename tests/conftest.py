@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# 저장소 루트를 import 경로에 (bench/ 스크립트와 같은 방식)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from saju_engine import (  # noqa: E402
+    ELEM_LIST, EVENT_CATS, TYPE_CODES, axis_dict, elem_weights_for_year, infer_mbti_from_elements,
+    saju_year_summary,
+)
+from saju_engine.batch import (  # noqa: E402
+    _round3, counts_matrix, infer_mbti_batch, posterior_batch, prior_axis_batch, top_k_types_batch,
+    year_range_inputs,
+)
+from saju_engine.core import _apply_event_update, _candidates_from_axis, _type_prob_from_vec  # noqa: E402
+
+CATS = [cat for cat, _ in EVENT_CATS]
+ANSWERS = ("맞다", "틀리다", "모름/패스")
+
+
+def _random_weights(rng, n):
+    rows = []
+    for _ in range(n):
+        # 0 이 섞인 정수·반정수 가중치 → 축 점수 0 경계와 round 동률이 자주 나옴
+        rows.append([rng.choice([0.0, 0.5, 1.0, 1.5, rng.random()]) for _ in ELEM_LIST])
+    return rows
+
+
+def _assert_batch_matches_scalar(w, yang):
+    batch = infer_mbti_batch(w, yang)
+    for i, (row, y) in enumerate(zip(w, yang)):
+        cands = infer_mbti_from_elements(dict(zip(ELEM_LIST, row)), "양" if y else "음")
+        assert batch.codes()[i] == cands[0].code
+        assert batch.score[i] == cands[0].score  # 비트 단위 일치
+        alts = {c.code: c.score for c in cands[1:]}
+        alt_codes = {TYPE_CODES[c] for c, near in zip(batch.alt_codes()[i], batch.near[i]) if near}
+        assert alt_codes == set(alts)
+        assert all(s == batch.alt_score[i] for s in alts.values())
+        assert batch.candidates(i) == cands
+
+
+def test_infer_mbti_batch_matches_scalar_on_random_weights():
+    rng = random.Random(7)
+    w = _random_weights(rng, 500)
+    _assert_batch_matches_scalar(w, [rng.random() < 0.5 for _ in w])
+
+
+def test_infer_mbti_batch_matches_scalar_on_birth_years():
+    w, yang = year_range_inputs(1900, 2100)
+    for i, year in enumerate(range(1900, 2101)):
+        expect = elem_weights_for_year(saju_year_summary(year))
+        assert w[i].tolist() == [expect[e] for e in ELEM_LIST]
+    _assert_batch_matches_scalar(w.tolist(), yang.tolist())
+
+
+def test_round3_matches_python_round_on_ties():
+    # x*1000 이 .5 근처인 값 – np.round 와 파이썬 round 가 갈리는 곳
+    xs = [0.0005, 0.0015, 0.0025, 1.0005, 0.8125, 0.6245, 0.3335, 2.675, 0.1235] + [k / 2000 for k in range(1, 4000, 2)]
+    assert _round3(np.array(xs)).tolist() == [round(x, 3) for x in xs]
+
+
+def _random_db(rng, n_years):
+    db = {}
+    for y in rng.sample(range(1950, 2100), n_years):
+        db[y] = {cat: {"ans": rng.choice(ANSWERS), "memo": ""} for cat in rng.sample(CATS, 3)}
+    return db
+
+
+def test_posterior_batch_matches_scalar_update():
+    rng = random.Random(11)
+    dbs = [_random_db(rng, rng.randint(0, 40)) for _ in range(200)]
+    axis_scores = infer_mbti_batch(_random_weights(rng, len(dbs)), [True] * len(dbs)).axis
+    prior = prior_axis_batch(axis_scores)
+    post = posterior_batch(prior, counts_matrix(dbs))
+    for i, db in enumerate(dbs):
+        expect = _apply_event_update(axis_dict(prior[i].tolist()), db)
+        assert post[i].tolist() == pytest.approx(list(expect.values()), rel=1e-12, abs=1e-15)
+
+
+def test_top_k_types_batch_matches_scalar_including_ties():
+    rng = random.Random(3)
+    rows = []
+    for _ in range(500):
+        row = []
+        for _ in range(4):
+            q = rng.choice([0.5, 0.25, 0.75, rng.random()])  # 0.5 축 → 동률 유형
+            row += [q, 1 - q]
+        rows.append(row)
+    idx, p = top_k_types_batch(np.array(rows), 5)
+    for row, codes, probs in zip(rows, idx, p):
+        expect = _type_prob_from_vec(row, 5)
+        assert [TYPE_CODES[c] for c in codes] == [c for c, _ in expect]
+        assert probs.tolist() == [q for _, q in expect]
+
+
+def test_candidates_from_axis_roundtrip():
+    batch = infer_mbti_batch([[0.2, 0.2, 0.2, 0.2, 0.2]], [False])
+    assert batch.candidates(0) == _candidates_from_axis(batch.axis[0].tolist())
@@ -0,0 +1,65 @@
+import pytest
+
+from saju_engine import HYPOTHESES_CACHE, year_hypotheses, year_hypotheses_range
+from saju_engine.cache import LRUCache
+from saju_engine.codes import EVENT_CATS
+from saju_engine.core import ELEM_LABELS, deterministic_topics, warm_hypotheses_cache
+
+
+def test_lru_evicts_least_recently_used():
+    c = LRUCache(maxsize=3)
+    for k in "abc":
+        c.put(k, k.upper())
+    assert c.get("a") == "A"  # a 가 최근 사용 → b 가 가장 오래됨
+    c.put("d", "D")
+    assert c.get("b") is None
+    c.put("c", "C2")  # 덮어쓰기도 최근 사용으로 갱신
+    c.put("e", "E")
+    assert [c.get(k) for k in "acde"] == [None, "C2", "D", "E"]
+    assert len(c) == 3
+
+
+def test_lru_counters_and_clear():
+    c = LRUCache(maxsize=2)
+    assert c.info().hit_rate == 0.0
+    c.put(1, "x")
+    c.get(1), c.get(1), c.get(2)
+    info = c.info()
+    assert (info.hits, info.misses, info.size, info.maxsize) == (2, 1, 1, 2)
+    assert info.hit_rate == pytest.approx(2 / 3)
+    c.clear()
+    assert c.info() == type(info)(hits=0, misses=0, size=0, maxsize=2)
+
+
+@pytest.fixture
+def empty_hypotheses_cache():
+    HYPOTHESES_CACHE.clear()
+    yield HYPOTHESES_CACHE
+    HYPOTHESES_CACHE.clear()
+
+
+def _uncached(birth_year, elem, year):
+    return [EVENT_CATS[i] for i in deterministic_topics(f"{birth_year}-{elem}", year, k=3)]
+
+
+def test_cached_hypotheses_equal_uncached(empty_hypotheses_cache):
+    cache = empty_hypotheses_cache
+    first = {(by, y): year_hypotheses(by, "목", y) for by in (1950, 1990) for y in range(2000, 2010)}
+    assert cache.info().misses == 20 and cache.info().hits == 0
+    again = {(by, y): year_hypotheses(by, "목", y) for by in (1950, 1990) for y in range(2000, 2010)}
+    assert cache.info().hits == 20
+    assert first == again == {(by, y): _uncached(by, "목", y) for by, y in first}
+    # 호출자가 결과를 바꿔도 캐시에 남은 값은 그대로
+    again[1950, 2000].append("x")
+    assert year_hypotheses(1950, "목", 2000) == first[1950, 2000]
+
+
+def test_warmed_hypotheses_equal_uncached(empty_hypotheses_cache):
+    cache = empty_hypotheses_cache
+    n = warm_hypotheses_cache(birth_years=range(1985, 1988), years=range(2020, 2031))
+    assert n == 3 * len(ELEM_LABELS) * 11 == len(cache)
+    for elem in ELEM_LABELS:
+        got = year_hypotheses_range(1986, elem, 2020, 2030)
+        assert got == {y: _uncached(1986, elem, y) for y in range(2020, 2031)}
+    assert cache.info().misses == 0
+    assert warm_hypotheses_cache(years=[]) == 0
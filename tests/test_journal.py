@@ -0,0 +1,54 @@
+import time
+
+import pytest
+
+from storage import AnalyticsStore, Journal
+
+pytest.importorskip("pyarrow")
+
+
+def _wait_for(cond, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if cond():
+            return True
+        time.sleep(0.01)
+    return cond()
+
+
+def _answer(user, year, ans="맞다"):
+    return {"type": "answer", "user": user, "year": year, "cat": "직장·커리어", "ans": ans, "memo": "",
+            "birth_year": 1990, "elem": "목", "mbti": "ENTJ"}
+
+
+def test_sealed_segment_reaches_analytics_without_restart(tmp_path):
+    store = AnalyticsStore(str(tmp_path / "analytics"))
+    # 작은 세그먼트 한도 → 쓰기 스레드가 봉인하면 압축 스레드가 주기(1시간)를 기다리지 않고 깨어남
+    journal = Journal(str(tmp_path / "journal"), commit_interval=0.001, segment_bytes=256)
+    journal.start_compactor(interval=3600, on_segment=store.ingest)
+    try:
+        assert _wait_for(lambda: journal.compactions >= 1)  # 시작 시 한 번 (빈 로그)
+        for y in range(2000, 2005):
+            journal.append(_answer("u1", y), wait=True)
+        # Parquet 적재(on_segment)가 스냅샷 기록보다 먼저라 둘 다 기다림
+        assert _wait_for(lambda: (tmp_path / "analytics" / "answers").exists()
+                         and store.read("answers").num_rows >= 1
+                         and (tmp_path / "journal" / "snapshots" / "u1.json").exists())
+        assert journal.last_compact_error == ""
+    finally:
+        journal.close()
+
+
+def test_compactor_keeps_replay_consistent(tmp_path):
+    journal = Journal(str(tmp_path / "journal"), commit_interval=0.001)
+    journal.start_compactor(interval=0.05)
+    try:
+        for y in range(2000, 2010):
+            journal.append(_answer("u2", y, "틀리다" if y % 2 else "맞다"))
+        journal.sync()
+        assert _wait_for(lambda: len(journal._segments()) == 1 and journal.compactions >= 3)
+        db = journal.replay("u2")["experience_db"]
+        assert sorted(db) == list(range(2000, 2010))
+        assert db[2001]["직장·커리어"]["ans"] == "틀리다"
+    finally:
+        journal.close()
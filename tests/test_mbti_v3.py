@@ -0,0 +1,60 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+import app_core
+import saju_engine
+from saju_engine import MBTI_ELEMENTS, MBTI_LIST
+from storage import SQLiteBackend
+
+PAGE = str(Path(__file__).resolve().parents[1] / "views" / "mbti_v3.py")
+
+
+def test_double_submit_spools_one_row(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # var/ (이벤트 로그·스풀·SQLite) 는 임시 디렉터리에
+    app_core.get_journal.clear()
+    app_core.get_submission_queue.clear()
+    at = AppTest.from_file(PAGE, default_timeout=60)
+    at.session_state["stage"] = 4
+    at.session_state["mbti"] = "INTP"
+    at.run()
+    for _ in range(2):  # 두 번째는 비활성 버튼을 또 누른 경우 (더블 클릭)
+        at.button(key="v3_submit").click().run()
+    assert not at.exception
+    assert at.button(key="v3_submit").disabled
+
+    queue = app_core.get_submission_queue()
+    try:
+        assert queue.flush(timeout=10)
+        assert queue.stats.submitted == 1
+    finally:
+        queue.close()
+        app_core.get_journal().close()
+        app_core.get_submission_queue.clear()
+        app_core.get_journal.clear()
+    rows = list(SQLiteBackend("var/responses.sqlite3").iter_rows())
+    assert [r["id"] for r in rows] == [at.session_state["v3_submission_id"]]
+
+
+def _render_stages(mbti):
+    at = AppTest.from_file(PAGE, default_timeout=60)
+    at.session_state["mbti"] = mbti
+    at.session_state["birth_date"] = date(1990, 5, 17)
+    for stage in (1.5, 2.5, 4):
+        at.session_state["stage"] = stage
+        at.run()
+        assert not at.exception, (mbti, stage, at.exception)
+    return at
+
+
+@pytest.mark.parametrize("mbti", MBTI_LIST)
+def test_every_type_renders_each_stage(mbti):
+    _render_stages(mbti)
+
+
+def test_type_without_element_weights_falls_back(monkeypatch):
+    monkeypatch.setattr(saju_engine, "MBTI_ELEMENTS", {k: v for k, v in MBTI_ELEMENTS.items() if k != "ENTJ"})
+    at = _render_stages("ENTJ")
+    assert any("균등 가중치" in w.value for w in at.warning)
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from saju_engine import EVENT_CATS, PosteriorAccumulator, answer_counts, compute_posterior, infer_mbti_from_elements
+from saju_engine.core import _prior_axis_vec, _type_prob_from_vec
+
+CATS = [cat for cat, _ in EVENT_CATS]
+ANSWERS = ("맞다", "틀리다", "모름/패스")
+CANDS = infer_mbti_from_elements({"목": 0.5, "화": 0.5, "토": 0.0, "금": 0.0, "수": 0.0}, "양")
+
+
+def _assert_matches_recompute(acc, db):
+    assert acc.counts == answer_counts(db)  # 정수 counts 는 정확히
+    got, expect = acc.compute(CANDS), compute_posterior(CANDS, db)
+    assert list(got.axis.values()) == pytest.approx(list(expect.axis.values()), rel=1e-12)
+    assert [p for _, p in got.top_codes] == pytest.approx([p for _, p in expect.top_codes], rel=1e-12)
+    # 16유형 전체 확률 비교 – 누적 오프셋은 재계산과 마지막 비트가 다를 수 있어(0.5 축 등)
+    # 동률 유형끼리의 순서는 달라질 수 있으므로 순위 대신 유형별 확률로
+    full = dict(_type_prob_from_vec(acc.posterior_vec(_prior_axis_vec(CANDS))))
+    assert full == pytest.approx(dict(_type_prob_from_vec(list(expect.axis.values()))), rel=1e-12)
+
+
+def test_set_clear_replace_match_full_recompute():
+    rng = random.Random(5)
+    acc, db = PosteriorAccumulator(), {}
+    for step in range(2000):
+        y, cat = rng.randint(2000, 2030), rng.choice(CATS)
+        op = rng.random()
+        if op < 0.6:  # 설정·교체
+            ans = rng.choice(ANSWERS)
+        elif op < 0.8:  # 모름/패스로 되돌림 (= 지움)
+            ans = "모름/패스"
+        else:  # 같은 값 다시 설정 → 변화 없음
+            ans = db.get(y, {}).get(cat, {}).get("ans", "모름/패스")
+        prev = db.get(y, {}).get(cat, {}).get("ans", "모름/패스")
+        changed = acc.set_answer(y, cat, ans)
+        assert changed == (ans != prev)
+        db.setdefault(y, {})[cat] = {"ans": ans, "memo": ""}
+        if step % 100 == 0:
+            _assert_matches_recompute(acc, db)
+    _assert_matches_recompute(acc, db)
+    assert acc.reconcile() < 1e-9
+    assert acc.reconcile(db) < 1e-9
+
+
+def test_from_db_matches_compute_posterior():
+    rng = random.Random(9)
+    db = {y: {cat: {"ans": rng.choice(ANSWERS), "memo": ""} for cat in rng.sample(CATS, 3)}
+          for y in range(1990, 2060)}
+    _assert_matches_recompute(PosteriorAccumulator.from_db(db), db)
+
+
+def test_reconcile_detects_count_drift():
+    acc = PosteriorAccumulator()
+    acc.set_answer(2000, CATS[0], "맞다")
+    assert acc.reconcile({}) == float("inf")
+    assert acc.counts == [0] * len(CATS)
+    _assert_matches_recompute(acc, {})
+
+
+def test_unknown_category_is_ignored():
+    acc = PosteriorAccumulator()
+    assert not acc.set_answer(2000, "없는 테마", "맞다")
+    _assert_matches_recompute(acc, {})
@@ -0,0 +1,59 @@
+import json
+
+from storage import Backend, SQLiteBackend, SubmissionQueue
+
+
+class RejectingBackend(Backend):
+    """id 가 'bad' 로 시작하는 행이 든 배치는 통째로 거부 (백엔드 검증 오류 흉내)"""
+
+    def __init__(self, inner: Backend) -> None:
+        self.inner = inner
+        self.calls = 0
+
+    def write_batch(self, rows):
+        self.calls += 1
+        if any(r["id"].startswith("bad") for r in rows):
+            raise ValueError("schema violation")
+        self.inner.write_batch(rows)
+
+
+def _queue(tmp_path, backend, **kw):
+    return SubmissionQueue(backend, spool_dir=str(tmp_path / "spool"), flush_interval=0.05,
+                           backoff_base=0.001, backoff_max=0.01, **kw)
+
+
+def test_bad_row_is_dead_lettered_and_queue_keeps_moving(tmp_path):
+    db = SQLiteBackend(str(tmp_path / "r.sqlite3"))
+    q = _queue(tmp_path, RejectingBackend(db), max_attempts=3)
+    try:
+        for i in range(5):
+            q.submit({"id": f"ok{i}", "mbti": "ENTJ"})
+        q.submit({"id": "bad0", "mbti": "INTP"})
+        assert q.flush(timeout=10)
+        q.submit({"id": "ok-after", "mbti": "ISFP"})
+        assert q.flush(timeout=10)
+        assert db.count() == 6
+        assert q.stats.dead == 1
+        dead = q.dead_letters()
+        assert [d["row"]["id"] for d in dead] == ["bad0"]
+        assert "schema violation" in dead[0]["error"]
+    finally:
+        q.close()
+    # 데드레터 행은 재시작 때 다시 복구되지 않음
+    assert not json.loads("[" + ",".join((tmp_path / "spool" / "pending.jsonl").read_text().splitlines()) + "]")
+
+
+def test_requeue_dead_letters(tmp_path):
+    db = SQLiteBackend(str(tmp_path / "r.sqlite3"))
+    backend = RejectingBackend(db)
+    q = _queue(tmp_path, backend, max_attempts=1)
+    try:
+        q.submit({"id": "bad1"})
+        assert q.flush(timeout=10)
+        assert q.stats.dead == 1
+        backend.write_batch = db.write_batch  # 백엔드 쪽 문제를 고쳤다고 가정
+        assert q.requeue_dead_letters() == 1
+        assert q.flush(timeout=10)
+        assert db.count() == 1 and not q.dead_letters()
+    finally:
+        q.close()
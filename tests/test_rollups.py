@@ -0,0 +1,75 @@
+import random
+from pathlib import Path
+
+from storage import RollupStore, SQLiteBackend, diff_snapshots
+from storage.__main__ import main as storage_main
+
+MBTIS = ("INTP", "ENFJ", "ISTJ", "ESFP")
+ELEMS = ("wood", "fire", "earth", "metal", "water")
+
+
+def _rows(n, seed=7):
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        row = {"id": f"r{i}", "mbti": rng.choice(MBTIS), "timestamp": f"2025-{rng.randint(1, 12):02d}-01T00:00:00",
+               "events": [{"type": rng.choice(("전직/이직", "이사", "연애"))} for _ in range(rng.randint(0, 3))]}
+        if i % 5:  # 다섯 중 하나는 오행 점수 없는 제출 (mbti 에만 집계)
+            row["mbti_elements"] = {e: rng.randint(1, 5) for e in ELEMS}
+        rows.append(row)
+    return rows
+
+
+def test_incremental_rollups_match_rebuild_and_verify(tmp_path, capsys):
+    db_path, rollup_path = str(tmp_path / "responses.sqlite3"), str(tmp_path / "rollups.sqlite3")
+    rows = _rows(60)
+    backend = SQLiteBackend(db_path)
+    store = RollupStore(rollup_path)
+    try:
+        for i in range(0, len(rows), 7):
+            batch = rows[i:i + 7]
+            backend.write_batch(batch)
+            assert store.add_batch(batch) == len(batch)
+        # 큐 재시도·복구로 같은 행이 다시 와도 집계는 한 번만
+        assert store.add_batch(rows[3:10]) == 0
+        snap = store.snapshot()
+    finally:
+        store.close()
+        backend.close()
+    assert snap["total"] == len(rows)
+    assert sum(snap["mbti_elem"].values()) == sum(1 for r in rows if "mbti_elements" in r)
+
+    fresh = RollupStore(":memory:")
+    assert fresh.rebuild(SQLiteBackend(db_path).iter_rows()) == len(rows)
+    assert diff_snapshots(snap, fresh.snapshot()) == []
+
+    storage_main(["--db", db_path, "--rollups", rollup_path, "rollups", "--rebuild", "--verify"])
+    assert "rollups match a full rebuild" in capsys.readouterr().out
+
+
+def test_diff_snapshots_reports_drift():
+    a, b = RollupStore(":memory:"), RollupStore(":memory:")
+    a.add_batch(_rows(10))
+    b.add_batch(_rows(9))
+    diffs = diff_snapshots(a.snapshot(), b.snapshot())
+    assert any(d.startswith("/total:") for d in diffs)
+
+
+def test_admin_page_without_element_scores(tmp_path, monkeypatch):
+    from streamlit.testing.v1 import AppTest
+
+    import app_core
+
+    monkeypatch.chdir(tmp_path)  # var/rollups.sqlite3 는 임시 디렉터리에
+    app_core.get_rollups.clear()
+    app_core.get_rollups().add_batch([{"id": "a", "mbti": "INTP"}, {"id": "b", "mbti": "ENFJ"}])
+    try:
+        at = AppTest.from_file(str(Path(__file__).resolve().parents[1] / "views" / "admin_stats.py"))
+        at.secrets["admin"] = {"password": "pw"}
+        at.run()
+        at.text_input(key="admin_pw").input("pw").run()
+        assert not at.exception
+        assert any("오행 점수가 있는 제출" in i.value for i in at.info)
+    finally:
+        app_core.get_rollups().close()
+        app_core.get_rollups.clear()
@@ -0,0 +1,67 @@
+import pytest
+
+from service.api import MAX_BATCH, MAX_RANGE, YEAR_MAX, YEAR_MIN, ApiError, _elem, _year, handle, hypotheses, score
+
+
+@pytest.mark.parametrize("value, expected", [(1990, 1990), ("2001", 2001), (YEAR_MIN, YEAR_MIN), (YEAR_MAX, YEAR_MAX)])
+def test_year_accepts_ints_and_numeric_strings(value, expected):
+    assert _year({"y": value}, "y") == expected
+
+
+@pytest.mark.parametrize("req, message", [
+    ({}, "missing field: y"),
+    ({"y": "abc"}, "expected an integer year"),
+    ({"y": None}, "missing field: y"),
+    ({"y": YEAR_MIN - 1}, "out of range"),
+    ({"y": YEAR_MAX + 1}, "out of range"),
+])
+def test_year_rejects(req, message):
+    with pytest.raises(ApiError, match=message) as e:
+        _year(req, "y")
+    assert e.value.status == 400
+
+
+def test_year_default():
+    assert _year({}, "y", 1990) == 1990
+
+
+@pytest.mark.parametrize("value, expected", [("목", "목"), ("wood", "목"), ("WATER", "수"), ("금", "금")])
+def test_elem_aliases(value, expected):
+    assert _elem(value) == expected
+
+
+@pytest.mark.parametrize("value", ["나무", "", None, 3])
+def test_elem_rejects(value):
+    with pytest.raises(ApiError, match="unknown element"):
+        _elem(value)
+
+
+def test_hypotheses_default_range_is_clamped_to_year_max():
+    out = hypotheses({"birth_year": 2095, "elem": "wood"})
+    assert sorted(map(int, out["years"])) == list(range(2095, YEAR_MAX + 1))
+    assert len(hypotheses({"birth_year": 1990, "elem": "목"})["years"]) == 11
+
+
+def test_hypotheses_range_limits():
+    with pytest.raises(ApiError, match="range too large"):
+        hypotheses({"birth_year": 1900, "elem": "목", "from": 1900, "to": 1900 + MAX_RANGE})
+    assert len(hypotheses({"birth_year": 1900, "elem": "목", "from": 1900, "to": 1900 + MAX_RANGE - 1})["years"]) == MAX_RANGE
+    with pytest.raises(ApiError, match="must not be before"):
+        hypotheses({"birth_year": 1990, "elem": "목", "from": 2000, "to": 1999})
+
+
+def test_handle_batch_reports_errors_per_item():
+    out = handle(score, [{"birth_year": 1990}, {"birth_year": "x"}, "not an object", {"birth_year": 2000}])
+    assert out[0]["birth_year"] == 1990 and out[3]["birth_year"] == 2000
+    assert "expected an integer year" in out[1]["error"]
+    assert "JSON object" in out[2]["error"]
+    assert handle(score, {"birth_year": 1990}) == out[0]
+    with pytest.raises(ApiError):
+        handle(score, {"birth_year": "x"})
+
+
+def test_handle_batch_size_limit():
+    assert len(handle(score, [{"birth_year": 1990}] * MAX_BATCH)) == MAX_BATCH
+    with pytest.raises(ApiError) as e:
+        handle(score, [{"birth_year": 1990}] * (MAX_BATCH + 1))
+    assert e.value.status == 413
@@ -0,0 +1,35 @@
+import pytest
+
+from saju_engine import stories
+
+GOOD = "{title: t, emoji: e, keywords: [k], personality: p, career: [c], relationships: r}"
+
+
+@pytest.fixture
+def story_file(tmp_path):
+    src = tmp_path / "stories.yaml"
+    src.write_text(f"INTP:\n  wood: {GOOD}\n  fire: {{title: 3}}\nXXXX: {{}}\n", encoding="utf-8")
+    return src, tmp_path / "stories.idx"
+
+
+def test_build_is_strict(story_file):
+    src, idx = story_file
+    with pytest.raises(stories.StorySchemaError):
+        stories.build_story_index(src, idx)
+    assert not idx.exists()
+
+
+def test_runtime_load_skips_bad_stories(story_file, caplog):
+    src, idx = story_file
+    index = stories.load_story_index(src, idx)
+    assert set(index) == {("INTP", "wood")}
+    assert index["INTP", "wood"]["career"] == ("c",)
+    assert "INTP.fire.title" in caplog.text and "XXXX" in caplog.text
+    assert not idx.exists()  # 오류가 있으면 산출물을 남기지 않아 다음 프로세스도 다시 보고
+
+
+def test_runtime_load_survives_unparsable_yaml(tmp_path, caplog):
+    src = tmp_path / "stories.yaml"
+    src.write_text("INTP: [", encoding="utf-8")
+    assert dict(stories.load_story_index(src, tmp_path / "stories.idx")) == {}
+    assert "unusable" in caplog.text
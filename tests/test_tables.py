@@ -0,0 +1,9 @@
+from saju_engine import ELEMENT_KR, MBTI_ELEMENTS, MBTI_LIST
+from saju_engine.codes import TYPE_CODES
+
+
+def test_every_mbti_type_has_element_weights():
+    assert sorted(MBTI_LIST) == sorted(TYPE_CODES)
+    assert sorted(MBTI_ELEMENTS) == sorted(MBTI_LIST)
+    for mbti, weights in MBTI_ELEMENTS.items():
+        assert set(weights) == set(ELEMENT_KR), mbti
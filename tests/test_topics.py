@@ -0,0 +1,37 @@
+import hashlib
+
+import pytest
+
+from saju_engine import ELEM_LIST
+from saju_engine.codes import EVENT_CATS
+from saju_engine.core import deterministic_topics, topics_for_years
+
+
+def _baseline_topics(seed_text, year, k=3):
+    # 테이블 도입 전 방식 그대로: md5 hex 를 8자리씩 끊어 pool 에서 pop
+    h = hashlib.md5(f"{seed_text}-{year}".encode()).hexdigest()
+    ints = [int(h[i:i + 8], 16) for i in range(0, 32, 8)]
+    pool = list(range(len(EVENT_CATS)))
+    return [pool.pop(ints[i] % len(pool)) for i in range(min(k, len(pool)))]
+
+
+SEEDS = [f"{by}-{elem}" for by in range(1900, 2101, 7) for elem in ELEM_LIST]
+
+
+@pytest.mark.parametrize("k", [1, 2, 3, 4])
+def test_md5_mode_matches_baseline_selection(k):
+    for seed in SEEDS:
+        for year in range(1900, 2101, 13):
+            assert deterministic_topics(seed, year, k) == _baseline_topics(seed, year, k), (seed, year, k)
+
+
+@pytest.mark.parametrize("mode", ["md5", "blake2b"])
+def test_topics_for_years_matches_per_year_calls(mode):
+    for seed in SEEDS[::5]:
+        ranged = topics_for_years(seed, 1990, 2030, mode=mode)
+        assert [list(t) for t in ranged] == [deterministic_topics(seed, y, mode=mode) for y in range(1990, 2031)]
+
+
+def test_md5_mode_rejects_more_than_four_topics():
+    with pytest.raises(ValueError):
+        deterministic_topics("1990-목", 2000, k=5)
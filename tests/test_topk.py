@@ -0,0 +1,68 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from saju_engine import top_k_codes, top_k_product
+from saju_engine.batch import top_k_product_batch
+
+
+def _brute(axes):
+    # 전체 조합을 중첩 for 문 순서로 열거 → 안정 정렬 (동률은 열거 순서)
+    norm = 1.0
+    for ps in axes:
+        norm *= sum(ps)
+    combos = []
+    for idx in itertools.product(*(range(len(ps)) for ps in axes)):
+        p = 1.0
+        for ps, i in zip(axes, idx):
+            p *= ps[i]
+        combos.append((idx, p / (norm or 1.0)))
+    return sorted(combos, key=lambda c: -c[1])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_brute_force(seed):
+    rng = random.Random(seed)
+    axes = [[rng.random() for _ in range(rng.randint(1, 4))] for _ in range(rng.randint(1, 5))]
+    full = _brute(axes)
+    assert top_k_product(axes) == full
+    for k in (0, 1, 3, len(full), len(full) + 5):
+        assert top_k_product(axes, k) == full[:k]
+
+
+def test_ties_follow_enumeration_order():
+    axes = [[0.5, 0.5], [0.25, 0.5, 0.25], [1.0, 1.0]]
+    assert top_k_product(axes) == _brute(axes)
+    assert [idx for idx, _ in top_k_product(axes, 4)] == [(0, 1, 0), (0, 1, 1), (1, 1, 0), (1, 1, 1)]
+
+
+def test_zero_mass_axis():
+    assert top_k_product([[0.0, 0.0], [0.3, 0.7]], 2) == [((0, 1), 0.0), ((0, 0), 0.0)]
+
+
+def test_top_k_codes_labels():
+    axes = [[("E", 0.7), ("I", 0.3)], [("-A", 0.4), ("-T", 0.6)]]
+    assert top_k_codes(axes, 2) == [("E-T", pytest.approx(0.42)), ("E-A", pytest.approx(0.28))]
+
+
+def test_batch_matches_scalar():
+    rng = np.random.default_rng(3)
+    probs = rng.random((50, 4, 3))
+    idx, p = top_k_product_batch(probs, 7)
+    for r in range(len(probs)):
+        want = top_k_product(probs[r].tolist(), 7)
+        assert [tuple(i) for i in idx[r].tolist()] == [w[0] for w in want]
+        np.testing.assert_allclose(p[r], [w[1] for w in want], rtol=1e-12)
+
+
+def test_batch_k_larger_than_combinations_and_ties():
+    probs = np.array([[[0.5, 0.5], [0.5, 0.5]], [[0.2, 0.8], [0.6, 0.4]]])
+    idx, p = top_k_product_batch(probs, 10)
+    assert idx.shape == (2, 4, 2) and p.shape == (2, 4)
+    for r in range(2):
+        want = _brute(probs[r].tolist())
+        # 동률끼리의 순서는 빔 순서라 열거 순서와 다를 수 있음 → 확률 순서와 조합 집합을 비교
+        np.testing.assert_allclose(p[r], [w[1] for w in want], rtol=1e-12)
+        assert sorted(map(tuple, idx[r].tolist())) == sorted(w[0] for w in want)
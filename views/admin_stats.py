@@ -0,0 +1,98 @@
+# views/admin_stats.py
+# -------------------------------------------------------------
+# 관리자 통계 대시보드 (NEXT_STEPS.md E)
+# 응답 전체를 다시 읽지 않고 storage.RollupStore 의 사전 집계만 읽음 → 응답 수 N 과 무관한 시간
+# 접근: secrets.toml 의 [admin] password
+# 재실행 구간 계측(telemetry)의 히스토그램 요약·Prometheus 텍스트, 주문형 샘플링 프로파일러도 여기서 다룸
+# -------------------------------------------------------------
+
+import pandas as pd
+import streamlit as st
+
+import telemetry
+from app_core import get_metrics, get_rollups, secrets_section
+
+st.title("📊 관리자 통계")
+
+admin_pw = secrets_section("admin").get("password")
+if not admin_pw:
+    st.info("관리자 비밀번호가 설정되지 않았습니다. secrets.toml 에 [admin] password 를 추가하세요.")
+    st.stop()
+if st.text_input("관리자 비밀번호", type="password", key="admin_pw") != admin_pw:
+    st.stop()
+
+with st.expander("⏱️ 재실행 구간 계측"):
+    if not get_metrics()["enabled"]:
+        st.info("계측이 꺼져 있습니다. secrets.toml 에 [metrics] enabled = true (또는 SAJU_METRICS=1) 후 재시작하세요.")
+    else:
+        timings = telemetry.summary()
+        st.caption("구간은 겹칩니다: page.* ⊃ years.6-* ⊃ engine.* · 분위수는 히스토그램 버킷 보간 추정")
+        st.dataframe([{"구간": name, **s} for name, s in timings.items()], use_container_width=True, hide_index=True)
+        c1, c2 = st.columns(2)
+        c1.download_button("Prometheus 텍스트", telemetry.render_prometheus(), file_name="metrics.txt",
+                           mime="text/plain")
+        if c2.button("계측 초기화", key="metrics_clear"):
+            telemetry.REGISTRY.clear()
+            st.rerun()
+
+with st.expander("🔥 재실행 프로파일링 (샘플링)"):
+    prof = telemetry.PROFILER
+    st.caption("다음 N번의 재실행 동안 스크립트 스레드 스택을 주기적으로 샘플링합니다. 서버 재시작 없이 바로 적용되고, "
+               "결과는 collapsed stack(flamegraph.pl · speedscope 입력)으로 내려받습니다.")
+    c1, c2, c3 = st.columns(3)
+    n_reruns = c1.number_input("캡처할 재실행 수", min_value=1, max_value=200, value=5, key="prof_reruns")
+    interval_ms = c2.number_input("샘플 주기 (ms)", min_value=1, max_value=100, value=5, key="prof_interval")
+    pages = c3.multiselect("페이지", ["years", "mbti", "admin"], default=["years", "mbti"], key="prof_pages")
+    b1, b2, _ = st.columns([1, 1, 2])
+    if b1.button("캡처 시작", type="primary", key="prof_arm"):
+        prof.arm(int(n_reruns), interval_ms / 1000, pages or None)
+    if b2.button("중지", key="prof_stop"):
+        prof.stop()
+    status = prof.status()
+    state = "대기 중" if status["armed"] or status["running"] else ("완료" if status["started"] else "꺼짐")
+    st.write(f"**{state}** · 캡처한 재실행 {status['reruns']}회 ({status['rerun_s']:.2f}s) · "
+             f"샘플 {status['samples']}개 · 남은 캡처 {status['armed']}회")
+    if status["samples"]:
+        st.dataframe(prof.top_functions(), use_container_width=True, hide_index=True)
+        st.download_button("collapsed stacks 다운로드", prof.collapsed(), file_name="reruns.collapsed.txt",
+                           mime="text/plain", key="prof_download")
+
+snap = get_rollups().snapshot()
+st.metric("누적 제출", snap["total"])
+if not snap["total"]:
+    st.info("아직 집계된 제출이 없습니다.")
+    st.stop()
+
+c1, c2 = st.columns(2)
+with c1:
+    st.subheader("MBTI 분포")
+    st.bar_chart(pd.Series(snap["mbti"], name="제출 수"))
+with c2:
+    st.subheader("월별 제출 건수")
+    st.line_chart(pd.Series(snap["month"], name="제출 수"))
+
+c3, c4 = st.columns(2)
+with c3:
+    st.subheader("이벤트 타입 TOP 10")
+    top = sorted(snap["event_type"].items(), key=lambda kv: -kv[1])[:10]
+    st.bar_chart(pd.Series(dict(top), name="건수"))
+with c4:
+    st.subheader("MBTI × 우세 오행")
+    pairs = [(k.split("|", 1), n) for k, n in snap["mbti_elem"].items()]
+    if pairs:
+        cross = pd.DataFrame([{"MBTI": m, "오행": e, "n": n} for (m, e), n in pairs])
+        st.dataframe(cross.pivot(index="MBTI", columns="오행", values="n").fillna(0).astype(int),
+                     use_container_width=True)
+    else:  # 오행 점수 없이 들어온 제출뿐 – MBTI 분포에는 세지만 교차표에는 없음
+        st.info("오행 점수가 있는 제출이 아직 없습니다.")
+
+st.subheader("평균 오행 점수 (MBTI별)")
+heat = pd.DataFrame(snap["elem_mean"]).T.sort_index()
+top_mean = float(heat.max().max()) if heat.size else 1.0
+st.dataframe(
+    heat.round(2), use_container_width=True,
+    column_config={e: st.column_config.ProgressColumn(e, min_value=0.0, max_value=top_mean, format="%.2f")
+                   for e in heat.columns},
+)
+st.caption("전체: " + " · ".join(f"{e} {s['mean']:.2f}±{s['std']:.2f} (n={s['n']})"
+                                   for e, s in snap["elem_overall"].items()))
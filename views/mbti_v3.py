@@ -4,61 +4,15 @@ MBTI × 사주 앱 v3 - 풍성한 콘텐츠 버전
 """
 import streamlit as st
 from datetime import datetime, date
-import json, time
-import pandas as pd
-import yaml
-from pathlib import Path
+import json, re, time, uuid
+
+from app_core import get_journal, get_submission_queue  # 이벤트 로그·제출 큐는 연도별 흐름과 공유
+from saju_engine import MBTI_LIST, MBTI_ELEMENTS, ELEMENT_KR, MONTH_ELEMENT, EVENT_PRESETS
+from saju_engine.stories import story_for  # 컴파일된 (MBTI, 오행) 스토리 인덱스
 
 # ===== 설정 =====
-MBTI_LIST = ["INTP","INTJ","ENTP","ENTJ","INFJ","INFP","ENFJ","ENFP",
-             "ISTJ","ISFJ","ESTJ","ESFJ","ISTP","ISFP","ESTP","ESFP"]
-
-# 오행 가중치
-MBTI_ELEMENTS = {
-    "INTP": {"wood":3,"fire":1,"earth":2,"metal":5,"water":2},
-    "INTJ": {"wood":2,"fire":1,"earth":2,"metal":4,"water":4},
-    "ENTP": {"wood":5,"fire":2,"earth":1,"metal":3,"water":1},
-    "ENFP": {"wood":5,"fire":4,"earth":1,"metal":1,"water":2},
-    "INFJ": {"wood":2,"fire":3,"earth":1,"metal":2,"water":5},
-    "INFP": {"wood":3,"fire":4,"earth":1,"metal":1,"water":4},
-    "ISTJ": {"wood":1,"fire":1,"earth":5,"metal":4,"water":1},
-    "ISFP": {"wood":3,"fire":3,"earth":2,"metal":1,"water":4},
-    "ESTJ": {"wood":1,"fire":2,"earth":5,"metal":4,"water":1},
-    "ESFJ": {"wood":2,"fire":5,"earth":4,"metal":1,"water":1},
-    "ISTP": {"wood":2,"fire":1,"earth":3,"metal":5,"water":1},
-    "ESTP": {"wood":4,"fire":2,"earth":3,"metal":3,"water":1},
-    "ESFP": {"wood":5,"fire":4,"earth":2,"metal":1,"water":1},
-    "ENFJ": {"wood":3,"fire":4,"earth":2,"metal":1,"water":3}
-}
-
-# 오행 한글 매핑
-ELEMENT_KR = {"wood":"목","fire":"화","earth":"토","metal":"금","water":"수"}
-ELEMENT_COLOR = {"wood":"#2ecc71","fire":"#e74c3c","earth":"#f39c12","metal":"#95a5a6","water":"#3498db"}
-
-# 이벤트 프리셋
-EVENT_PRESETS = {
-    "전직/이직": {"element":"wood", "emotion_avg":0, "duration":"3-6m"},
-    "승진/역할변화": {"element":"fire", "emotion_avg":1, "duration":"1-3m"},
-    "연애시작": {"element":"fire", "emotion_avg":2, "duration":"weeks"},
-    "이별/이혼": {"element":"water", "emotion_avg":-2, "duration":"6-12m"},
-    "이사/해외이주": {"element":"earth", "emotion_avg":0, "duration":"3-6m"},
-    "가족사건": {"element":"earth", "emotion_avg":-1, "duration":"12m+"},
-    "건강이슈": {"element":"metal", "emotion_avg":-1, "duration":"6-12m"},
-    "경제적상승": {"element":"metal", "emotion_avg":1, "duration":"3-6m"},
-    "경제적하락": {"water": "water", "emotion_avg":-1, "duration":"6-12m"},
-    "창작/출시": {"element":"wood", "emotion_avg":1, "duration":"1-3m"}
-}
-
-# 스토리 로드
-@st.cache_data
-def load_stories():
-    story_path = Path("data/element_stories.yaml")
-    if story_path.exists():
-        with open(story_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    return {}
-
-st.set_page_config(page_title="MBTI × 오행 궁합", page_icon="🌏", layout="wide")
+# MBTI_LIST·오행 가중치·한글/색상·사건 프리셋은 saju_engine.tables 의 프로세스 전역 읽기 전용 테이블
+# (재실행·세션마다 dict 를 다시 만들지 않음)
 
 # CSS 커스터마이징
 st.markdown("""
@@ -104,6 +58,10 @@ window.addEventListener('load', function() {
 """, unsafe_allow_html=True)
 
 # ===== 세션 상태 =====
+# 이 흐름이 소유한 키 – 세션은 연도별 흐름(uid·experience_db·posterior_acc 등)과 공유하므로 리셋은 이것만 지움
+V3_STATE_KEYS = ("stage", "mbti", "birth_date", "events", "v3_submission_id", "v3_submitted")
+V3_WIDGET_KEY = re.compile(r"mbti_[A-Z]{4}|year_\d+|event_\d+|v3_submit")  # 아래 위젯들의 key
+
 if 'stage' not in st.session_state:
     st.session_state.stage = 1
 if 'mbti' not in st.session_state:
@@ -113,6 +71,11 @@ if 'birth_date' not in st.session_state:
 if 'events' not in st.session_state:
     st.session_state.events = []
 
+
+def mbti_elements(mbti):
+    """MBTI 오행 가중치 (수정 가능한 복사본). 표에 없는 유형이면 균등 가중치 – 상위 오행 인덱싱이 깨지지 않도록"""
+    return dict(MBTI_ELEMENTS.get(mbti) or dict.fromkeys(ELEMENT_KR, 1))
+
 # ===== 헤더 =====
 st.title("🌏 MBTI × 오행 궁합 분석")
 st.caption("서양 심리학(MBTI) + 동양 명리학(오행)의 만남")
@@ -139,20 +102,20 @@ if st.session_state.stage >= 1:
 
     if st.session_state.mbti:
         st.success(f"✅ 선택: **{st.session_state.mbti}**")
+        if st.session_state.mbti not in MBTI_ELEMENTS:
+            st.warning("이 유형의 오행 가중치가 아직 없어 균등 가중치로 보여 드립니다.")
 
 # ===== 1.5단계: 기본 프로필 =====
 if st.session_state.stage == 1.5 and st.session_state.mbti:
     st.markdown("---")
     st.markdown("## 📊 당신의 기본 에너지 프로필")
 
-    elems = MBTI_ELEMENTS.get(st.session_state.mbti, {})
+    elems = mbti_elements(st.session_state.mbti)
     top2 = sorted(elems.items(), key=lambda x: x[1], reverse=True)[:2]
     top_element = top2[0][0]
 
     # 스토리 로드
-    stories = load_stories()
-    mbti_story = stories.get(st.session_state.mbti, {})
-    element_story = mbti_story.get(top_element, {})
+    element_story = story_for(st.session_state.mbti, top_element)
 
     # 타입 카드
     col1, col2 = st.columns([1, 1])
@@ -172,11 +135,7 @@ if st.session_state.stage == 1.5 and st.session_state.mbti:
 
     with col2:
         # 레이더 차트 (간단한 막대 차트로 대체)
-        df = pd.DataFrame({
-            "오행": [ELEMENT_KR[k] for k in elems.keys()],
-            "점수": list(elems.values())
-        })
-        st.bar_chart(df.set_index("오행"))
+        st.bar_chart({"오행": [ELEMENT_KR[k] for k in elems], "점수": list(elems.values())}, x="오행", y="점수")
 
     # 성격 해석
     if element_story.get('personality'):
@@ -239,21 +198,18 @@ if st.session_state.stage == 2.5 and st.session_state.mbti and st.session_state.
 
     # 월령 계산
     birth_month = st.session_state.birth_date.month
-    season_element_kr = {1:"수",2:"목",3:"목",4:"목",5:"화",6:"화",7:"토",8:"금",9:"금",10:"금",11:"수",12:"수"}
-    season_element = season_element_kr[birth_month]
-    month_elem_en = {"수":"water","목":"wood","화":"fire","토":"earth","금":"metal"}[season_element]
+    month_elem_en = MONTH_ELEMENT[birth_month]
+    season_element = ELEMENT_KR[month_elem_en]
 
     # 월령 가중
-    elems = MBTI_ELEMENTS.get(st.session_state.mbti, {}).copy()
+    elems = mbti_elements(st.session_state.mbti)
     elems[month_elem_en] = elems.get(month_elem_en, 0) + 2
 
     top2 = sorted(elems.items(), key=lambda x: x[1], reverse=True)[:2]
     top_element = top2[0][0]
 
     # 스토리 로드
-    stories = load_stories()
-    mbti_story = stories.get(st.session_state.mbti, {})
-    element_story = mbti_story.get(top_element, {})
+    element_story = story_for(st.session_state.mbti, top_element)
 
     # 타입 카드 (강화)
     col1, col2 = st.columns([1, 1])
@@ -269,11 +225,7 @@ if st.session_state.stage == 2.5 and st.session_state.mbti and st.session_state.
         st.info(f"📅 {birth_month}월생은 **{season_element}(元)**의 기운이 강합니다.")
 
     with col2:
-        df = pd.DataFrame({
-            "오행": [ELEMENT_KR[k] for k in elems.keys()],
-            "점수": list(elems.values())
-        })
-        st.bar_chart(df.set_index("오행"))
+        st.bar_chart({"오행": [ELEMENT_KR[k] for k in elems], "점수": list(elems.values())}, x="오행", y="점수")
 
     # 성격 + 커리어
     col1, col2 = st.columns(2)
@@ -364,28 +316,25 @@ if st.session_state.stage == 4:
         "mbti": st.session_state.mbti,
         "birth_date": str(st.session_state.birth_date) if st.session_state.birth_date else None,
         "events": st.session_state.events,
-        "mbti_elements": MBTI_ELEMENTS.get(st.session_state.mbti, {})
+        "mbti_elements": dict(MBTI_ELEMENTS.get(st.session_state.mbti, {}))
     }
 
     # 사주 가중
     if st.session_state.birth_date:
         birth_month = st.session_state.birth_date.month
-        season_element_kr = {1:"수",2:"목",3:"목",4:"목",5:"화",6:"화",7:"토",8:"금",9:"금",10:"금",11:"수",12:"수"}
-        season_element = season_element_kr[birth_month]
-        month_elem_en = {"수":"water","목":"wood","화":"fire","토":"earth","금":"metal"}[season_element]
+        month_elem_en = MONTH_ELEMENT[birth_month]
+        season_element = ELEMENT_KR[month_elem_en]
 
-        elems = MBTI_ELEMENTS.get(st.session_state.mbti, {}).copy()
+        elems = mbti_elements(st.session_state.mbti)
         elems[month_elem_en] = elems.get(month_elem_en, 0) + 2
         row["saju_elements"] = elems
     else:
-        elems = MBTI_ELEMENTS.get(st.session_state.mbti, {})
+        elems = mbti_elements(st.session_state.mbti)
 
     top_element = max(elems, key=elems.get)
 
     # 스토리
-    stories = load_stories()
-    mbti_story = stories.get(st.session_state.mbti, {})
-    element_story = mbti_story.get(top_element, {})
+    element_story = story_for(st.session_state.mbti, top_element)
 
     # 헤더 카드
     st.markdown(f"""
@@ -414,11 +363,7 @@ if st.session_state.stage == 4:
     col1, col2 = st.columns(2)
     with col1:
         st.markdown("### 📊 에너지 분포")
-        df = pd.DataFrame({
-            "오행": [ELEMENT_KR[k] for k in elems.keys()],
-            "점수": list(elems.values())
-        })
-        st.bar_chart(df.set_index("오행"))
+        st.bar_chart({"오행": [ELEMENT_KR[k] for k in elems], "점수": list(elems.values())}, x="오행", y="점수")
 
     with col2:
         st.markdown("### 🎭 종합 해석")
@@ -475,10 +420,20 @@ if st.session_state.stage == 4:
     # 제출
     consent = st.checkbox("익명 통계 연구 목적 수집에 동의합니다", value=True)
 
-    if st.button("📤 최종 제출", type="primary", disabled=not consent, use_container_width=True):
-        # TODO: 실제 저장 로직
-        st.success("✅ 제출 완료! 감사합니다.")
+    submitted = st.session_state.get("v3_submitted", False)
+    if st.button("📤 최종 제출", type="primary", disabled=not consent or submitted, use_container_width=True,
+                 key="v3_submit") and not submitted:
+        # 이벤트 로그에 fsync 확인 후 스풀에 기록 – 네트워크 쓰기는 백그라운드 배치.
+        # id 는 세션에 한 번만 만들어, 기록 도중 끊겨 다시 눌러도 로그·백엔드가 같은 id 로 중복 제거
+        if "v3_submission_id" not in st.session_state:
+            st.session_state.v3_submission_id = uuid.uuid4().hex
+        row["id"] = st.session_state.v3_submission_id
+        get_journal().append({"type": "submission", "user": row["id"], "row": row}, wait=True)
+        get_submission_queue().submit(row)
+        st.session_state.v3_submitted = submitted = True
         st.balloons()
+    if submitted:
+        st.success("✅ 제출 완료! 감사합니다. (다시 제출하려면 '처음부터 다시')")
 
     # 디버그
     with st.expander("🔍 수집 데이터 (디버그용)"):
@@ -488,5 +443,6 @@ if st.session_state.stage == 4:
 with st.sidebar:
     if st.button("🔄 처음부터 다시", use_container_width=True):
         for key in list(st.session_state.keys()):
-            del st.session_state[key]
+            if key in V3_STATE_KEYS or V3_WIDGET_KEY.fullmatch(key):
+                del st.session_state[key]
         st.rerun()  # 리셋만 rerun 유지
@@ -0,0 +1,372 @@
+# views/years.py
+# -------------------------------------------------------------
+# 사주(간지·오행 단순화) → 가능한 MBTI 후보 스코어링 →
+# 연도별 경험 수집("이 해에 이런 일이 있었을 것 같다 – 맞/틀?")
+# -------------------------------------------------------------
+# ⚠️ 간단화/교육용 모델입니다. 실제 명리 계산(년/월/일/시 기둥, 대운/세운, 음력 전환 등)
+# 은 생략/근사했으며, 라이브러리 교체 지점(saju_engine)을 모듈화해 두었습니다.
+# 사용자는 나중에 정확한 사주 엔진으로 교체할 수 있습니다.
+# -------------------------------------------------------------
+
+import streamlit as st
+import uuid
+from dataclasses import dataclass
+
+from app_core import get_journal, warm_engine
+from saju_engine import (
+    ELEM_LIST, saju_year_summary, elem_weights_for_year,
+    infer_mbti_from_elements, year_hypotheses_range, PosteriorAccumulator,
+)
+from storage import iter_csv, iter_ndjson
+from telemetry import timed
+
+warm_engine()
+
+# 0)~3) 기본 테이블·근사 사주 엔진·MBTI 스코어·연도별 가설은 saju_engine 패키지로 분리
+
+# =========================
+# 4) 세션 상태 & 데이터 모델
+# =========================
+@dataclass
+class ProfileInput:
+    name: str
+    birth_year: int
+    birth_month: int
+    birth_day: int
+    mbti_known: str  # 사용자가 알고 있는 MBTI(Optional)
+
+
+if "uid" not in st.session_state:
+    # 재방문 식별자: URL 의 ?uid= (없으면 새로 발급해 URL 에 기록)
+    returning = st.query_params.get("uid")
+    st.session_state.uid = returning or uuid.uuid4().hex
+    st.query_params["uid"] = st.session_state.uid
+    # year → {category: yes/no/skip, notes} — 재방문이면 이벤트 로그 재생으로 이전 응답 복원
+    st.session_state.experience_db = get_journal().replay(returning)["experience_db"] if returning else {}
+    # 서버 저장 동의: 저장된 응답이 복원됐다면 이전 방문에서 동의한 것
+    st.session_state.journal_consent = bool(st.session_state.experience_db)
+if "posterior_acc" not in st.session_state:
+    st.session_state.posterior_acc = PosteriorAccumulator.from_db(st.session_state.experience_db)
+if "answered_years" not in st.session_state:
+    st.session_state.answered_years = set()  # 라디오 변경/구간 제출로 응답이 확정된 연도
+if "rerun_count" not in st.session_state:
+    st.session_state.rerun_count = 0
+    st.session_state.profile_rerun_base = 0
+st.session_state.rerun_count += 1
+if "elem_tweak" not in st.session_state:
+    st.session_state.elem_tweak = {e: 0.0 for e in ELEM_LIST}
+if "profile" not in st.session_state:
+    st.session_state.profile = None
+
+
+# =========================
+# 5) 사이드바 입력
+# =========================
+with st.sidebar:
+    st.header("입력")
+    colA, colB = st.columns([1,1])
+    with colA:
+        name = st.text_input("이름(선택)", value="")
+    with colB:
+        known_mbti = st.text_input("현재 MBTI(선택)", value="").upper().strip()
+
+    by = st.number_input("출생 연도", min_value=1900, max_value=2100, value=1989, step=1)
+    bm = st.number_input("출생 월", min_value=1, max_value=12, value=7, step=1)
+    bd = st.number_input("출생 일", min_value=1, max_value=31, value=17, step=1)
+
+    st.markdown("---")
+    st.caption("오행 가중치 미세조정 (사주 엔진 교체 전 임시 튜닝) – 값은 ±2 범위 권장")
+    cols = st.columns(5)
+    tweak = {}
+    for i, e in enumerate(ELEM_LIST):
+        with cols[i]:
+            tweak[e] = st.slider(e, -2.0, 2.0, st.session_state.elem_tweak.get(e, 0.0), 0.1)
+    st.session_state.elem_tweak = tweak
+
+    st.markdown("---")
+    start_year = st.number_input("경험 수집 시작 연도", min_value=by, max_value=2100, value=max(by+10, 2000))
+    end_year = st.number_input("경험 수집 종료 연도", min_value=start_year, max_value=2100, value=max(start_year, 2025))
+
+    if st.button("프로필 업데이트/적용"):
+        st.session_state.profile = ProfileInput(name=name, birth_year=int(by), birth_month=int(bm), birth_day=int(bd), mbti_known=known_mbti)
+        st.session_state.profile_rerun_base = st.session_state.rerun_count
+        st.toast("프로필을 적용했습니다.")
+
+
+# =========================
+# 6) 본문 레이아웃
+# =========================
+st.title("🧭 사주 → 가능한 MBTI → 🗂️ 연도별 경험 수집")
+
+if st.session_state.profile is None:
+    st.info("좌측 사이드바에서 출생정보를 입력하고 '프로필 업데이트/적용'을 눌러주세요.")
+    st.stop()
+
+P: ProfileInput = st.session_state.profile
+
+# --- 6-1) 사주(연) 요약 & 오행 비중 근사
+with timed("years.6-1"):
+    with timed("engine.elem_weights_for_year"):
+        yr = saju_year_summary(P.birth_year)
+        # 연간·연지에 동일 비중(0.5, 0.5) 부여 + 사용자의 튜닝 → 음수 방지 + 정규화
+        weights = elem_weights_for_year(yr, st.session_state.elem_tweak)
+
+    dominant_elem = max(weights, key=lambda k: weights[k])
+
+    col1, col2 = st.columns([1.2, 1])
+    with col1:
+        st.subheader("사주(연) 요약 – 간지/오행 근사")
+        st.write(
+            f"**{P.birth_year}년생** → 연간 **{yr.stem}({yr.yin_yang})** · 연지 **{yr.branch}**,\n"
+            f"오행: 간(**{yr.stem_elem}**) + 지(**{yr.branch_elem}**)\n"
+            f"→ 근사 가중치: {', '.join([f'{k}:{weights[k]:.2f}' for k in ELEM_LIST])}"
+        )
+
+        st.caption("※ 실제 사주는 월/일/시 기둥, 절입/입춘, 대운/세운 등을 반영해야 하며 본 앱은 연구용 근사입니다.")
+
+    with col2:
+        st.subheader("오행 비중")
+        # DataFrame 없이 열 dict 로 – pandas 는 첫 차트를 그릴 때 Streamlit 이 필요하면 불러옴
+        st.bar_chart({"오행": ELEM_LIST, "비중": [weights[e] for e in ELEM_LIST]}, x="오행", y="비중")
+
+# --- 6-2) MBTI 후보 추론
+with timed("years.6-2"):
+    st.subheader("가능한 MBTI 후보")
+    with timed("engine.infer_mbti_from_elements"):
+        mbti_cands = infer_mbti_from_elements(weights, yr.yin_yang)
+    # 응답 이벤트에 함께 기록할 분석 차원 (콜백은 다음 재실행 전에 돌므로 직전 값 사용)
+    st.session_state.answer_ctx = {"birth_year": P.birth_year, "elem": dominant_elem,
+                                   "mbti": mbti_cands[0].code if mbti_cands else None}
+
+    # 6-2.5) 사건 기반 사후 갱신 (사주 기반 사전 → 연도 응답 기반 사후)
+    # 응답 변경분은 라디오 on_change 콜백에서 누적기에 O(1)로 반영됨 (스크립트 재실행 전에 처리)
+    with timed("engine.posterior"):
+        posterior = st.session_state.posterior_acc.compute(mbti_cands)
+
+    # 안내 문구
+    lead = f"당신의 사주로 본 1차 MBTI 추정은 **{mbti_cands[0].code}** 입니다." if mbti_cands else "사주 기반 1차 추정 불가"
+    lead += " 사건 응답을 반영해 후보 범위를 좁혔습니다."
+    st.success(lead)
+
+    p_cols = st.columns(5)
+    for i, (code, prob) in enumerate(posterior.top_codes):
+        if i < len(p_cols):
+            with p_cols[i]:
+                st.metric(label=f"사후 후보 #{i+1}", value=code, delta=f"{prob*100:.1f}%")
+
+    c_cols = st.columns(min(4, len(mbti_cands)))
+    for i, c in enumerate(mbti_cands[:4]):
+        with c_cols[i]:
+            st.metric(label=f"사전 #{i+1}", value=c.code, delta=f"score {c.score}")
+
+    with st.expander("추론 근거(스코어 축)"):
+        if mbti_cands:
+            st.json(mbti_cands[0].notes)
+        if P.mbti_known:
+            st.info(f"사용자 입력 MBTI: **{P.mbti_known}** (비교용)")
+
+# --- 6-3) 연도별 경험 수집
+with timed("years.6-3"):
+    st.subheader("연도별 경험 수집 – \"이 해에 이런 일이 있었을 것 같다\"")
+
+    help_txt = (
+        "각 연도별로 제시되는 2~3개 테마에 대해 **맞다/틀리다/건너뛰기**를 선택하고, 필요하면 메모를 남겨주세요.\n"
+        "선택 내용은 아래 표에 누적되며, CSV/JSON으로 내보낼 수 있습니다."
+    )
+    st.caption(help_txt)
+
+    def _journal_answer(y: int, cat: str, cell: dict):
+        get_journal().append({"type": "answer", "user": st.session_state.uid, "year": y, "cat": cat, **cell,
+                              **st.session_state.get("answer_ctx", {})})
+
+    def _on_consent():
+        # 동의하면 이번 세션에서 이미 고른 응답까지 기록 (재방문 시 복원되도록)
+        st.session_state.journal_consent = st.session_state.journal_consent_box
+        if st.session_state.journal_consent:
+            for y, cats in st.session_state.experience_db.items():
+                for cat, cell in cats.items():
+                    _journal_answer(y, cat, cell)
+
+    st.checkbox(
+        "응답·메모를 서버에 저장하는 데 동의합니다", value=st.session_state.journal_consent,
+        key="journal_consent_box", on_change=_on_consent,
+        help="동의하면 연도별 응답과 메모가 이 주소의 uid 로 서버 이벤트 로그(var/journal)에 기록되어 "
+             "같은 주소로 다시 방문하면 복원되고, 출생연도·우세오행·MBTI 후보와 함께 분석용 통계(var/analytics)에 "
+             "집계됩니다. 동의하지 않으면 응답은 이 브라우저 세션에만 남습니다.",
+    )
+    if not st.session_state.journal_consent:
+        st.caption("동의 전 응답은 서버에 기록되지 않으며, 창을 닫으면 사라집니다.")
+
+    name_seed = P.name or "anon"
+
+    # 연도 구간(기본 10년) 단위로만 위젯 생성 – 화면 밖 연도의 응답은 experience_db 에만 유지되고,
+    # 그 구간으로 돌아오면 저장된 응답으로 라디오/메모를 다시 채움
+    YEARS_PER_PAGE = 10
+    n_pages = (int(end_year) - int(start_year)) // YEARS_PER_PAGE + 1
+    if st.session_state.get("year_page", 0) >= n_pages:
+        st.session_state.year_page = 0
+
+    def _page_label(i: int) -> str:
+        a = int(start_year) + i * YEARS_PER_PAGE
+        return f"{a}–{min(a + YEARS_PER_PAGE - 1, int(end_year))}"
+
+    page = 0
+    if n_pages > 1:
+        page = st.radio("연도 구간", list(range(n_pages)), format_func=_page_label, horizontal=True, key="year_page")
+    page_start = int(start_year) + page * YEARS_PER_PAGE
+    page_end = min(page_start + YEARS_PER_PAGE - 1, int(end_year))
+    answered = sum(1 for cats in st.session_state.experience_db.values() for v in cats.values() if v.get("ans") != "모름/패스")
+    st.caption(f"{page_start}–{page_end}년 표시 중 · 전체 {int(start_year)}–{int(end_year)}년 중 응답(맞다/틀리다) {answered}건")
+
+    years = list(range(page_start, page_end + 1))
+    # 연도별 가설은 보이는 구간만 한 번에 (프로세스 전역 캐시)
+    with timed("engine.year_hypotheses_range"):
+        hyps_by_year = year_hypotheses_range(P.birth_year, dominant_elem, page_start, page_end)
+
+    def _record_answer(y: int, cat: str, ans: str, memo: str):
+        # (연도, 테마) 응답 한 건을 DB·사후 누적기에 반영 — 실제로 바뀐 경우에만 이벤트 로그에 추가
+        # (처음 보는 칸이 기본값 그대로면 응답이 아님 → 기록하지 않음)
+        cell = {"ans": ans, "memo": memo}
+        year_db = st.session_state.experience_db.get(y, {})
+        prev = year_db.get(cat)
+        if prev == cell or (prev is None and cell == {"ans": "모름/패스", "memo": ""}):
+            return
+        st.session_state.experience_db[y] = year_db
+        year_db[cat] = cell
+        st.session_state.posterior_acc.set_answer(y, cat, ans)
+        if st.session_state.journal_consent:
+            _journal_answer(y, cat, cell)
+
+    def _on_answer(y: int, cat: str, key: str):
+        # 라디오·메모 변경 시: 해당 (연도, 테마) 응답 한 건만 반영
+        _record_answer(y, cat, st.session_state[key], st.session_state.get(f"{key}-memo", ""))
+        st.session_state.answered_years.add(y)
+
+    def _on_submit_page(cells: list):
+        # 구간 폼 제출 시: 보이는 연도의 응답·메모를 한꺼번에 반영 → 재실행 1회, 사후 재계산 1회
+        for y, cat, key in cells:
+            _record_answer(y, cat, st.session_state[key], st.session_state[f"{key}-memo"])
+            st.session_state.answered_years.add(y)
+
+    # 일괄 제출 모드: 구간 전체를 st.form 으로 묶어 클라이언트에서 모았다가 한 번에 제출
+    # (라디오 클릭·메모 입력마다 전체 스크립트가 재실행되지 않음)
+    batch_mode = st.toggle("구간 단위 일괄 제출", value=True, key="batch_mode",
+                           help="켜면 이 구간의 응답을 모두 고른 뒤 '이 구간 제출'을 한 번 눌러 저장합니다.")
+    grid = st.form(key=f"year_form_{page_start}", border=False) if batch_mode else st.container()
+    page_cells = []
+
+    with grid:
+        for y in years:
+            with st.container(border=True):
+                st.markdown(f"### 📅 {y}년")
+                hyps = hyps_by_year[y]
+                # 상태 로드
+                year_state = st.session_state.experience_db.get(y, {})
+
+                for cat, desc in hyps:
+                    key = f"{y}-{cat}"
+                    page_cells.append((y, cat, key))
+                    prev = year_state.get(cat, {}).get("ans", "미선택")
+                    cols = st.columns([1, 2, 2])
+                    # 폼 안의 위젯은 on_change 를 가질 수 없음 → 일괄 모드에선 제출 버튼 콜백이 반영
+                    # (렌더링 자체는 아무것도 기록하지 않음 – 응답은 사용자가 바꾼 칸만)
+                    on_change, args = (None, None) if batch_mode else (_on_answer, (y, cat, key))
+                    with cols[0]:
+                        st.radio(f"{cat}", ["맞다","틀리다","모름/패스"], index={"맞다":0,"틀리다":1,"모름/패스":2}.get(prev,2), key=key,
+                                 on_change=on_change, args=args)
+                    with cols[1]:
+                        st.write(f"_{desc}_")
+                    with cols[2]:
+                        st.text_input("메모(선택)", value=year_state.get(cat, {}).get("memo", ""), key=f"{key}-memo",
+                                      on_change=on_change, args=args)
+
+        if batch_mode:
+            st.form_submit_button("✅ 이 구간 제출", type="primary", on_click=_on_submit_page, args=(page_cells,))
+
+    # 재실행 지표: 프로필 적용 이후 재실행 수 ÷ 응답 확정 연도 (전 구간 확정 시 = 완료 프로필당 재실행 수)
+    n_years_total = int(end_year) - int(start_year) + 1
+    years_done = sum(1 for y in st.session_state.answered_years if int(start_year) <= y <= int(end_year))
+    reruns = st.session_state.rerun_count - st.session_state.profile_rerun_base
+    m1, m2, m3 = st.columns(3)
+    m1.metric("프로필 적용 이후 재실행", reruns)
+    m2.metric("응답 확정 연도", f"{years_done}/{n_years_total}")
+    if years_done >= n_years_total:
+        m3.metric("완료 프로필당 재실행", reruns)
+    else:
+        m3.metric("확정 연도당 재실행", f"{reruns / years_done:.1f}" if years_done else "–")
+
+# --- 6-4) 데이터 요약/다운로드
+with timed("years.6-4"):
+    st.markdown("---")
+    st.subheader("응답 요약 & 내보내기")
+
+    # 테이블 구성
+    rows = []
+    for y, cats in sorted(st.session_state.experience_db.items()):
+        for cat, v in cats.items():
+            rows.append({
+                "이름": P.name,
+                "출생연도": P.birth_year,
+                "연도": y,
+                "테마": cat,
+                "응답": v.get("ans"),
+                "메모": v.get("memo", ""),
+                "우세오행": dominant_elem,
+                "MBTI_사전": mbti_cands[0].code if mbti_cands else "",
+                "MBTI_사후1": posterior.top_codes[0][0] if posterior.top_codes else "",
+                "사후1_확률(%)": round((posterior.top_codes[0][1]*100) if posterior.top_codes else 0.0, 1)
+            })
+
+    if rows:
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+
+        # 내보내기 파일은 요청했을 때만 만든다 (재실행마다 CSV/JSON 을 직렬화하지 않음).
+        # 만든 파일은 세션에 두어 다운로드 버튼이 다음 재실행에도 남고, 표가 바뀌면 버림
+        export = st.session_state.get("export_files")
+        if export is not None and export["rows"] != rows:
+            export = st.session_state.export_files = None
+        if st.button("내보내기 파일 만들기" if export is None else "내보내기 파일 다시 만들기", key="export_prepare"):
+            export = st.session_state.export_files = {
+                "rows": rows, "csv": b"".join(iter_csv(rows)), "ndjson": b"".join(iter_ndjson(rows)),
+            }
+        if export is not None:
+            c1, c2 = st.columns(2)
+            with c1:
+                st.download_button(
+                    "CSV 다운로드",
+                    data=export["csv"],
+                    file_name=f"experience_{P.name or 'anon'}.csv",
+                    mime="text/csv",
+                )
+            with c2:
+                st.download_button(
+                    "NDJSON 다운로드",
+                    data=export["ndjson"],
+                    file_name=f"experience_{P.name or 'anon'}.ndjson",
+                    mime="application/x-ndjson",
+                )
+    else:
+        st.info("아직 응답 데이터가 없습니다. 위에서 연도별로 선택을 진행해 주세요.")
+
+# --- 6-5) 모델 교체 가이드
+with st.expander("사주 엔진 교체 가이드 (전문가용)"):
+    st.markdown(
+        """
+        **정확도 향상을 위해** 다음 중 하나로 `saju_engine`을 교체하세요.
+
+        1) **음력 변환 + 4기둥 계산**: `korean_lunar_calendar`, `lunardate` 등으로 절입 반영.
+        2) **대운/세운 적용**: 월지 기준 대운 산출 후 연운과 충합·생극으로 테마 가중치 계산.
+        3) **오행 정밀 가중**: 일간(日干) 중심으로 용희기신 판단 → E/I, N/S, T/F, J/P 규칙식 개선.
+
+        교체 포인트:
+        - `ganzhi_of_year(year)`
+        - `saju_year_summary(year)` 결과를 (년/월/일/시)로 확장
+        - `weights` 계산부를 정교화하여 `infer_mbti_from_elements()`에 전달
+        """
+    )
+
+st.caption(
+    "© 연구·실험용 샘플. 서버 저장에 동의한 경우 응답·메모는 주소의 uid 로 서버 이벤트 로그(var/journal)에 "
+    "저장되어 재방문 시 복원되고, 출생연도·우세오행·MBTI 후보와 함께 분석용 통계(var/analytics)에 집계됩니다. "
+    "이름·생년월일 입력값 자체는 저장하지 않습니다."
+)